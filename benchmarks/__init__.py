@@ -0,0 +1 @@
+"""Benchmarks for obsi-dash, run from the repository root with `python -m benchmarks.<name>`"""
@@ -0,0 +1,45 @@
+"""Compare the JSON backends available to playlist_maker.jsonio.
+
+Usage:
+    python -m benchmarks.bench_jsonio [ITEMS]
+"""
+
+import argparse
+import time
+
+from playlist_maker import jsonio
+from benchmarks.vault import make_tasks, make_videos
+
+
+def best_of(func, arg, repeat=5):
+    """Return the fastest of `repeat` runs, in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "items", nargs="?", type=int, default=20000,
+        help="items per generated export (default: %(default)s)",
+    )
+    count = parser.parse_args(argv).items
+
+    exports = {"videos": make_videos(count), "tasks": make_tasks(count)}
+    print(f"{count} items per export, default backend: {jsonio.BACKEND}\n")
+    print(f"{'export':<8} {'backend':<8} {'size KiB':>9} {'loads ms':>9} {'dumps ms':>9}")
+
+    for export_name, export in exports.items():
+        payload = jsonio.BACKENDS["json"][1](export)
+        for name, (loads, dumps_bytes) in sorted(jsonio.BACKENDS.items()):
+            load_ms = best_of(loads, payload)
+            dump_ms = best_of(dumps_bytes, export)
+            print(f"{export_name:<8} {name:<8} {len(payload) // 1024:>9} {load_ms:>9.1f} {dump_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
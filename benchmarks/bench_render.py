@@ -0,0 +1,93 @@
+"""Measure how collection rendering scales with the number of rows.
+
+Rendering time per row should stay flat as collections grow. The
+placeholder section compares the chained str.replace() passes the home
+page used to make with the single-pass substitution it uses now.
+
+Usage:
+    python -m benchmarks.bench_render [MAX_ROWS]
+"""
+
+import argparse
+import time
+
+from playlist_maker.data import validate_and_sanitize
+from playlist_maker.templates.data_row import (
+    render_calendar_collection,
+    render_task_collection,
+)
+from playlist_maker.utils.templates import substitute_placeholders
+from benchmarks.vault import make_events, make_tasks
+
+# The eleven widget placeholders of the legacy home page
+PLACEHOLDERS = [
+    "{INITIATIVES_FOCUS}", "{INITIATIVES_ACTIVE}", "{INITIATIVES_PLANNED}",
+    "{DASHBOARD_TODO_FOCUS}", "{DASHBOARD_TODO_ACTIVE}", "{DASHBOARD_MIND_FOCUS}",
+    "{DASHBOARD_MIND_ACTIVE}", "{PROGRESS_FOCUS_PROGRESS}", "{PROGRESS_FOCUS_ASYNC}",
+    "{PROGRESS_ACTIVE_PROGRESS}", "{PROGRESS_ACTIVE_ASYNC}",
+]
+
+
+def best_of(func, repeat=3):
+    """Return the fastest of `repeat` runs, in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def chained_replace(document, values):
+    """The former approach: one pass over the document per placeholder"""
+    for placeholder, content in values.items():
+        document = document.replace(placeholder, content)
+    return document
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "max_rows", nargs="?", type=int, default=64000,
+        help="largest collection, grown from 1000 rows by 4x steps (default: %(default)s)",
+    )
+    max_rows = parser.parse_args(argv).max_rows
+
+    sizes = []
+    rows = 1000
+    while rows <= max_rows:
+        sizes.append(rows)
+        rows *= 4
+
+    values = {placeholder: '<span class="empty">No data</span>' for placeholder in PLACEHOLDERS}
+
+    print(f"{'rows':>8} {'case':<20} {'ms':>9} {'us/row':>8} {'KiB':>8}")
+    for count in sizes:
+        events = validate_and_sanitize(make_events(count), "calendar")[0]
+        tasks = validate_and_sanitize(make_tasks(count), "task")[0]
+        calendar = {"title": "Calendar", "stem": "calendar", "data": events}
+        task_list = {"title": "Tasks", "stem": "tasks", "data": tasks}
+
+        calendar_html = render_calendar_collection(calendar)
+        # Placeholders spread through a page the size of the calendar
+        chunk = len(calendar_html) // len(PLACEHOLDERS)
+        document = "".join(
+            calendar_html[i * chunk:(i + 1) * chunk] + placeholder
+            for i, placeholder in enumerate(PLACEHOLDERS)
+        )
+        assert chained_replace(document, values) == substitute_placeholders(document, values)
+
+        cases = [
+            ("calendar table", lambda: render_calendar_collection(calendar), len(calendar_html)),
+            ("task rows (JSON)", lambda: render_task_collection(task_list), None),
+            ("chained replace", lambda: chained_replace(document, values), len(document)),
+            ("single-pass subst.", lambda: substitute_placeholders(document, values), len(document)),
+        ]
+        for name, func, size in cases:
+            elapsed = best_of(func)
+            size_kib = size if size is not None else len(func())
+            print(f"{count:>8} {name:<20} {elapsed:>9.1f} {elapsed * 1000 / count:>8.2f} {size_kib // 1024:>8}")
+
+
+if __name__ == "__main__":
+    main()
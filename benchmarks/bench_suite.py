@@ -0,0 +1,182 @@
+"""Time every build stage on synthetic vaults of growing size.
+
+For each size, exports shaped like real Dataview exports are generated
+(see vault.py) and the suite times content type detection, sanitizing
+and rendering per content type, video page generation and a full
+`obsi-dash --full` run on a vault written to a temporary HOME. Results
+are saved as JSON; pass an earlier results file with --compare to see
+the change per benchmark.
+
+Usage:
+    python -m benchmarks.bench_suite [--sizes 1000,10000,100000] [--output FILE]
+                                     [--compare OLD_FILE] [--repeat N] [--jobs N]
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+from pathlib import Path
+
+from playlist_maker import __version__, jsonio
+from playlist_maker import main as obsi_dash
+from playlist_maker.assets import build_assets
+from playlist_maker.data import (
+    detect_content_type,
+    sanitize_calendar_data,
+    sanitize_notes_data,
+    sanitize_project_data,
+    sanitize_task_data,
+    sanitize_video_data,
+)
+from playlist_maker.templates.data_row import COLLECTION_RENDERERS
+from benchmarks.vault import (
+    make_events,
+    make_notes,
+    make_projects,
+    make_tasks,
+    make_videos,
+    write_vault,
+)
+
+# content type -> (export generator, sanitizer)
+CONTENT_TYPES = {
+    "video": (make_videos, sanitize_video_data),
+    "task": (make_tasks, sanitize_task_data),
+    "calendar": (make_events, sanitize_calendar_data),
+    "project": (make_projects, sanitize_project_data),
+    "notes": (make_notes, sanitize_notes_data),
+}
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def best_of(func, repeat):
+    """Return the fastest of `repeat` runs, in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def run_main(home, jobs):
+    """Run a full obsi-dash build with HOME pointing at a synthetic vault"""
+    previous = os.environ.get("HOME")
+    os.environ["HOME"] = str(home)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            obsi_dash.main(["--full", "--jobs", str(jobs)])
+    finally:
+        if previous is None:
+            del os.environ["HOME"]
+        else:
+            os.environ["HOME"] = previous
+
+
+def bench_size(count, repeat, jobs, assets):
+    """
+    Time every benchmark on exports of `count` items.
+
+    Returns:
+        list: (benchmark name, milliseconds) tuples
+    """
+    results = []
+    for content_type, (make, sanitize) in CONTENT_TYPES.items():
+        export = make(count)
+        results.append((f"detect_{content_type}", best_of(lambda: detect_content_type(export), repeat)))
+        results.append((f"sanitize_{content_type}", best_of(lambda: sanitize(export), repeat)))
+
+        items = sanitize(export)
+        if content_type == "video":
+            results.append((
+                "generate_html",
+                best_of(lambda: obsi_dash.generate_html(items, "Videos", assets), repeat),
+            ))
+        else:
+            collection = {
+                "stem": content_type,
+                "title": content_type.capitalize(),
+                "type": content_type,
+                "count": len(items),
+                "data": items,
+            }
+            renderer = COLLECTION_RENDERERS[content_type]
+            results.append((
+                f"render_{content_type}_collection",
+                best_of(lambda: renderer(collection), repeat),
+            ))
+
+    with tempfile.TemporaryDirectory() as home:
+        home = Path(home)
+        (home / "share" / "_scripts").mkdir(parents=True)
+        write_vault(home / "share" / "_tmp", count)
+        results.append(("main", best_of(lambda: run_main(home, jobs), 1)))
+
+    return results
+
+
+def load_previous(path):
+    """Return {(name, items): best_ms} of an earlier results file"""
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return {(entry["name"], entry["items"]): entry["best_ms"] for entry in report["results"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated item counts (default: %(default)s)",
+    )
+    parser.add_argument("--output", default="bench_suite.json", help="results file (default: %(default)s)")
+    parser.add_argument("--compare", metavar="OLD_FILE", help="results file to compare against")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, fastest kept")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes of the end-to-end run")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    previous = load_previous(args.compare) if args.compare else {}
+
+    print(f"obsi-dash {__version__}, Python {platform.python_version()}, JSON backend: {jsonio.BACKEND}\n")
+    print(f"{'items':>8} {'benchmark':<28} {'ms':>10} {'us/item':>9} {'vs old':>8}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        assets = build_assets(Path(output_dir))
+        for count in sizes:
+            for name, elapsed in bench_size(count, args.repeat, args.jobs, assets):
+                results.append({
+                    "name": name,
+                    "items": count,
+                    "best_ms": elapsed,
+                    "us_per_item": elapsed * 1000 / count,
+                })
+                old = previous.get((name, count))
+                change = f"{elapsed / old:>7.2f}x" if old else f"{'':>8}"
+                print(f"{count:>8} {name:<28} {elapsed:>10.1f} {elapsed * 1000 / count:>9.2f} {change}")
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_backend": jsonio.BACKEND,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "repeat": args.repeat,
+        "jobs": args.jobs,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Synthetic Dataview exports for benchmarks"""
+
+import json
+import random
+
+
+def make_videos(count, seed=0):
+    """Return a video export with `count` items"""
+    rng = random.Random(seed)
+    return [
+        {
+            "type": "Note",
+            "status": "youtube",
+            "id": f"video-{i}",
+            "summary": f"Video {i} about {rng.choice(['python', 'rust', 'music', 'cooking'])}",
+            "duration": rng.randint(60, 7200),
+            "channel": f"Channel {i % 50}",
+            "date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "locator": f"loc{i:08d}",
+            "thumbnail": f"https://img.example/{i}.jpg",
+            "watched": rng.random() < 0.3,
+            "tags": rng.sample(["inbox", "starred", "tech", "walk", "bed"], 2),
+            "file": f"videos/{i % 200}.md",
+            "line": i,
+        }
+        for i in range(count)
+    ]
+
+
+def make_tasks(count, seed=0):
+    """Return a task export with `count` items carrying inline fields"""
+    rng = random.Random(seed)
+    statuses = [" ", "x", "/", "w", "?", "t", "<", ">", "!"]
+    return [
+        {
+            "type": "task",
+            "file": f"projects/project-{i % 100}.md",
+            "summary": (
+                f"Task {i} [active:: {rng.choice(['true', 'false'])}]"
+                f" [focus:: {rng.choice(['yes', 'no'])}] [date:: 2024-05-{i % 28 + 1:02d}]"
+            ),
+            "status": rng.choice(statuses),
+            "line": i,
+        }
+        for i in range(count)
+    ]
+
+
+def make_events(count, seed=0):
+    """Return a calendar export with `count` scheduled items"""
+    rng = random.Random(seed)
+    return [
+        {
+            "type": "calendar",
+            "file": f"calendar/event-{i}.md",
+            "scheduled": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "summary": f"Meeting {i} [location:: {rng.choice(['Office', 'Home', 'Cafe'])}]",
+            "status": rng.choice(["scheduled", "x", "?"]),
+            "line": i,
+        }
+        for i in range(count)
+    ]
+
+
+def make_projects(count, seed=0):
+    """Return a project export with `count` items"""
+    rng = random.Random(seed)
+    return [
+        {
+            "type": "project",
+            "file": f"projects/project-{i}.md",
+            "summary": f"Project {i}",
+            "workspace": f"workspace-{i % 5}",
+            "class": rng.choice(["work", "study", "home"]),
+            "status": rng.choice(["current", "focus", "paused"]),
+            "progress": rng.randint(0, 100),
+            "due_date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "active": rng.random() < 0.8,
+            "focus": rng.random() < 0.2,
+            "line": 1,
+        }
+        for i in range(count)
+    ]
+
+
+def make_notes(count, seed=0):
+    """Return a notes export with `count` items carrying inline fields"""
+    rng = random.Random(seed)
+    return [
+        {
+            "type": "note",
+            "file": f"notes/note-{i}.md",
+            "summary": (
+                f"Note {i} [description:: about {rng.choice(['python', 'music', 'books'])}]"
+                f" [active:: {rng.choice(['true', 'false'])}] [focus:: {rng.choice(['yes', 'no'])}]"
+            ),
+            "status": rng.choice(["active", "w", "?", "*"]),
+            "line": i,
+        }
+        for i in range(count)
+    ]
+
+
+def make_widget_sources(count, seed=0):
+    """
+    Return the exports read by the dashboard widgets.
+
+    Args:
+        count: Number of items in each export
+        seed: Random seed
+
+    Returns:
+        dict: File name -> export
+    """
+    rng = random.Random(seed)
+
+    def entries(prefix, statuses, types=("file",)):
+        return [
+            {
+                "type": rng.choice(types),
+                "summary": f"{prefix} {i}",
+                "file": f"{prefix.lower()}/{i}.md",
+                "status": rng.choice(statuses),
+            }
+            for i in range(count)
+        ]
+
+    mind_statuses = [" ", "x", "w", "?", "t", "*"]
+    return {
+        "progress.json": entries("Progress", ["focus", "active", "pending"], ("project", "TODO", "task")),
+        "focus.json": entries("Focus", mind_statuses, ("file", "task")),
+        "focus-tasks.json": entries("Focus task", mind_statuses),
+        "focus-notes.json": entries("Focus note", mind_statuses),
+        "initiatives.json": entries("Initiative", ["focus", "active", "none", "2024-06-01", ""], ("work", "study")),
+        "current-tasks.json": entries("Current task", [" "]),
+        "current-projects.json": entries("Current project", ["current"]),
+        "current-images.json": entries("Image", [" "]),
+        "current-wonders.json": entries("Wonder", [" "]),
+    }
+
+
+# Exports of a synthetic vault: file name -> (generator, share of the items)
+VAULT_EXPORTS = {
+    "videos.json": (make_videos, 1.0),
+    "tasks.json": (make_tasks, 1.0),
+    "calendar.json": (make_events, 0.25),
+    "projects.json": (make_projects, 0.05),
+    "notes.json": (make_notes, 0.5),
+}
+
+
+def write_vault(folder, count, seed=0):
+    """
+    Write a synthetic vault of Dataview exports to a folder.
+
+    Args:
+        folder: pathlib.Path to write the JSON files to
+        count: Number of items of the largest exports (videos, tasks);
+            the others are scaled down as in VAULT_EXPORTS
+        seed: Random seed
+
+    Returns:
+        int: Total bytes written
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    exports = {
+        name: make(max(1, int(count * share)), seed)
+        for name, (make, share) in VAULT_EXPORTS.items()
+    }
+    exports.update(make_widget_sources(max(1, count // 100), seed))
+
+    size = 0
+    for name, export in exports.items():
+        data = json.dumps(export).encode("utf-8")
+        (folder / name).write_bytes(data)
+        size += len(data)
+    return size
@@ -0,0 +1,215 @@
+"""Shared page assets.
+
+Stylesheets, scripts and the tag list used by every generated page are
+written once per build under assets/, with a content hash in each file
+name (app.<hash>.css, video.<hash>.js, tags.<hash>.js, ...). Pages only
+reference them, so browsers cache them across collections and a changed
+asset gets a new URL instead of a stale cache hit.
+"""
+
+import re
+from pathlib import Path
+
+from playlist_maker import jsonio
+from playlist_maker.manifest import hash_bytes
+from playlist_maker.output import write_bytes
+from playlist_maker.resources import cached_file
+from playlist_maker.utils.colors import extract_pywal_colors
+from playlist_maker.utils.templates import load_template
+
+ASSETS_DIR = "assets"
+
+# Collection fragments fetched by the home page with --lazy-tabs
+COLLECTIONS_DIR = "collections"
+
+# Folders whose file names carry a content hash
+HASHED_DIRS = (ASSETS_DIR, COLLECTIONS_DIR)
+
+# Video data of each video collection (obsi-data/<stem>.json), fetched by
+# the home page; named after the collection, so revalidated like the pages.
+# Namespaced, as the folder is pruned and sits among the user's exports
+VIDEO_DATA_DIR = "obsi-data"
+
+# Hex digits of the content hash kept in asset file names
+HASH_LENGTH = 12
+
+# Names written by write_hashed_file(): <prefix>.<hash><suffix>
+_HASHED_NAME = re.compile(rf"[^/]+\.[0-9a-f]{{{HASH_LENGTH}}}\.[A-Za-z0-9]+")
+
+
+def get_tags_path():
+    """Return the path of the shared -tags.json file"""
+    return Path.home() / "share" / "_scripts" / "-tags.json"
+
+
+def load_tags():
+    """
+    Load the tag definitions, or an empty dict without a valid -tags.json.
+
+    The file is parsed again only when it changes; callers share the
+    returned dict and must not modify it. A malformed tag list only loses
+    the tags, not the build.
+    """
+    path = get_tags_path()
+    try:
+        return cached_file(path, jsonio.load, missing={})
+    except (jsonio.JSONDecodeError, OSError) as e:
+        print(f"Warning: Could not load {path}: {e}")
+        return {}
+
+
+def get_asset_sources():
+    """
+    Render the content of every shared asset.
+
+    Returns:
+        dict: Asset key -> (file name prefix, suffix, content bytes)
+    """
+    from playlist_maker.templates.home_page import get_unified_page_styles
+    from playlist_maker.templates.unified_page_js import get_unified_page_javascript
+
+    return {
+        "app_css": ("app", ".css", extract_pywal_colors().encode("utf-8")),
+        "home_css": ("home", ".css", get_unified_page_styles().encode("utf-8")),
+        "home_js": ("home", ".js", get_unified_page_javascript().encode("utf-8")),
+        "video_css": ("video", ".css", load_template("video.css").encode("utf-8")),
+        "video_js": ("video", ".js", load_template("video.js").encode("utf-8")),
+        # A script rather than JSON, so pages opened from file:// get it too
+        "tags_js": ("tags", ".js", b"var VIDEO_TAGS = " + jsonio.dumps_bytes(load_tags()) + b";\n"),
+    }
+
+
+def write_hashed_file(directory, prefix, suffix, content, stats=None):
+    """
+    Write content to <prefix>.<hash><suffix> unless that file already exists.
+
+    An existing file is left alone: its name is derived from its content,
+    so it is already up to date.
+
+    Args:
+        directory: Folder to write to (created if missing)
+        prefix: File name before the hash
+        suffix: File extension, including the dot
+        content: Bytes to write
+        stats: OutputStats to count the file in, if any
+
+    Returns:
+        str: Name of the file
+    """
+    name = f"{prefix}.{hash_bytes(content)[:HASH_LENGTH]}{suffix}"
+    path = Path(directory) / name
+    if path.exists():
+        if stats is not None:
+            stats.record(len(content), False)
+    else:
+        write_bytes(path, content, stats)
+    return name
+
+
+def prune_hashed_files(directory, keep, suffixes=None):
+    """
+    Delete hashed files (and their compressed variants) not in keep.
+
+    Only names of the form write_hashed_file() produces are considered;
+    any other file in the folder is left alone.
+
+    Args:
+        directory: Folder written by write_hashed_file()
+        keep: Names of the files still referenced
+        suffixes: File extensions to limit the deletion to, if any
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return
+    for path in directory.iterdir():
+        # Compressed variants (app.<hash>.css.gz) go with their file
+        name = path.stem if path.suffix in (".gz", ".br") else path.name
+        if suffixes is not None and not name.endswith(suffixes):
+            continue
+        if path.is_file() and name not in keep and _HASHED_NAME.fullmatch(name):
+            path.unlink()
+
+
+def build_assets(output_dir, stats=None):
+    """
+    Write the shared assets of a build.
+
+    Args:
+        output_dir: Folder the pages are generated in
+        stats: OutputStats to count the assets in, if any
+
+    Returns:
+        dict: Asset key -> URL relative to output_dir
+    """
+    assets_dir = Path(output_dir) / ASSETS_DIR
+    urls = {}
+    for key, (prefix, suffix, content) in get_asset_sources().items():
+        urls[key] = f"{ASSETS_DIR}/{write_hashed_file(assets_dir, prefix, suffix, content, stats)}"
+    return urls
+
+
+def prune_assets(output_dir, assets):
+    """
+    Delete assets left over from previous builds.
+
+    Args:
+        output_dir: Folder the pages are generated in
+        assets: Dict returned by build_assets() for the current build
+    """
+    prune_hashed_files(Path(output_dir) / ASSETS_DIR, {Path(url).name for url in assets.values()})
+
+
+def prune_video_data(output_dir, keep):
+    """
+    Delete video data files (<stem>.json) of collections no longer built.
+
+    Args:
+        output_dir: Folder the pages are generated in
+        keep: Names of the data files of the current video collections
+    """
+    data_dir = Path(output_dir) / VIDEO_DATA_DIR
+    if not data_dir.is_dir():
+        return
+    for path in data_dir.iterdir():
+        name = path.stem if path.suffix in (".gz", ".br") else path.name
+        if path.is_file() and name.endswith(".json") and name not in keep:
+            path.unlink()
+
+
+def write_collection_fragments(output_dir, successful_collections, stats=None):
+    """
+    Publish the rendered embedded collections as standalone fragments.
+
+    Sets 'fragment_url' on every collection that has a 'fragment_path', so
+    the home page links to it instead of embedding it. Fragments of previous
+    builds are deleted.
+
+    Args:
+        output_dir: Folder the pages are generated in
+        successful_collections: Dict of collection lists by content type
+        stats: OutputStats to count the fragments in, if any
+    """
+    collections_dir = Path(output_dir) / COLLECTIONS_DIR
+    keep = set()
+    for collections in successful_collections.values():
+        for collection in collections:
+            fragment_path = collection.get("fragment_path")
+            if fragment_path is None:
+                continue
+            name = write_hashed_file(
+                collections_dir, collection["stem"], ".html", Path(fragment_path).read_bytes(), stats
+            )
+            collection["fragment_url"] = f"{COLLECTIONS_DIR}/{name}"
+            keep.add(name)
+    prune_collection_fragments(output_dir, keep)
+
+
+def prune_collection_fragments(output_dir, keep=()):
+    """
+    Delete collection fragments (<stem>.<hash>.html) not in keep.
+
+    Args:
+        output_dir: Folder the pages are generated in
+        keep: Names of the fragments still linked from the home page
+    """
+    prune_hashed_files(Path(output_dir) / COLLECTIONS_DIR, keep, suffixes=(".html",))
@@ -1,9 +1,12 @@
 """Data validation and processing"""
 
+from itertools import chain, islice
 from pathlib import Path
 import re
 import os
 
+from playlist_maker.records import VideoItem, TaskItem, CalendarEvent, ProjectItem, NoteItem
+
 # Content type configuration
 CONTENT_TYPE_RULES = {
     "video": {
@@ -46,6 +49,77 @@ CONTENT_TYPE_RULES = {
     }
 }
 
+# Inline Dataview fields, "[key:: value]". A lookahead, so a field opening
+# inside another bracketed span (e.g. "[foo [date:: X]") is found too
+INLINE_FIELD_PATTERN = re.compile(r'\[(?=(\w+)::([^\]]*)\])')
+
+# Bracketed spans removed from task titles; they do not span lines
+BRACKETED_SPAN_PATTERN = re.compile(r'\s*\[[^\]\n]*\]')
+
+# Bracketed spans removed from calendar titles, across lines too
+MULTILINE_BRACKETED_SPAN_PATTERN = re.compile(r'\s*\[[^\]]*\]')
+
+# The only field removed from note titles; an empty description stays
+DESCRIPTION_FIELD_PATTERN = re.compile(r'\s*\[description::\s*[^\]]+\]')
+
+# Values the active/focus toggles accept: a single word, no trailing space
+TOGGLE_VALUE_PATTERN = re.compile(r'\s*(\w+)')
+
+# Inline field values read as "on" by the active/focus toggles
+TRUTHY_FIELD_VALUES = frozenset(["true", "yes", "1"])
+
+
+def parse_inline_fields(summary, strip_pattern=BRACKETED_SPAN_PATTERN):
+    """
+    Extract inline Dataview fields from a summary.
+
+    Args:
+        summary: Raw summary text, e.g. "Fix bug [active:: true] [date:: 2024-05-01]"
+        strip_pattern: Compiled pattern of the spans to remove from the
+            summary (BRACKETED_SPAN_PATTERN, MULTILINE_BRACKETED_SPAN_PATTERN
+            or DESCRIPTION_FIELD_PATTERN)
+
+    Returns:
+        tuple: (fields, clean_summary) where fields maps each key to the
+        raw values of its occurrences, in order; read them with
+        get_field_value() and is_truthy_field()
+    """
+    if "[" not in summary:
+        return {}, summary.strip()
+
+    fields = {}
+    for match in INLINE_FIELD_PATTERN.finditer(summary):
+        fields.setdefault(match.group(1), []).append(match.group(2))
+
+    return fields, strip_pattern.sub("", summary).strip()
+
+
+def get_field_value(fields, key):
+    """
+    Return the first non-empty value of an inline field.
+
+    Leading whitespace is dropped unless it is the whole value, so
+    "[date::  ]" reads as " "; trailing whitespace is kept.
+    """
+    for raw in fields.get(key, ()):
+        if raw:
+            return raw.lstrip() or raw[-1]
+    return ""
+
+
+def is_truthy_field(fields, key):
+    """Return True if the first single-word value of an inline field is true/yes/1"""
+    for raw in fields.get(key, ()):
+        match = TOGGLE_VALUE_PATTERN.fullmatch(raw)
+        if match:
+            return match.group(1).lower() in TRUTHY_FIELD_VALUES
+    return False
+
+
+def get_file_id(file_path):
+    """Return the note name used as item id (file name without extension)"""
+    return os.path.splitext(os.path.basename(file_path))[0]
+
 
 def detect_content_type(data):
     """
@@ -133,10 +207,8 @@ def validate_video_data(data):
     return True, "Valid video data"
 
 
-def sanitize_video_data(data):
-    """Clean and ensure video data has all required fields with defaults"""
-    sanitized = []
-
+def iter_sanitized_video_data(data):
+    """Clean video items one at a time, yielding VideoItem records with defaults"""
     for item in data:
         if not isinstance(item, dict):
             continue
@@ -147,27 +219,30 @@ def sanitize_video_data(data):
             continue
 
         # Ensure all fields have proper types and defaults
-        sanitized_item = {
-            "id": str(item.get("id", "")),
-            "summary": str(item.get("summary", "Untitled Video")),
-            "duration": int(item.get("duration", 0)),
-            "channel": str(item.get("channel", "Unknown Channel")),
-            "date": str(item.get("date", "2024-01-01")),
-            "locator": str(item.get("locator", "")),
-            "thumbnail": item.get("thumbnail", ""),
-            "watched": bool(item.get("watched", False)),
-            "tags": item.get("tags", []) if isinstance(item.get("tags"), list) else [],
-            "file": item.get("file", ""),
-            "line": int(item.get("line", 0)),
-        }
+        sanitized_item = VideoItem(
+            id=str(item.get("id", "")),
+            summary=str(item.get("summary", "Untitled Video")),
+            duration=int(item.get("duration", 0)),
+            channel=str(item.get("channel", "Unknown Channel")),
+            date=str(item.get("date", "2024-01-01")),
+            locator=str(item.get("locator", "")),
+            thumbnail=item.get("thumbnail", ""),
+            watched=bool(item.get("watched", False)),
+            tags=item.get("tags", []) if isinstance(item.get("tags"), list) else [],
+            file=item.get("file") or "",
+            line=int(item.get("line", 0)),
+        )
 
         # Skip if essential fields are empty
-        if not sanitized_item["id"] or not sanitized_item["locator"]:
+        if not sanitized_item.id or not sanitized_item.locator:
             continue
 
-        sanitized.append(sanitized_item)
+        yield sanitized_item
+
 
-    return sanitized
+def sanitize_video_data(data):
+    """Clean and ensure video data has all required fields with defaults"""
+    return list(iter_sanitized_video_data(data))
 
 
 def validate_task_data(data):
@@ -263,18 +338,16 @@ def validate_project_data(data):
     return True, "Valid project data"
 
 
-def sanitize_task_data(data):
+def iter_sanitized_task_data(data):
     """
-    Clean and ensure task data has all required fields with defaults.
+    Clean task items one at a time.
 
     Args:
-        data: Parsed JSON data
+        data: Iterable of parsed JSON items
 
-    Returns:
-        list: List of sanitized task dictionaries
+    Yields:
+        TaskItem: Sanitized item with defaults filled in
     """
-    sanitized = []
-
     for item in data:
         if not isinstance(item, dict):
             continue
@@ -288,53 +361,58 @@ def sanitize_task_data(data):
         if not file_path or not summary:
             continue
 
-        import os
-        id_value = os.path.splitext(os.path.basename(file_path))[0]
+        id_value = get_file_id(file_path)
 
-        active_match = re.search(r'\[active::\s*(\w+)\]', summary)
-        focus_match = re.search(r'\[focus::\s*(\w+)\]', summary)
-        date_match = re.search(r'\[date::\s*([^\]]+)\]', summary)
+        fields, clean_summary = parse_inline_fields(summary)
 
-        is_active = active_match and active_match.group(1).lower() in ["true", "yes", "1"]
-        is_focused = focus_match and focus_match.group(1).lower() in ["true", "yes", "1"]
-        due_date = date_match.group(1) if date_match else ""
+        is_active = is_truthy_field(fields, "active")
+        is_focused = is_truthy_field(fields, "focus")
+        due_date = get_field_value(fields, "date")
 
-        clean_summary = re.sub(r'\s*\[.*?\]', '', summary).strip()
         line = item.get("line", 1)
 
-        sanitized_item = {
-            "id": str(id_value),
-            "title": str(clean_summary),
-            "status": str(item.get("status", "pending")),
-            "description": "",
-            "due_date": str(due_date),
-            "priority": str("normal"),
-            "active": bool(is_active),
-            "focus": bool(is_focused),
-            "file": str(file_path),
-            "line": int(line)
-        }
-
-        if not sanitized_item["id"]:
+        sanitized_item = TaskItem(
+            id=str(id_value),
+            title=str(clean_summary),
+            status=str(item.get("status", "pending")),
+            description="",
+            due_date=str(due_date),
+            priority="normal",
+            active=bool(is_active),
+            focus=bool(is_focused),
+            file=str(file_path),
+            line=int(line),
+        )
+
+        if not sanitized_item.id:
             continue
 
-        sanitized.append(sanitized_item)
-
-    return sanitized
+        yield sanitized_item
 
 
-def sanitize_calendar_data(data):
+def sanitize_task_data(data):
     """
-    Clean and ensure calendar data has all required fields with defaults.
+    Clean and ensure task data has all required fields with defaults.
 
     Args:
         data: Parsed JSON data
 
     Returns:
-        list: List of sanitized event dictionaries
+        list: List of TaskItem records
+    """
+    return list(iter_sanitized_task_data(data))
+
+
+def iter_sanitized_calendar_data(data):
     """
-    sanitized = []
+    Clean calendar items one at a time.
+
+    Args:
+        data: Iterable of parsed JSON items
 
+    Yields:
+        CalendarEvent: Sanitized item with defaults filled in
+    """
     for item in data:
         if not isinstance(item, dict):
             continue
@@ -343,9 +421,10 @@ def sanitize_calendar_data(data):
         summary = item.get("summary", "")
         scheduled = item.get("scheduled", "")
 
+        fields, clean_summary = parse_inline_fields(summary, MULTILINE_BRACKETED_SPAN_PATTERN)
+
         if not scheduled:
-            scheduled_match = re.search(r'\[scheduled::\s*([^\]]+)\]', summary)
-            scheduled = scheduled_match.group(1) if scheduled_match else ""
+            scheduled = get_field_value(fields, "scheduled")
 
         if not scheduled:
             scheduled = item.get("date", "")
@@ -353,49 +432,53 @@ def sanitize_calendar_data(data):
         if not scheduled:
             continue
 
-        import os
-        id_value = os.path.splitext(os.path.basename(file_path))[0]
+        id_value = get_file_id(file_path)
 
-        location = item.get("location", "")
-        if not location:
-            location_match = re.search(r'\[location::\s*([^\]]+)\]', summary)
-            location = location_match.group(1) if location_match else ""
+        location = item.get("location", "") or get_field_value(fields, "location")
 
-        clean_summary = re.sub(r'\s*\[[^]]*\]', '', summary).strip()
         line = item.get("line", 1)
 
-        sanitized_item = {
-            "id": str(id_value),
-            "title": str(clean_summary),
-            "scheduled": str(scheduled),
-            "location": str(location),
-            "status": str(item.get("status", "scheduled")),
-            "description": item.get("description", ""),
-            "attendees": item.get("attendees", []) if isinstance(item.get("attendees"), list) else [],
-            "file": str(file_path),
-            "line": int(line)
-        }
-
-        if not sanitized_item["id"]:
+        sanitized_item = CalendarEvent(
+            id=str(id_value),
+            title=str(clean_summary),
+            scheduled=str(scheduled),
+            location=str(location),
+            status=str(item.get("status", "scheduled")),
+            description=item.get("description", ""),
+            attendees=item.get("attendees", []) if isinstance(item.get("attendees"), list) else [],
+            file=str(file_path),
+            line=int(line),
+        )
+
+        if not sanitized_item.id:
             continue
 
-        sanitized.append(sanitized_item)
-
-    return sanitized
+        yield sanitized_item
 
 
-def sanitize_project_data(data):
+def sanitize_calendar_data(data):
     """
-    Clean and ensure project data has all required fields with defaults.
+    Clean and ensure calendar data has all required fields with defaults.
 
     Args:
         data: Parsed JSON data
 
     Returns:
-        list: List of sanitized project dictionaries
+        list: List of CalendarEvent records
+    """
+    return list(iter_sanitized_calendar_data(data))
+
+
+def iter_sanitized_project_data(data):
     """
-    sanitized = []
+    Clean project items one at a time.
+
+    Args:
+        data: Iterable of parsed JSON items
 
+    Yields:
+        ProjectItem: Sanitized item with defaults filled in
+    """
     for item in data:
         if not isinstance(item, dict):
             continue
@@ -409,31 +492,41 @@ def sanitize_project_data(data):
         if not file_path or not summary:
             continue
 
-        import os
-        id_value = os.path.splitext(os.path.basename(file_path))[0]
+        id_value = get_file_id(file_path)
         line = item.get("line", 1)
 
-        sanitized_item = {
-            "id": str(id_value),
-            "title": str(summary),
-            "workspace": str(item.get("workspace", "")),
-            "class": str(item.get("class", "")),
-            "status": str(item.get("status", "")),
-            "progress": int(item.get("progress", 0)),
-            "due_date": str(item.get("due_date", "")),
-            "description": str(item.get("description", "")),
-            "active": bool(item.get("active", True)),
-            "focus": bool(item.get("focus", False)),
-            "file": str(file_path),
-            "line": int(line)
-        }
-
-        if not sanitized_item["id"]:
+        sanitized_item = ProjectItem(
+            id=str(id_value),
+            title=str(summary),
+            workspace=str(item.get("workspace", "")),
+            class_name=str(item.get("class", "")),
+            status=str(item.get("status", "")),
+            progress=int(item.get("progress", 0)),
+            due_date=str(item.get("due_date", "")),
+            description=str(item.get("description", "")),
+            active=bool(item.get("active", True)),
+            focus=bool(item.get("focus", False)),
+            file=str(file_path),
+            line=int(line),
+        )
+
+        if not sanitized_item.id:
             continue
 
-        sanitized.append(sanitized_item)
+        yield sanitized_item
 
-    return sanitized
+
+def sanitize_project_data(data):
+    """
+    Clean and ensure project data has all required fields with defaults.
+
+    Args:
+        data: Parsed JSON data
+
+    Returns:
+        list: List of ProjectItem records
+    """
+    return list(iter_sanitized_project_data(data))
 
 
 def validate_notes_data(data):
@@ -467,18 +560,16 @@ def validate_notes_data(data):
     return True, "Valid notes data"
 
 
-def sanitize_notes_data(data):
+def iter_sanitized_notes_data(data):
     """
-    Clean and ensure notes data has all required fields with defaults.
+    Clean notes items one at a time.
 
     Args:
-        data: Parsed JSON data
+        data: Iterable of parsed JSON items
 
-    Returns:
-        list: List of sanitized note dictionaries
+    Yields:
+        NoteItem: Sanitized item with defaults filled in
     """
-    sanitized = []
-
     for item in data:
         if not isinstance(item, dict):
             continue
@@ -492,38 +583,95 @@ def sanitize_notes_data(data):
         if not file_path or not summary:
             continue
 
-        import os
-        id_value = os.path.splitext(os.path.basename(file_path))[0]
+        id_value = get_file_id(file_path)
 
-        description_match = re.search(r'\[description::\s*([^\]]+)\]', summary)
-        description = description_match.group(1) if description_match else ""
-        
-        clean_summary = re.sub(r'\s*\[description::\s*[^\]]+\]', '', summary).strip()
+        # Only the description is moved out of the title; other fields stay visible
+        fields, clean_summary = parse_inline_fields(summary, DESCRIPTION_FIELD_PATTERN)
+        description = get_field_value(fields, "description")
 
-        active_match = re.search(r'\[active::\s*(\w+)\]', summary)
-        focus_match = re.search(r'\[focus::\s*(\w+)\]', summary)
         line = item.get("line", 1)
 
-        is_active = active_match and active_match.group(1).lower() in ["true", "yes", "1"]
-        is_focused = focus_match and focus_match.group(1).lower() in ["true", "yes", "1"]
-
-        sanitized_item = {
-            "id": str(id_value),
-            "title": str(clean_summary),
-            "description": str(description),
-            "status": str(item.get("status", "active")),
-            "active": bool(is_active),
-            "focus": bool(is_focused),
-            "file": str(file_path),
-            "line": int(line)
-        }
-
-        if not sanitized_item["id"]:
+        is_active = is_truthy_field(fields, "active")
+        is_focused = is_truthy_field(fields, "focus")
+
+        sanitized_item = NoteItem(
+            id=str(id_value),
+            title=str(clean_summary),
+            description=str(description),
+            status=str(item.get("status", "active")),
+            active=bool(is_active),
+            focus=bool(is_focused),
+            file=str(file_path),
+            line=int(line),
+        )
+
+        if not sanitized_item.id:
             continue
 
-        sanitized.append(sanitized_item)
+        yield sanitized_item
+
+
+def sanitize_notes_data(data):
+    """
+    Clean and ensure notes data has all required fields with defaults.
+
+    Args:
+        data: Parsed JSON data
+
+    Returns:
+        list: List of NoteItem records
+    """
+    return list(iter_sanitized_notes_data(data))
+
+
+VALIDATORS = {
+    "video": validate_video_data,
+    "task": validate_task_data,
+    "calendar": validate_calendar_data,
+    "project": validate_project_data,
+    "notes": validate_notes_data
+}
+
+ITEM_SANITIZERS = {
+    "video": iter_sanitized_video_data,
+    "task": iter_sanitized_task_data,
+    "calendar": iter_sanitized_calendar_data,
+    "project": iter_sanitized_project_data,
+    "notes": iter_sanitized_notes_data
+}
+
 
-    return sanitized
+def validate_data(data, content_type):
+    """
+    Route data to the validator of its content type.
+
+    Args:
+        data: Parsed JSON data
+        content_type: Content type string ("video", "task", "calendar", "project", "notes")
+
+    Returns:
+        tuple: (is_valid, reason)
+    """
+    validator = VALIDATORS.get(content_type)
+
+    if not validator or content_type not in ITEM_SANITIZERS:
+        return False, f"Unknown content type: {content_type}"
+
+    return validator(data)
+
+
+def sanitize_data(data, content_type):
+    """
+    Sanitize every item of data validated by validate_data().
+
+    Args:
+        data: Parsed JSON data
+        content_type: Content type string
+
+    Returns:
+        list: Sanitized item records
+    """
+    return list(ITEM_SANITIZERS[content_type](data))
 
 
 def validate_and_sanitize(data, content_type):
@@ -537,32 +685,41 @@ def validate_and_sanitize(data, content_type):
     Returns:
         tuple: (sanitized_data, is_valid, reason)
     """
-    validators = {
-        "video": validate_video_data,
-        "task": validate_task_data,
-        "calendar": validate_calendar_data,
-        "project": validate_project_data,
-        "notes": validate_notes_data
-    }
+    is_valid, reason = validate_data(data, content_type)
 
-    sanitizers = {
-        "video": sanitize_video_data,
-        "task": sanitize_task_data,
-        "calendar": sanitize_calendar_data,
-        "project": sanitize_project_data,
-        "notes": sanitize_notes_data
-    }
+    if not is_valid:
+        return [], False, reason
+
+    return sanitize_data(data, content_type), True, reason
+
+
+def validate_and_sanitize_stream(items, sample_size=5):
+    """
+    Streaming counterpart of detect_content_type + validate_and_sanitize.
 
-    validator = validators.get(content_type)
-    sanitizer = sanitizers.get(content_type)
+    Detection and validation only look at the first items, so just those
+    are buffered; the rest is sanitized lazily as the returned iterator is
+    consumed.
+
+    Args:
+        items: Iterator over the items of a top-level JSON array
+        sample_size: Number of items used for detection and validation
+
+    Returns:
+        tuple: (content_type, sanitized_iterator, is_valid, reason)
+    """
+    sample = list(islice(items, sample_size))
+    content_type = detect_content_type(sample)
+
+    validator = VALIDATORS.get(content_type)
+    sanitizer = ITEM_SANITIZERS.get(content_type)
 
     if not validator or not sanitizer:
-        return [], False, f"Unknown content type: {content_type}"
+        return content_type, iter(()), False, f"Unknown content type: {content_type}"
 
-    is_valid, reason = validator(data)
+    is_valid, reason = validator(sample)
 
     if not is_valid:
-        return [], False, reason
+        return content_type, iter(()), False, reason
 
-    sanitized = sanitizer(data)
-    return sanitized, True, reason
+    return content_type, sanitizer(chain(sample, items)), True, reason
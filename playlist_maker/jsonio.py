@@ -0,0 +1,118 @@
+"""JSON parsing and serialization backend.
+
+The fastest installed library is picked at import time: orjson, then
+ujson, then the stdlib json module. Set OBSI_DASH_JSON=json (or ujson,
+orjson) to force a backend.
+
+Compact output always uses "," and ":" separators and unescaped UTF-8, so
+it is the same whichever backend produced it. Indented output goes through
+the stdlib, which is the only backend supporting arbitrary indents.
+"""
+
+import json
+import os
+
+# Re-exported so callers only need this module to catch parse errors
+JSONDecodeError = json.JSONDecodeError
+
+
+def _stdlib_loads(data):
+    return json.loads(data)
+
+
+def _stdlib_dumps_bytes(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# name -> (loads, dumps_bytes)
+BACKENDS = {"json": (_stdlib_loads, _stdlib_dumps_bytes)}
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+    BACKENDS["orjson"] = (orjson.loads, orjson.dumps)
+
+try:
+    import ujson
+except ImportError:
+    pass
+else:
+    def _ujson_loads(data):
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            raise JSONDecodeError(str(e), "", 0) from e
+
+    def _ujson_dumps_bytes(obj):
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    BACKENDS["ujson"] = (_ujson_loads, _ujson_dumps_bytes)
+
+
+def _pick_backend():
+    requested = os.environ.get("OBSI_DASH_JSON")
+    if requested in BACKENDS:
+        return requested
+    for name in ("orjson", "ujson", "json"):
+        if name in BACKENDS:
+            return name
+
+
+BACKEND = _pick_backend()
+_loads, _dumps_bytes = BACKENDS[BACKEND]
+
+
+def loads(data):
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        Parsed object
+
+    Raises:
+        JSONDecodeError: If the document is invalid
+    """
+    return _loads(data)
+
+
+def load(path):
+    """Read and parse a JSON file"""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def dumps_bytes(obj):
+    """Serialize to compact UTF-8 bytes, ready to be written to a binary file"""
+    return _dumps_bytes(obj)
+
+
+def dumps(obj, indent=None):
+    """
+    Serialize to a str.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width, or None for compact output
+
+    Returns:
+        str: JSON text
+    """
+    if indent is None:
+        return _dumps_bytes(obj).decode("utf-8")
+    return json.dumps(obj, indent=indent)
+
+
+def embed_json(obj):
+    """
+    Serialize data for a <script type="application/json"> element.
+
+    '<' only occurs inside JSON strings, where the escape keeps a value such
+    as "</script>" from ending the element early.
+    """
+    return dumps(obj).replace("<", "\\u003c")
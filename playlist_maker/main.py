@@ -1,28 +1,91 @@
 """Playlist Maker - Generate video collection dashboards from JSON data"""
 
-import json
+import argparse
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import chain, repeat
 from pathlib import Path
 
 # Import from local modules
 from playlist_maker.utils.colors import extract_pywal_colors
-from playlist_maker.utils.templates import render_unified_home_template, load_template
-from playlist_maker.data import format_title, detect_content_type, validate_and_sanitize
+from playlist_maker.utils.templates import iter_unified_home_template, render_home_template
+from playlist_maker import jsonio
+from playlist_maker.jsonio import embed_json
+from playlist_maker.assets import (
+    VIDEO_DATA_DIR,
+    build_assets,
+    prune_assets,
+    prune_collection_fragments,
+    prune_video_data,
+    write_collection_fragments,
+)
+from playlist_maker.data import (
+    format_title,
+    detect_content_type,
+    sanitize_data,
+    validate_data,
+    validate_and_sanitize_stream,
+)
+from playlist_maker.manifest import BuildManifest, hash_bytes, hash_file
+from playlist_maker.output import OutputStats, open_text
+from playlist_maker.precompress import precompress_outputs
+from playlist_maker.profiling import (
+    PROFILE_FILE,
+    BuildProfile,
+    StageTimings,
+    python_profiling,
+)
+from playlist_maker.records import records_to_columns, records_to_json
+from playlist_maker.streaming import (
+    STREAMING_THRESHOLD_BYTES,
+    HashingReader,
+    iter_json_array,
+    starts_with_array,
+)
+from playlist_maker.templates.data_row import iter_collection_html
+
+# Write buffer of index.html; collections are flushed as they are written
+HOME_PAGE_BUFFER_SIZE = 1 << 20
+
+# Shared assets referenced by video pages
+VIDEO_PAGE_ASSETS = ("app_css", "video_css", "video_js", "tags_js")
+
+# Encodings of the video data embedded in video pages (decoded by video.js)
+PAYLOAD_FORMATS = ("compact", "columnar")
+
+
+def get_video_inputs_digest(assets, payload="compact"):
+    """
+    Hash the shared inputs referenced by every video page.
 
+    Asset URLs carry a content hash, so a new colour scheme, tag list or
+    video script changes the digest.
 
-def generate_unified_home_page(output_dir, successful_collections):
-    """
-    Generate a unified index.html with tabbed navigation for all content types.
+    Args:
+        assets: Dict of shared asset URLs, as returned by build_assets()
+        payload: Video data encoding, one of PAYLOAD_FORMATS
 
-    Videos are linked to separate pages, other types are embedded.
+    Returns:
+        str: Digest of the video page asset URLs and the encoding
     """
-    pywal_css = extract_pywal_colors()
+    inputs = [assets[key] for key in VIDEO_PAGE_ASSETS] + [payload]
+    return hash_bytes("\0".join(inputs).encode("utf-8"))
 
-    home_html = render_unified_home_template(pywal_css, successful_collections)
 
+def generate_unified_home_page(output_dir, successful_collections, assets, stats=None):
+    """
+    Generate a unified index.html with tabbed navigation for all content types.
+
+    Videos are linked to separate pages, other types are embedded. The page
+    is streamed to a temporary file that replaces index.html in one step,
+    and only if its content changed.
+    """
     home_path = output_dir / "index.html"
-    with open(home_path, "w", encoding="utf-8") as f:
-        f.write(home_html)
+    with open_text(home_path, stats, buffering=HOME_PAGE_BUFFER_SIZE) as f:
+        f.writelines(iter_unified_home_template(assets, successful_collections))
 
     print(f"\nGenerated unified home page: {home_path}")
 
@@ -41,59 +104,347 @@ def generate_home_page(output_dir, successful_files):
     return home_html
 
 
-def generate_html(json_data, title):
-    """Generate complete HTML with embedded JSON data"""
-    # Get pywal colors
-    pywal_css = extract_pywal_colors()
+def generate_html_parts(title, assets):
+    """
+    Render a video page without its video data.
 
-    # Load tags from -tags.json
-    tags_file = Path.home() / "share" / "_scripts" / "-tags.json"
-    tags_data = {}
-    if tags_file.exists():
-        with open(tags_file, "r", encoding="utf-8") as f:
-            tags_data = json.load(f)
+    Styles, the page script and the tags are shared assets the page links
+    to, so only the video data is specific to the page.
 
-    # Load JavaScript template
-    javascript_template = load_template("video.js")
+    Args:
+        title: Page title
+        assets: Dict of shared asset URLs, as returned by build_assets()
 
-    # Convert json_data and tags_data to JSON strings
-    json_str = json.dumps(json_data, indent=8)
-    tags_str = json.dumps(tags_data, indent=8)
+    Returns:
+        tuple: (head, tail) HTML to write before and after the VIDEO_DATA array
+    """
+    from playlist_maker.utils.templates import render_video_template_parts
+    return render_video_template_parts(title, assets)
 
-    # Format JavaScript with video data and tags (use replace to avoid format string issues)
-    javascript = javascript_template.replace("{VIDEO_DATA}", json_str)
-    javascript = javascript.replace("{TAGS_DATA}", tags_str)
 
-    from playlist_maker.utils.templates import render_video_template
-    # Render video template
-    html_template = render_video_template(title, pywal_css, javascript)
+def generate_html(json_data, title, assets, payload="compact"):
+    """
+    Generate complete HTML with embedded JSON data.
 
-    return html_template
+    Args:
+        json_data: List of VideoItem records
+        title: Page title
+        assets: Dict of shared asset URLs, as returned by build_assets()
+        payload: "compact" for a list of objects without whitespace, or
+            "columnar" for one array per field
 
+    Returns:
+        str: Complete HTML
+    """
+    head, tail = generate_html_parts(title, assets)
+    if payload == "columnar":
+        return head + embed_json(records_to_columns(json_data)) + tail
+    return head + embed_json(records_to_json(json_data)) + tail
 
-def main():
-    # Hardcoded folder path
-    folder_path = Path.home() / "share" / "_tmp"
 
-    # Check if folder exists
-    if not folder_path.exists():
-        print(f"Error: Folder '{folder_path}' not found.")
-        print("Please create the folder or update the hardcoded path in the script.")
-        sys.exit(1)
+def write_video_page(output_path, videos, title, assets, payload="compact", stats=None,
+                     data_path=None):
+    """
+    Write a video page, serializing one video at a time.
+
+    The output matches generate_html(). With the compact payload the whole
+    data array is never held in memory; the columnar payload has to gather
+    each column first. Nothing is written when there are no videos, and the
+    page only replaces output_path once it is complete.
+
+    Args:
+        output_path: Path of the page to write
+        videos: Iterable of VideoItem records
+        title: Page title
+        assets: Dict of shared asset URLs, as returned by build_assets()
+        payload: Video data encoding, one of PAYLOAD_FORMATS
+        stats: OutputStats to count the page in, if any
+        data_path: Where to also write the video data alone, as the JSON
+            file the home page fetches; skipped if None
+
+    Returns:
+        int: Number of videos written
+    """
+    videos = iter(videos)
+    first = next(videos, None)
+    if first is None:
+        return 0
+
+    head, tail = generate_html_parts(title, assets)
+    count = 0
+
+    with ExitStack() as stack:
+        page = stack.enter_context(open_text(output_path, stats))
+        outputs = [page]
+        if data_path is not None:
+            outputs.append(stack.enter_context(open_text(data_path, stats)))
+
+        def write(chunk):
+            for f in outputs:
+                f.write(chunk)
+
+        page.write(head)
+        if payload == "columnar":
+            columns = records_to_columns(chain((first,), videos))
+            count = len(columns["id"])
+            write(embed_json(columns))
+        else:
+            write("[")
+            for video in chain((first,), videos):
+                if count:
+                    write(",")
+                write(embed_json(video.to_json()))
+                count += 1
+            write("]")
+        page.write(tail)
+
+    return count
+
+
+def _counting(items, counts):
+    """Yield items, counting them in counts["items"]"""
+    for item in items:
+        counts["items"] += 1
+        yield item
+
+
+def _collect_outputs(result, json_file_path, output_dir, content_type, sanitized_data, assets,
+                     payload):
+    """Write the video page or render the fragment for sanitized items"""
+    log = result["messages"].append
+    timings = result["timings"]
+    stem = json_file_path.stem
+    title = format_title(stem)
+
+    # Generate separate HTML for video collections
+    if content_type == "video":
+        output_path = output_dir / f"{stem}.html"
+        data_name = f"{VIDEO_DATA_DIR}/{stem}.json"
+        output_stats = result["output_stats"]
+        with timings.stage("render_video") as counts:
+            count = write_video_page(
+                output_path, sanitized_data, title, assets, payload, output_stats,
+                data_path=output_dir / data_name,
+            )
+            counts["items"] = count
+            counts["bytes_out"] = output_stats.written_bytes + output_stats.skipped_bytes
+        if count:
+            result["outputs"] += [output_path.name, data_name]
+            log(f"  Generated: {output_path.name}")
+    else:
+        # Rows are rendered into the fragment as the sanitizer yields them
+        buffer = io.StringIO()
+        with timings.stage(f"render_{content_type}") as counts:
+            counts["items"] = 0
+            buffer.writelines(iter_collection_html(
+                {"stem": stem, "title": title}, content_type, _counting(sanitized_data, counts)
+            ))
+            count = counts["items"]
+            fragment = buffer.getvalue()
+            counts["bytes_out"] = len(fragment.encode("utf-8"))
+
+    if count == 0:
+        log(f"  Skipped: No valid items after sanitization")
+        result["reason"] = "No valid items"
+        return
+
+    collection = {
+        "filename": json_file_path.name,
+        "stem": stem,
+        "title": title,
+        "type": content_type,
+        "count": count,
+    }
 
-    print(f"Scanning folder: {folder_path}")
+    if content_type != "video":
+        result["fragment"] = fragment
+
+    result["collection"] = collection
+    log(f"  Items: {count}")
+
+
+def process_json_file(json_file_path, output_dir, assets=None, payload="compact"):
+    """
+    Read, detect, validate, sanitize and render a single JSON export.
+
+    Video collections get their own page written to output_dir; other types
+    are rendered to an inactive collection fragment for the home page.
+    Files above STREAMING_THRESHOLD_BYTES are parsed and sanitized item by
+    item instead of being loaded whole.
+    Progress lines are collected in 'messages' rather than printed so the
+    function can run in a worker process.
+
+    Args:
+        json_file_path: Path of the JSON export
+        output_dir: Folder to write generated pages to
+        assets: Dict of shared asset URLs, built in output_dir if None
+        payload: Video data encoding, one of PAYLOAD_FORMATS
+
+    Returns:
+        dict with keys:
+            filename, stat, hash, type: Source file details for the manifest
+            collection: Collection metadata, or None if the file was skipped
+            fragment: Rendered collection HTML for embedded types
+            outputs: Generated files, relative to output_dir
+            reason: Skip reason when collection is None
+            cacheable: Whether the result only depends on the file content
+            output_stats: OutputStats of the files written
+            timings: StageTimings of reading, parsing and rendering the file
+            messages: Progress lines to print for this file
+    """
+    result = {
+        "filename": json_file_path.name,
+        "stat": None,
+        "hash": None,
+        "type": None,
+        "collection": None,
+        "fragment": None,
+        "outputs": [],
+        "reason": None,
+        "cacheable": False,
+        "output_stats": OutputStats(),
+        "timings": StageTimings(),
+        "messages": [],
+    }
+    log = result["messages"].append
+    timings = result["timings"]
+
+    try:
+        if assets is None:
+            assets = build_assets(output_dir)
+
+        result["stat"] = json_file_path.stat()
+        with open(json_file_path, "rb") as f:
+            reader = None
+            if result["stat"].st_size >= STREAMING_THRESHOLD_BYTES and starts_with_array(f):
+                # Parse, detect, validate and sanitize item by item; only
+                # the first items are read here, the rest is timed by the
+                # render stage consuming them
+                reader = HashingReader(f)
+                with timings.stage("detect"):
+                    content_type, sanitized_data, is_valid, reason = validate_and_sanitize_stream(
+                        iter_json_array(reader)
+                    )
+            else:
+                # Read and parse JSON
+                with timings.stage("read") as counts:
+                    raw = f.read()
+                    result["hash"] = hash_bytes(raw)
+                    counts["bytes_in"] = len(raw)
+                with timings.stage("parse"):
+                    json_data = jsonio.loads(raw)
+
+                # Detect content type
+                with timings.stage("detect"):
+                    content_type = detect_content_type(json_data)
+
+                # Validate and sanitize using router
+                with timings.stage("validate"):
+                    is_valid, reason = validate_data(json_data, content_type)
+                sanitized_data = []
+                if is_valid:
+                    with timings.stage("sanitize") as counts:
+                        sanitized_data = sanitize_data(json_data, content_type)
+                        counts["items"] = len(sanitized_data)
+
+            result["type"] = content_type
+            log(f"  Detected type: {content_type}")
+            result["cacheable"] = True
+
+            if is_valid:
+                _collect_outputs(
+                    result, json_file_path, output_dir, content_type, sanitized_data, assets, payload
+                )
+            else:
+                log(f"  Skipped: {reason}")
+                result["reason"] = reason
+
+            if reader is not None:
+                result["hash"] = reader.hexdigest()
+
+    except jsonio.JSONDecodeError as e:
+        reason = f"Invalid JSON: {str(e)[:50]}..."
+        log(f"  Failed: {reason}")
+        result["reason"] = reason
+        result["cacheable"] = True
+        if result["hash"] is None:
+            result["hash"] = hash_file(json_file_path)
+    except Exception as e:
+        reason = f"Error: {str(e)[:50]}..."
+        log(f"  Failed: {reason}")
+        result["reason"] = reason
+        result["cacheable"] = False
+
+    return result
+
+
+def iter_processed_files(json_files, output_dir, jobs=1, assets=None, payload="compact"):
+    """
+    Process JSON files, optionally fanned out to a process pool.
+
+    Results are yielded in the order of json_files regardless of which
+    worker finishes first, so the home page and the log stay deterministic.
+
+    Args:
+        json_files: Paths of the JSON exports to process
+        output_dir: Folder to write generated pages to
+        jobs: Number of worker processes (1 processes in this process)
+        assets: Dict of shared asset URLs, as returned by build_assets()
+        payload: Video data encoding, one of PAYLOAD_FORMATS
+
+    Yields:
+        dict: Result of process_json_file() for each file
+    """
+    if jobs <= 1 or len(json_files) <= 1:
+        for json_file_path in json_files:
+            yield process_json_file(json_file_path, output_dir, assets, payload)
+        return
 
+    with ProcessPoolExecutor(max_workers=min(jobs, len(json_files))) as executor:
+        yield from executor.map(
+            process_json_file, json_files, repeat(output_dir), repeat(assets), repeat(payload)
+        )
+
+
+def find_json_files(folder_path):
+    """Return the JSON exports of a folder, skipping files starting with "-" """
     # Find all JSON files
     json_files = list(folder_path.glob("*.json"))
 
     # Skip files starting with "-"
-    json_files = [f for f in json_files if not f.name.startswith("-")]
+    return [f for f in json_files if not f.name.startswith("-")]
 
-    if not json_files:
-        print("No JSON files found in the folder.")
-        sys.exit(1)
 
-    print(f"Found {len(json_files)} JSON files")
+def build(folder_path, json_files, manifest, jobs=1, payload="compact", lazy=False,
+          profile=None):
+    """
+    Build the video pages and the unified home page for a folder.
+
+    Args:
+        folder_path: Folder holding the JSON exports, also used for output
+        json_files: JSON exports to include
+        manifest: BuildManifest of the previous build, updated in place
+        jobs: Number of worker processes for changed files
+        payload: Video data encoding, one of PAYLOAD_FORMATS
+        lazy: Write embedded collections to their own files, fetched by the
+            home page when their tab is opened
+        profile: BuildProfile to record the stage timings in
+
+    Returns:
+        dict: Build report for live reload, with keys:
+            layout: Digest of the home page navigation and assets; when it
+                changes, open pages need a full reload
+            collections: stem, type, hash, title and count of every
+                collection re-rendered by this build
+    """
+    output_stats = OutputStats()
+    if profile is None:
+        profile = BuildProfile()
+
+    # Shared styles, scripts and tags, written once for all pages
+    with profile.stage("assets"):
+        assets = build_assets(folder_path, output_stats)
+        manifest.sync_inputs("video", get_video_inputs_digest(assets, payload))
 
     # New structure: organize by content type
     successful_collections = {
@@ -105,82 +456,292 @@ def main():
     }
 
     failed_files = []
+    changed_collections = []
+
+    # Only files missing from the manifest or changed since need processing
+    with profile.stage("lookup"):
+        cached_entries = {f.name: manifest.lookup(f) for f in json_files}
+    stale_files = [f for f in json_files if cached_entries[f.name] is None]
+    processed = iter_processed_files(stale_files, folder_path, jobs, assets, payload)
 
     # Process each JSON file
     for json_file_path in json_files:
         filename = json_file_path.name
-        stem = json_file_path.stem
-        title = format_title(stem)
 
         print(f"\nProcessing: {filename}")
 
-        try:
-            # Read and parse JSON
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                json_data = json.load(f)
-
-            # Detect content type
-            content_type = detect_content_type(json_data)
-            print(f"  Detected type: {content_type}")
-
-            # Validate and sanitize using router
-            sanitized_data, is_valid, reason = validate_and_sanitize(json_data, content_type)
-
-            if not is_valid:
-                print(f"  Skipped: {reason}")
-                failed_files.append({"filename": filename, "reason": reason})
-                continue
-
-            if len(sanitized_data) == 0:
-                print(f"  Skipped: No valid items after sanitization")
-                failed_files.append({"filename": filename, "reason": "No valid items"})
-                continue
-
-            # Generate separate HTML for video collections
-            if content_type == "video":
-                html_content = generate_html(sanitized_data, title)
-                output_path = folder_path / f"{stem}.html"
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                print(f"  Generated: {output_path.name}")
-
-            # Store in collections dict for home page
-            successful_collections[content_type].append({
-                "filename": filename,
-                "stem": stem,
-                "title": title,
-                "type": content_type,
-                "count": len(sanitized_data),
-                "data": sanitized_data
-            })
-
-            print(f"  Items: {len(sanitized_data)}")
-
-        except json.JSONDecodeError as e:
-            reason = f"Invalid JSON: {str(e)[:50]}..."
-            print(f"  Failed: {reason}")
-            failed_files.append({"filename": filename, "reason": reason})
+        entry = cached_entries[filename]
+        if entry is not None:
+            count = 0
+            if entry["collection"] is None:
+                print(f"  Unchanged, skipped: {entry['reason']}")
+                failed_files.append({"filename": filename, "reason": entry["reason"]})
+            else:
+                with profile.stage("load_cached"):
+                    collection = manifest.load_collection(entry)
+                successful_collections[entry["type"]].append(collection)
+                count = collection["count"]
+                print(f"  Unchanged: {entry['type']}, {count} items")
+            profile.add_file(filename, entry["type"], items=count, bytes_in=entry["size"], cached=True)
             continue
-        except Exception as e:
-            reason = f"Error: {str(e)[:50]}..."
-            print(f"  Failed: {reason}")
-            failed_files.append({"filename": filename, "reason": reason})
+
+        result = next(processed)
+        for message in result["messages"]:
+            print(message)
+        output_stats.merge(result["output_stats"])
+
+        file_stats = result["output_stats"]
+        profile.add_file(
+            filename,
+            result["type"],
+            result["timings"],
+            items=result["collection"]["count"] if result["collection"] else 0,
+            bytes_in=result["stat"].st_size if result["stat"] else 0,
+            bytes_out=file_stats.written_bytes + file_stats.skipped_bytes
+            + (len(result["fragment"].encode("utf-8")) if result["fragment"] else 0),
+        )
+
+        if result["cacheable"]:
+            with profile.stage("record"):
+                manifest.record(
+                    json_file_path,
+                    result["stat"],
+                    result["hash"],
+                    result["type"],
+                    outputs=result["outputs"],
+                    collection=result["collection"],
+                    fragment=result["fragment"],
+                    reason=result["reason"],
+                )
+
+        if result["collection"] is None:
+            failed_files.append({"filename": filename, "reason": result["reason"]})
             continue
 
+        # Store in collections dict for home page; fragments are only ever
+        # rendered for cacheable results, so record() has just written them
+        collection = dict(result["collection"])
+        if result["fragment"] is not None:
+            collection["fragment_path"] = manifest.fragment_path(collection["stem"])
+        successful_collections[result["type"]].append(collection)
+        changed_collections.append({
+            "stem": collection["stem"],
+            "type": collection["type"],
+            "hash": result["hash"],
+            "title": collection["title"],
+            "count": collection["count"],
+        })
+
+    with profile.stage("fragments"):
+        if lazy:
+            write_collection_fragments(folder_path, successful_collections, output_stats)
+        else:
+            prune_collection_fragments(folder_path)
+        prune_video_data(folder_path, {f"{c['stem']}.json" for c in successful_collections["video"]})
+
     # Generate unified home page
-    generate_unified_home_page(folder_path, successful_collections)
+    with profile.stage("unified_page") as counts:
+        generate_unified_home_page(folder_path, successful_collections, assets, output_stats)
+        counts["items"] = sum(c["count"] for collections in successful_collections.values() for c in collections)
+        counts["bytes_out"] = (folder_path / "index.html").stat().st_size
+    prune_assets(folder_path, assets)
+    with profile.stage("precompress"):
+        manifest.files = precompress_outputs(folder_path, manifest.files, output_stats)
+    with profile.stage("manifest"):
+        manifest.save(f.name for f in json_files)
+    profile.finish()
 
     # Summary
     print(f"\nSummary:")
     for content_type, collections in successful_collections.items():
         if collections:
             print(f"  {content_type.capitalize()}: {len(collections)} collections, {sum(c['count'] for c in collections)} total items")
+    print(f"  Output: {output_stats}")
 
     if failed_files:
         print(f"\nSkipped files:")
         for file_info in failed_files:
             print(f"  • {file_info['filename']}: {file_info['reason']}")
 
+    # The assets of index.html and of the video pages: a new video.js or tag
+    # list must reload open pages too
+    layout = [assets["home_css"], assets["home_js"]] + [assets[name] for name in VIDEO_PAGE_ASSETS]
+    for collections in successful_collections.values():
+        layout.extend(f"{c['type']}/{c['stem']}/{c['title']}" for c in collections)
+    return {
+        "layout": hash_bytes("\0".join(layout).encode("utf-8")),
+        "collections": changed_collections,
+    }
+
+
+def report_profile(profile, cache_dir):
+    """Print the stage tables of a build and save its JSON report"""
+    print(profile.format_tables())
+
+    if profile.python_profile is not None:
+        print(f"\ncProfile (main process), saved to {profile.python_profile['path']}:")
+        print(profile.python_profile["top"].rstrip())
+
+    if profile.memory is not None:
+        print(f"\nTop allocations (main process):")
+        for entry in profile.memory["top"]:
+            print(f"  {entry['size'] / 1024:>10.1f} KiB  {entry['count']:>8} blocks  {entry['location']}")
+
+    path = cache_dir / PROFILE_FILE
+    profile.save(path)
+    print(f"\nProfile saved to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="obsi-dash",
+        description="Generate html dashboards from Obsidian dataview generated JSON data",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the build manifest and rebuild every file",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="process changed files in N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_const",
+        const="columnar",
+        default="compact",
+        dest="payload",
+        help="embed video data as one array per field instead of one object per video",
+    )
+    parser.add_argument(
+        "--lazy-tabs",
+        action="store_true",
+        help="load task, calendar, project and notes collections when their tab is opened",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print wall/CPU time, bytes and items per build stage and file, "
+             "and save them to .obsi-dash/profile.json",
+    )
+    parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="like --profile, and also run the build under cProfile (main process only)",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="like --profile, and also trace memory allocations (main process only)",
+    )
+    parser.add_argument(
+        "-w", "--watch",
+        action="store_true",
+        help="keep running and rebuild whenever a JSON export changes",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="quiet period before a watch rebuild starts (default: 0.5)",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="build, then serve the dashboards over HTTP",
+        description="Build, then serve the output folder with caching headers and precompressed responses",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=8008,
+        help="port to listen on (default: 8008)",
+    )
+    serve_parser.add_argument(
+        "--bind",
+        default="127.0.0.1",
+        metavar="ADDRESS",
+        help="address to listen on (default: 127.0.0.1)",
+    )
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    # Hardcoded folder path
+    folder_path = Path.home() / "share" / "_tmp"
+
+    # Check if folder exists
+    if not folder_path.exists():
+        print(f"Error: Folder '{folder_path}' not found.")
+        print("Please create the folder or update the hardcoded path in the script.")
+        sys.exit(1)
+
+    print(f"Scanning folder: {folder_path}")
+
+    profile = BuildProfile()
+    with profile.stage("glob"):
+        json_files = find_json_files(folder_path)
+
+    if not json_files and not args.watch:
+        print("No JSON files found in the folder.")
+        sys.exit(1)
+
+    print(f"Found {len(json_files)} JSON files")
+
+    # Load previous build state; unchanged files are reused from it
+    manifest = BuildManifest(folder_path) if args.full else BuildManifest.load(folder_path)
+
+    profiling = args.profile or args.cprofile or args.tracemalloc
+    with python_profiling(profile, manifest.cache_dir, args.cprofile, args.tracemalloc):
+        report = build(
+            folder_path, json_files, manifest, jobs, args.payload, args.lazy_tabs, profile
+        )
+    if profiling:
+        report_profile(profile, manifest.cache_dir)
+
+    server = None
+    if args.command == "serve":
+        from playlist_maker.server import DashboardServer
+
+        server = DashboardServer((args.bind, args.port), folder_path, manifest)
+        server.notify_build(report)
+        print(f"\nServing {folder_path} at {server.url}")
+
+    if args.watch:
+        from playlist_maker.watch import watch
+
+        def rebuild(changed):
+            # The manifest stays in memory, so only changed files are re-rendered
+            profile = BuildProfile()
+            with profile.stage("glob"):
+                json_files = find_json_files(folder_path)
+            with python_profiling(profile, manifest.cache_dir, args.cprofile, args.tracemalloc):
+                report = build(
+                    folder_path, json_files, manifest, jobs, args.payload, args.lazy_tabs,
+                    profile,
+                )
+            if profiling:
+                report_profile(profile, manifest.cache_dir)
+            if server is not None:
+                # Open dashboards patch in the re-rendered collections
+                server.notify_build(report)
+
+        if server is not None:
+            server.start()
+        watch(folder_path, rebuild, debounce=args.debounce)
+    elif server is not None:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped serving")
+
+    if server is not None:
+        server.server_close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,262 @@
+"""Build manifest for incremental rebuilds.
+
+The manifest records, for every JSON export in the data folder, the file
+size, mtime, content hash, detected type and the outputs it produced.
+Unchanged files are served from the manifest on the next run instead of
+being parsed, sanitized and rendered again.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from playlist_maker import __version__, jsonio
+
+MANIFEST_DIR = ".obsi-dash"
+MANIFEST_FILE = "manifest.json"
+FRAGMENTS_DIR = "fragments"
+MANIFEST_FORMAT = 1
+
+
+def hash_bytes(data):
+    """Return the hex content hash used throughout the manifest."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """Hash a file's content without loading it all at once."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_builder_digest():
+    """
+    Fingerprint the code that produces the outputs.
+
+    Any change to the package sources or HTML templates invalidates every
+    cached entry, so an upgrade never serves fragments rendered by older code.
+
+    Returns:
+        str: Hex digest of the package version and source files
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    sources = sorted(package_dir.rglob("*.py")) + sorted((package_dir / "html_templates").glob("*"))
+    for source in sources:
+        if source.is_file():
+            digest.update(source.relative_to(package_dir).as_posix().encode("utf-8"))
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Per-file record of the last build, persisted next to the outputs."""
+
+    def __init__(self, output_dir, builder=None):
+        """
+        Initialize an empty manifest.
+
+        Args:
+            output_dir: Folder holding the JSON exports and generated pages
+            builder: Builder digest, computed from the package if None
+        """
+        self.output_dir = Path(output_dir)
+        self.cache_dir = self.output_dir / MANIFEST_DIR
+        self.path = self.cache_dir / MANIFEST_FILE
+        self.builder = builder or get_builder_digest()
+        self.inputs = {}
+        self.entries = {}
+        # Served outputs: size, mtime, ETag and compressed variants
+        self.files = {}
+
+    @classmethod
+    def load(cls, output_dir):
+        """
+        Load the manifest from disk.
+
+        Falls back to an empty manifest when the file is missing, unreadable,
+        or was written by a different format or builder.
+
+        Args:
+            output_dir: Folder holding the JSON exports and generated pages
+
+        Returns:
+            BuildManifest instance
+        """
+        manifest = cls(output_dir)
+        try:
+            stored = jsonio.load(manifest.path)
+        except (OSError, ValueError):
+            return manifest
+
+        if stored.get("format") != MANIFEST_FORMAT or stored.get("builder") != manifest.builder:
+            return manifest
+
+        manifest.inputs = stored.get("inputs", {})
+        manifest.entries = stored.get("entries", {})
+        manifest.files = stored.get("files", {})
+        return manifest
+
+    def save(self, present_files):
+        """
+        Persist the manifest, dropping entries for files that disappeared.
+
+        Args:
+            present_files: Names of the JSON files seen in this run
+        """
+        present = set(present_files)
+        for filename in list(self.entries):
+            if filename not in present:
+                self.forget(filename)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": MANIFEST_FORMAT,
+            "builder": self.builder,
+            "inputs": self.inputs,
+            "entries": self.entries,
+            "files": self.files,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(jsonio.dumps_bytes(payload))
+        os.replace(tmp_path, self.path)
+
+    def lookup_file(self, name, stat):
+        """
+        Return the served-output entry of a file if it describes its content.
+
+        Args:
+            name: Path relative to the output folder
+            stat: os.stat_result of the file
+
+        Returns:
+            dict or None: Entry with 'etag' and 'encodings', or None
+        """
+        entry = self.files.get(name)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        return entry
+
+    def sync_inputs(self, content_type, digest):
+        """
+        Invalidate all entries of a type when a shared input changed.
+
+        Video pages embed the pywal CSS and tags, so a new colour scheme or
+        tag list must re-render them even though their JSON is unchanged.
+
+        Args:
+            content_type: Content type depending on the input
+            digest: Current digest of the input
+        """
+        if self.inputs.get(content_type) != digest:
+            for filename, entry in list(self.entries.items()):
+                if entry.get("type") == content_type:
+                    self.forget(filename)
+            self.inputs[content_type] = digest
+
+    def lookup(self, json_path):
+        """
+        Return the cached entry for a JSON file if it is still up to date.
+
+        Size and mtime are compared first; only when they differ is the
+        content hashed, so a touched but identical file stays cached.
+
+        Args:
+            json_path: Path of the JSON export
+
+        Returns:
+            dict or None: Manifest entry, or None if the file must be rebuilt
+        """
+        entry = self.entries.get(json_path.name)
+        if entry is None:
+            return None
+
+        try:
+            stat = json_path.stat()
+        except OSError:
+            return None
+
+        if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            if entry["size"] != stat.st_size or hash_file(json_path) != entry["hash"]:
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+
+        for output in entry.get("outputs", []):
+            if not (self.output_dir / output).exists():
+                return None
+
+        return entry
+
+    def record(self, json_path, stat, digest, content_type, outputs=(), collection=None,
+               fragment=None, reason=None):
+        """
+        Store the result of processing one JSON file.
+
+        Args:
+            json_path: Path of the JSON export
+            stat: os.stat_result taken before the file was read
+            digest: Content hash of the bytes that were processed
+            content_type: Detected content type (None if detection never ran)
+            outputs: Generated files, relative to the output folder
+            collection: Collection metadata (without data) for the home page
+            fragment: Rendered collection HTML to reuse on the next run
+            reason: Skip reason when the file produced no collection
+        """
+        filename = json_path.name
+        if fragment is None:
+            self.forget(filename)
+
+        outputs = list(outputs)
+        if fragment is not None:
+            # The server reads fragments for live reload: the previous one
+            # stays in place until the new one atomically replaces it
+            from playlist_maker.output import write_text
+
+            fragment_path = self.fragment_path(json_path.stem)
+            write_text(fragment_path, fragment)
+            outputs.append(fragment_path.relative_to(self.output_dir).as_posix())
+
+        self.entries[filename] = {
+            "path": filename,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": digest,
+            "type": content_type,
+            "outputs": outputs,
+            "collection": collection,
+            "has_fragment": fragment is not None,
+            "reason": reason,
+        }
+
+    def forget(self, filename):
+        """Drop a file's entry and its cached fragment."""
+        entry = self.entries.pop(filename, None)
+        if entry and entry.get("has_fragment"):
+            try:
+                self.fragment_path(Path(filename).stem).unlink()
+            except OSError:
+                pass
+
+    def fragment_path(self, stem):
+        """Return where the cached fragment of a collection lives."""
+        return self.cache_dir / FRAGMENTS_DIR / f"{stem}.html"
+
+    def load_collection(self, entry):
+        """
+        Rebuild a home page collection dict from a cached entry.
+
+        Args:
+            entry: Manifest entry returned by lookup()
+
+        Returns:
+            dict: Collection metadata, with 'fragment_path' for embedded
+                types; the fragment is read from it when the page is written
+        """
+        collection = dict(entry["collection"])
+        if entry.get("has_fragment"):
+            collection["fragment_path"] = self.fragment_path(collection["stem"])
+        return collection
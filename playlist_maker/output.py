@@ -0,0 +1,154 @@
+"""Atomic, write-if-changed output files.
+
+Generated files are written to a hidden temporary file next to their
+target and renamed over it, so the server never reads a half-written
+page. When the new content hashes the same as the file on disk, the
+temporary file is dropped instead: the existing file keeps its mtime, and
+with it its ETag, compressed variants and browser cache entries.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from playlist_maker.manifest import hash_bytes, hash_file
+
+
+class OutputStats:
+    """Files and bytes written or left unchanged by a build."""
+
+    __slots__ = ("written_files", "written_bytes", "skipped_files", "skipped_bytes")
+
+    def __init__(self):
+        self.written_files = 0
+        self.written_bytes = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+
+    def record(self, size, written):
+        """
+        Count one output.
+
+        Args:
+            size: Size of the output in bytes
+            written: False if the file on disk already had this content
+        """
+        if written:
+            self.written_files += 1
+            self.written_bytes += size
+        else:
+            self.skipped_files += 1
+            self.skipped_bytes += size
+
+    def merge(self, other):
+        """Add the counts of another OutputStats, e.g. from a worker"""
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def __str__(self):
+        return (
+            f"{self.written_files} files written ({format_size(self.written_bytes)}), "
+            f"{self.skipped_files} unchanged ({format_size(self.skipped_bytes)})"
+        )
+
+
+def format_size(size):
+    """Format a byte count for the run summary, e.g. "1.5 MiB" """
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _temporary_path(path):
+    # Hidden name: the server refuses dot files, so it is never served
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _is_unchanged(path, size, digest):
+    """Whether path holds content of this size and hash"""
+    try:
+        if path.stat().st_size != size:
+            return False
+    except OSError:
+        return False
+    return hash_file(path) == digest
+
+
+def _commit(tmp_path, path, size, digest, stats):
+    """Move a finished temporary file into place unless path is identical"""
+    written = not _is_unchanged(path, size, digest)
+    if written:
+        os.replace(tmp_path, path)
+    else:
+        tmp_path.unlink()
+    if stats is not None:
+        stats.record(size, written)
+    return written
+
+
+def write_bytes(path, data, stats=None):
+    """
+    Write a generated file unless it already has this content.
+
+    Args:
+        path: Path of the output
+        data: New content
+        stats: OutputStats to count the output in, if any
+
+    Returns:
+        bool: True if the file was written, False if it was unchanged
+    """
+    path = Path(path)
+    if _is_unchanged(path, len(data), hash_bytes(data)):
+        if stats is not None:
+            stats.record(len(data), False)
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temporary_path(path)
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    if stats is not None:
+        stats.record(len(data), True)
+    return True
+
+
+def write_text(path, text, stats=None):
+    """UTF-8 counterpart of write_bytes()"""
+    return write_bytes(path, text.encode("utf-8"), stats)
+
+
+@contextmanager
+def open_text(path, stats=None, buffering=-1):
+    """
+    Stream a generated UTF-8 file, committed when the block exits cleanly.
+
+    The content goes to a temporary file first; on success it replaces
+    path unless both hash the same. On error the temporary file is
+    deleted and path is left as it was.
+
+    Args:
+        path: Path of the output
+        stats: OutputStats to count the output in, if any
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Text file object to write to
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temporary_path(path)
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=buffering) as f:
+            yield f
+        _commit(tmp_path, path, tmp_path.stat().st_size, hash_file(tmp_path), stats)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
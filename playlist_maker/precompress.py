@@ -0,0 +1,118 @@
+"""Precompressed copies of the generated pages and assets.
+
+After each build, gzip (and brotli, when the brotli package is installed)
+variants are written next to every page and asset, e.g. index.html.gz, so
+`obsi-dash serve` never compresses on the fly. The content hash computed
+on the way is recorded in the manifest and used as the file's ETag.
+"""
+
+import gzip
+import io
+import os
+
+from playlist_maker.assets import HASHED_DIRS, VIDEO_DATA_DIR
+from playlist_maker.manifest import FRAGMENTS_DIR, MANIFEST_DIR, hash_bytes
+from playlist_maker.output import write_bytes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content-Encoding -> file suffix, most preferred first
+ENCODINGS = {"br": ".br", "gzip": ".gz"} if brotli is not None else {"gzip": ".gz"}
+
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json")
+
+# Smaller files are not worth a compressed variant
+MIN_SIZE = 1024
+
+# Quality 11 is several times slower for a few percent, and index.html is
+# recompressed on every build
+BROTLI_QUALITY = 9
+
+
+def compress(data, encoding):
+    """Compress bytes with a Content-Encoding from ENCODINGS"""
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    # mtime=0 keeps the output identical for identical input; gzip.compress()
+    # only accepts it from Python 3.8
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=9, mtime=0) as f:
+        f.write(data)
+    return buffer.getvalue()
+
+
+def find_served_outputs(output_dir):
+    """Return the generated pages, assets, video data and cached fragments to compress"""
+    candidates = list(output_dir.glob("*.html"))
+    subdirs = [output_dir / name for name in HASHED_DIRS + (VIDEO_DATA_DIR,)]
+    subdirs.append(output_dir / MANIFEST_DIR / FRAGMENTS_DIR)
+    for subdir in subdirs:
+        if subdir.is_dir():
+            candidates += subdir.iterdir()
+    return sorted(
+        path for path in candidates
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES and not path.name.startswith(".")
+    )
+
+
+def _remove_variant(path, suffix):
+    try:
+        os.unlink(f"{path}{suffix}")
+    except OSError:
+        pass
+
+
+def precompress_outputs(output_dir, previous, stats=None):
+    """
+    Hash every served output and write its compressed variants.
+
+    Files whose size and mtime match their previous entry are skipped, so
+    after an incremental build only the rewritten pages are read again.
+    Variants of outputs that no longer exist are deleted.
+
+    Args:
+        output_dir: Folder the pages are generated in
+        previous: Entries returned by the last call (BuildManifest.files)
+        stats: OutputStats to count the variants in, if any
+
+    Returns:
+        dict: Path relative to output_dir -> {"size", "mtime_ns", "etag",
+            "encodings"}
+    """
+    files = {}
+    for path in find_served_outputs(output_dir):
+        name = path.relative_to(output_dir).as_posix()
+        stat = path.stat()
+
+        entry = previous.get(name)
+        if (entry is not None and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and set(entry["encodings"]) <= set(ENCODINGS)):
+            files[name] = entry
+            continue
+
+        data = path.read_bytes()
+        encodings = []
+        for encoding, suffix in ENCODINGS.items():
+            compressed = compress(data, encoding) if len(data) >= MIN_SIZE else data
+            if len(compressed) < len(data):
+                write_bytes(path.with_name(path.name + suffix), compressed, stats)
+                encodings.append(encoding)
+            else:
+                _remove_variant(path, suffix)
+
+        files[name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "etag": hash_bytes(data)[:32],
+            "encodings": encodings,
+        }
+
+    for name in previous.keys() - files.keys():
+        for suffix in (".br", ".gz"):
+            _remove_variant(output_dir / name, suffix)
+
+    return files
@@ -0,0 +1,255 @@
+"""Build stage timing for `obsi-dash --profile`.
+
+Every build records wall and CPU time, bytes and item counts for each of
+its stages: the build-wide ones (glob, manifest lookup, assets, home
+page, precompression, ...) and, for every processed JSON export, read,
+parse, detect, validate, sanitize and render. Worker processes time their
+own files and send the timings back with their results, so CPU times are
+those of the process doing the work and wall times of parallel files
+overlap.
+
+With --profile the stages are printed as tables after the summary and
+saved to .obsi-dash/profile.json. --cprofile and --tracemalloc add a
+Python profile dump and the top allocation sites of the main process.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from playlist_maker import jsonio
+from playlist_maker.output import format_size
+
+PROFILE_FILE = "profile.json"
+PSTATS_FILE = "profile.pstats"
+
+# Entries listed by --cprofile and --tracemalloc
+TOP_ENTRIES = 15
+
+STAGE_FIELDS = ("calls", "wall", "cpu", "bytes_in", "bytes_out", "items")
+
+
+class StageTimings:
+    """Wall/CPU time, bytes and items of named stages."""
+
+    __slots__ = ("stages",)
+
+    def __init__(self):
+        # name -> {"calls", "wall", "cpu", "bytes_in", "bytes_out", "items"}
+        self.stages = {}
+
+    def add(self, name, wall=0.0, cpu=0.0, bytes_in=0, bytes_out=0, items=0, calls=1):
+        """Count one run of a stage"""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = dict.fromkeys(STAGE_FIELDS, 0)
+        stage["calls"] += calls
+        stage["wall"] += wall
+        stage["cpu"] += cpu
+        stage["bytes_in"] += bytes_in
+        stage["bytes_out"] += bytes_out
+        stage["items"] += items
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a block as one run of a stage.
+
+        Yields:
+            dict: Counts of the run; set "bytes_in", "bytes_out" or "items"
+                in it to record them
+        """
+        counts = {}
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield counts
+        finally:
+            self.add(name, time.perf_counter() - wall, time.process_time() - cpu, **counts)
+
+    def merge(self, other):
+        """Add the stages of another StageTimings"""
+        for name, stage in other.stages.items():
+            self.add(name, **stage)
+
+    def total(self, field):
+        """Sum of one field over all stages"""
+        return sum(stage[field] for stage in self.stages.values())
+
+    def to_json(self):
+        return {name: dict(stage) for name, stage in self.stages.items()}
+
+
+class BuildProfile:
+    """Stage timings of one build, by stage and by JSON export."""
+
+    def __init__(self):
+        self.build = StageTimings()
+        # filename -> {"type", "cached", "items", "bytes_in", "bytes_out", "timings"}
+        self.files = {}
+        self.memory = None
+        self.python_profile = None
+        self._start = (time.perf_counter(), time.process_time())
+        self.wall = None
+        self.cpu = None
+
+    def stage(self, name):
+        """Time a build-wide stage, see StageTimings.stage()"""
+        return self.build.stage(name)
+
+    def add_file(self, filename, content_type, timings=None, items=0, bytes_in=0, bytes_out=0,
+                 cached=False):
+        """
+        Record the stages of one JSON export.
+
+        Args:
+            filename: Name of the export
+            content_type: Detected content type, or None
+            timings: StageTimings of processing it; None when it was reused
+                from the manifest
+            items: Number of items in its collection
+            bytes_in: Size of the export
+            bytes_out: Size of the outputs rendered from it
+            cached: Whether it was reused from the manifest
+        """
+        self.files[filename] = {
+            "type": content_type,
+            "cached": cached,
+            "items": items,
+            "bytes_in": bytes_in,
+            "bytes_out": bytes_out,
+            "timings": timings or StageTimings(),
+        }
+
+    def finish(self):
+        """Stop the build clock"""
+        self.wall = time.perf_counter() - self._start[0]
+        self.cpu = time.process_time() - self._start[1]
+
+    def get_stage_totals(self):
+        """Return StageTimings of the build stages plus every file's stages"""
+        totals = StageTimings()
+        totals.merge(self.build)
+        for entry in self.files.values():
+            totals.merge(entry["timings"])
+        return totals
+
+    def to_json(self):
+        """Return the profile as a JSON-serializable dict"""
+        return {
+            "backend": jsonio.BACKEND,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "stages": self.get_stage_totals().to_json(),
+            "build": self.build.to_json(),
+            "files": {
+                filename: dict(entry, timings=entry["timings"].to_json())
+                for filename, entry in self.files.items()
+            },
+            "memory": self.memory,
+            "python_profile": self.python_profile,
+        }
+
+    def save(self, path):
+        """Write the profile as JSON to path"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(jsonio.dumps(self.to_json(), indent=2), encoding="utf-8")
+
+    def format_tables(self):
+        """Return the stage and file tables printed by --profile"""
+        lines = [
+            "",
+            "Stages:",
+            f"  {'stage':<16} {'calls':>6} {'wall ms':>10} {'cpu ms':>10} "
+            f"{'in':>10} {'out':>10} {'items':>8}",
+        ]
+        for name, stage in self.get_stage_totals().stages.items():
+            lines.append(
+                f"  {name:<16} {stage['calls']:>6} {stage['wall'] * 1000:>10.1f} "
+                f"{stage['cpu'] * 1000:>10.1f} {_format_bytes(stage['bytes_in']):>10} "
+                f"{_format_bytes(stage['bytes_out']):>10} {stage['items']:>8}"
+            )
+
+        lines += [
+            "",
+            "Files:",
+            f"  {'file':<28} {'type':<9} {'items':>7} {'in':>10} {'out':>10} "
+            f"{'wall ms':>10} {'cpu ms':>10}  slowest stage",
+        ]
+        by_wall = sorted(self.files.items(), key=lambda item: -item[1]["timings"].total("wall"))
+        for filename, entry in by_wall:
+            timings = entry["timings"]
+            if entry["cached"]:
+                slowest = "(unchanged)"
+            elif timings.stages:
+                slowest = max(timings.stages, key=lambda name: timings.stages[name]["wall"])
+            else:
+                slowest = ""
+            lines.append(
+                f"  {filename[:28]:<28} {entry['type'] or '-':<9} {entry['items']:>7} "
+                f"{_format_bytes(entry['bytes_in']):>10} {_format_bytes(entry['bytes_out']):>10} "
+                f"{timings.total('wall') * 1000:>10.1f} {timings.total('cpu') * 1000:>10.1f}  {slowest}"
+            )
+
+        lines.append("")
+        lines.append(f"  Total: {self.wall * 1000:.1f} ms wall, {self.cpu * 1000:.1f} ms CPU (main process)")
+        if self.memory is not None:
+            lines.append(f"  Peak traced memory: {format_size(self.memory['peak'])}")
+        return "\n".join(lines)
+
+
+def _format_bytes(size):
+    return format_size(size) if size else "-"
+
+
+@contextmanager
+def python_profiling(profile, cache_dir, cprofile=False, trace_memory=False):
+    """
+    Run a block under cProfile and/or tracemalloc.
+
+    Only the calling process is profiled; with --jobs the work done in
+    worker processes is not included.
+
+    Args:
+        profile: BuildProfile to attach the results to
+        cache_dir: Folder to write the cProfile dump to
+        cprofile: Collect a cProfile profile, dumped to PSTATS_FILE
+        trace_memory: Trace allocations with tracemalloc
+
+    Yields:
+        None
+    """
+    profiler = cProfile.Profile() if cprofile else None
+    if trace_memory:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            path = Path(cache_dir) / PSTATS_FILE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(path)
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(TOP_ENTRIES)
+            profile.python_profile = {"path": str(path), "top": report.getvalue()}
+
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            profile.memory = {
+                "current": current,
+                "peak": peak,
+                "top": [
+                    {"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+                    for stat in snapshot.statistics("lineno")[:TOP_ENTRIES]
+                ],
+            }
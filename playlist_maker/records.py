@@ -0,0 +1,172 @@
+"""Record types for sanitized items.
+
+Sanitizers return these instead of one dict per item: with __slots__ they
+take a fraction of the memory, and strings repeated across a vault
+(statuses, channels, file paths) are interned so each is stored once.
+"""
+
+import sys
+
+
+def intern_str(value):
+    """Intern a str, so repeated values share one object; other values are returned as is"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Record:
+    """Base class for sanitized items"""
+
+    __slots__ = ()
+
+    # Attributes whose JSON key differs from the attribute name
+    JSON_KEYS = {}
+
+    def to_json(self):
+        """
+        Return the item as a JSON-serializable dict.
+
+        Keys and their order match the dicts the sanitizers used to build,
+        so embedded data is unchanged for the page scripts.
+        """
+        json_keys = self.JSON_KEYS
+        return {json_keys.get(name, name): getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class VideoItem(Record):
+    """A video of a playlist"""
+
+    __slots__ = ("id", "summary", "duration", "channel", "date", "locator",
+                 "thumbnail", "watched", "tags", "file", "line")
+
+    def __init__(self, id, summary, duration, channel, date, locator,
+                 thumbnail, watched, tags, file, line):
+        self.id = id
+        self.summary = summary
+        self.duration = duration
+        self.channel = intern_str(channel)
+        self.date = date
+        self.locator = locator
+        self.thumbnail = thumbnail
+        self.watched = watched
+        self.tags = tags
+        self.file = intern_str(file)
+        self.line = line
+
+
+class TaskItem(Record):
+    """A task line"""
+
+    __slots__ = ("id", "title", "status", "description", "due_date", "priority",
+                 "active", "focus", "file", "line")
+
+    def __init__(self, id, title, status, description, due_date, priority,
+                 active, focus, file, line):
+        self.id = intern_str(id)
+        self.title = title
+        self.status = intern_str(status)
+        self.description = description
+        self.due_date = due_date
+        self.priority = intern_str(priority)
+        self.active = active
+        self.focus = focus
+        self.file = intern_str(file)
+        self.line = line
+
+
+class CalendarEvent(Record):
+    """A scheduled calendar entry"""
+
+    __slots__ = ("id", "title", "scheduled", "location", "status", "description",
+                 "attendees", "file", "line")
+
+    def __init__(self, id, title, scheduled, location, status, description,
+                 attendees, file, line):
+        self.id = intern_str(id)
+        self.title = title
+        self.scheduled = scheduled
+        self.location = intern_str(location)
+        self.status = intern_str(status)
+        self.description = description
+        self.attendees = attendees
+        self.file = intern_str(file)
+        self.line = line
+
+
+class ProjectItem(Record):
+    """A project note"""
+
+    __slots__ = ("id", "title", "workspace", "class_name", "status", "progress",
+                 "due_date", "description", "active", "focus", "file", "line")
+
+    JSON_KEYS = {"class_name": "class"}
+
+    def __init__(self, id, title, workspace, class_name, status, progress,
+                 due_date, description, active, focus, file, line):
+        self.id = intern_str(id)
+        self.title = title
+        self.workspace = intern_str(workspace)
+        self.class_name = intern_str(class_name)
+        self.status = intern_str(status)
+        self.progress = progress
+        self.due_date = due_date
+        self.description = description
+        self.active = active
+        self.focus = focus
+        self.file = intern_str(file)
+        self.line = line
+
+
+class NoteItem(Record):
+    """A note"""
+
+    __slots__ = ("id", "title", "description", "status", "active", "focus",
+                 "file", "line")
+
+    def __init__(self, id, title, description, status, active, focus, file, line):
+        self.id = intern_str(id)
+        self.title = title
+        self.description = description
+        self.status = intern_str(status)
+        self.active = active
+        self.focus = focus
+        self.file = intern_str(file)
+        self.line = line
+
+
+def records_to_json(records):
+    """Convert a list of records to a list of JSON-serializable dicts"""
+    return [record.to_json() for record in records]
+
+
+def records_to_columns(records):
+    """
+    Convert records of one type to parallel arrays, one per JSON key.
+
+    Key names are written once instead of once per item, which shrinks
+    embedded payloads considerably for long lists.
+
+    Args:
+        records: Iterable of records of the same type
+
+    Returns:
+        dict: JSON key -> list of values, in record order
+    """
+    columns = None
+    for record in records:
+        if columns is None:
+            names = record.__slots__
+            json_keys = record.JSON_KEYS
+            columns = {json_keys.get(name, name): [] for name in names}
+            appends = [(name, columns[json_keys.get(name, name)].append) for name in names]
+        for name, append in appends:
+            append(getattr(record, name))
+    return columns or {}
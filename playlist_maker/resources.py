@@ -0,0 +1,52 @@
+"""Process-wide cache of the input files every page depends on.
+
+The pywal colour scheme, the tag list and the HTML templates are read once
+and kept in memory. Later lookups only stat the file, so watch mode picks
+up a new colour scheme, tag list or template on the next rebuild without
+reading unchanged files again.
+"""
+
+from pathlib import Path
+
+# (path, loader) -> ((size, mtime_ns), value)
+_cache = {}
+
+
+def cached_file(path, load, missing=None):
+    """
+    Return a value derived from a file, recomputed only when it changes.
+
+    Args:
+        path: Path of the file
+        load: Function reading the value from the path; cached values are
+            keyed by it too, so one file can back several values
+        missing: Value returned when the file does not exist
+
+    Returns:
+        load(path) for the current version of the file, or missing
+    """
+    path = Path(path)
+    key = (path, load)
+    try:
+        stat = path.stat()
+    except OSError:
+        _cache.pop(key, None)
+        return missing
+
+    version = (stat.st_size, stat.st_mtime_ns)
+    cached = _cache.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, load(path))
+        _cache[key] = cached
+    return cached[1]
+
+
+def read_text(path):
+    """Read a UTF-8 text file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def clear():
+    """Forget all cached values"""
+    _cache.clear()
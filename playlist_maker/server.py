@@ -0,0 +1,422 @@
+"""HTTP server for the generated dashboards.
+
+Serves the output folder like `python -m http.server`, but with:
+
+- strong ETags taken from the build manifest and 304 responses to
+  conditional requests,
+- the gzip/brotli variants written at build time (see precompress.py),
+- HTTP/1.1 keep-alive,
+- long-lived caching of content-hashed assets,
+- file contents kept in memory until the file changes on disk,
+- a Server-Sent Events stream announcing watch mode rebuilds, with the
+  cached collection fragments the home page patches itself with.
+"""
+
+import json
+import mimetypes
+import posixpath
+import threading
+import time
+from collections import deque
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from playlist_maker.assets import HASHED_DIRS
+from playlist_maker.manifest import hash_bytes
+from playlist_maker.precompress import ENCODINGS
+
+DEFAULT_PORT = 8008
+
+# Hashed asset and fragment names change with their content, so they can
+# be cached for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Pages keep their URL across builds: always revalidate with the ETag
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+CACHE_LIMIT_BYTES = 64 * 1024 * 1024
+
+# Endpoints of the live reload channel; dashboards never use this prefix
+EVENTS_PATH = "/__obsi-dash/events"
+FRAGMENTS_PREFIX = "/__obsi-dash/fragments/"
+
+# Comment lines sent on idle event streams so proxies keep them open
+KEEPALIVE_SECONDS = 15
+
+# Events a slow client can fall behind by before it is told to reload
+EVENT_HISTORY = 16
+
+
+class FileCache:
+    """In-memory file contents, invalidated by size and mtime."""
+
+    def __init__(self, limit=CACHE_LIMIT_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            limit: Total bytes to keep before evicting the oldest files
+        """
+        self.limit = limit
+        self._files = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def read(self, path, stat):
+        """
+        Return a file's content and hash, reading it only if it changed.
+
+        Args:
+            path: Path of the file
+            stat: os.stat_result of the file
+
+        Returns:
+            tuple: (bytes, hex digest)
+        """
+        key = str(path)
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+                return cached[2], cached[3]
+
+        data = path.read_bytes()
+        digest = hash_bytes(data)[:32]
+
+        with self._lock:
+            previous = self._files.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[2])
+            if len(data) <= self.limit:
+                self._files[key] = (stat.st_size, stat.st_mtime_ns, data, digest)
+                self._size += len(data)
+                # Dicts keep insertion order, so the first key is the oldest
+                while self._size > self.limit:
+                    oldest = self._files.pop(next(iter(self._files)))
+                    self._size -= len(oldest[2])
+
+        return data, digest
+
+
+# Sent instead of events a client can no longer be given
+RELOAD_EVENT = json.dumps({"reload": True, "collections": []})
+
+
+class EventChannel:
+    """Fan out build events to every connected event stream."""
+
+    def __init__(self, history=EVENT_HISTORY):
+        self._condition = threading.Condition()
+        self._events = deque(maxlen=history)
+        # Ids start at the channel's creation time in milliseconds, so an id
+        # sent by an earlier server run is never mistaken for one of ours
+        self.first_id = self.last_id = int(time.time() * 1000)
+
+    def publish(self, data):
+        """
+        Send an event to all streams.
+
+        Args:
+            data: JSON-serializable event payload
+        """
+        with self._condition:
+            self.last_id += 1
+            self._events.append((self.last_id, json.dumps(data)))
+            self._condition.notify_all()
+
+    def wait(self, last_id, timeout):
+        """
+        Wait for events published after last_id.
+
+        Args:
+            last_id: Id of the last event the caller has seen
+            timeout: Seconds to wait
+
+        Returns:
+            list: (id, JSON data) tuples, empty on timeout. A caller that
+                missed events already dropped from the history gets a
+                single reload event instead.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.last_id != last_id, timeout)
+            events = [event for event in self._events if event[0] > last_id]
+            if events and events[0][0] != last_id + 1:
+                return [(self.last_id, RELOAD_EVENT)]
+            return events
+
+    def resume_id(self, header):
+        """
+        Return the id a reconnecting stream resumes from.
+
+        Args:
+            header: Value of the client's Last-Event-ID header
+
+        Returns:
+            int: The id, or None if this channel never sent it
+        """
+        try:
+            last_id = int(header)
+        except ValueError:
+            return None
+        with self._condition:
+            return last_id if self.first_id <= last_id <= self.last_id else None
+
+
+def etag_matches(header, etag):
+    """
+    Evaluate an If-None-Match header (weak comparison, RFC 7232).
+
+    Args:
+        header: Header value, e.g. '"abc", W/"def"' or '*'
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in header.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+def accepted_encodings(header):
+    """
+    Return the content codings an Accept-Encoding header allows.
+
+    A '*' coding allows every coding of ENCODINGS the header does not
+    list on its own.
+
+    Args:
+        header: Header value, e.g. 'gzip, br;q=0.5' or '*;q=1, gzip;q=0'
+
+    Returns:
+        set: Allowed codings, lowercase
+    """
+    allowed = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if coding:
+            allowed[coding] = params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    accepted = {coding for coding, ok in allowed.items() if ok}
+    if allowed.get("*"):
+        accepted.update(coding for coding in ENCODINGS if coding not in allowed)
+    return accepted
+
+
+class DashboardRequestHandler(BaseHTTPRequestHandler):
+    """Serve GET and HEAD requests from the server's output folder."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "obsi-dash"
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            # Client closed a keep-alive connection between requests
+            pass
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        if urlsplit(self.path).path == EVENTS_PATH:
+            # An event stream has no end, so there is no length to report
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._serve(send_body=False)
+
+    def _resolve(self):
+        """Map the request path to a file, or None for hidden or missing paths"""
+        request_path = posixpath.normpath(unquote(urlsplit(self.path).path))
+        parts = [part for part in request_path.split("/") if part]
+        # Hidden files include the manifest folder and in-progress writes
+        if any(part.startswith(".") for part in parts):
+            return None, None
+
+        path = self.server.root.joinpath(*parts)
+        if path.is_dir():
+            parts.append("index.html")
+            path = path / "index.html"
+        if not path.is_file():
+            return None, None
+        return path, "/".join(parts)
+
+    def _serve_events(self):
+        """
+        Stream build events until the client disconnects.
+
+        A client reconnecting with a Last-Event-ID gets the events it
+        missed, or a reload event when the id is unknown or already dropped
+        from the history.
+        """
+        channel = self.server.events
+        last_id = channel.last_id
+        missed = []
+        header = self.headers.get("Last-Event-ID")
+        if header is not None:
+            resumed = channel.resume_id(header)
+            if resumed is None:
+                missed = [(last_id, RELOAD_EVENT)]
+            else:
+                last_id = resumed
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            if missed:
+                self._write_events(missed)
+            while True:
+                events = channel.wait(last_id, KEEPALIVE_SECONDS)
+                if events:
+                    self._write_events(events)
+                    last_id = events[-1][0]
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _write_events(self, events):
+        """Send (id, JSON data) events on the stream"""
+        for event_id, data in events:
+            self.wfile.write(f"id: {event_id}\nevent: build\ndata: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _resolve_fragment(self):
+        """Map a fragment URL to the collection HTML cached by the build"""
+        stem = unquote(urlsplit(self.path).path[len(FRAGMENTS_PREFIX):])
+        if not stem.endswith(".html") or "/" in stem or stem.startswith("."):
+            return None, None
+        path = self.server.manifest.fragment_path(stem[:-len(".html")])
+        if not path.is_file():
+            return None, None
+        return path, path.relative_to(self.server.manifest.output_dir).as_posix()
+
+    def _serve(self, send_body):
+        request_path = urlsplit(self.path).path
+        if request_path == EVENTS_PATH:
+            self._serve_events()
+            return
+
+        if request_path.startswith(FRAGMENTS_PREFIX):
+            path, name = self._resolve_fragment()
+        else:
+            path, name = self._resolve()
+        if path is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        stat = path.stat()
+        entry = self.server.manifest.lookup_file(name, stat)
+        is_hashed = name.partition("/")[0] in HASHED_DIRS
+        headers = {
+            "Content-Type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if is_hashed else REVALIDATE_CACHE_CONTROL,
+        }
+
+        encoding = None
+        if entry is not None:
+            etag = entry["etag"]
+            if entry["encodings"]:
+                headers["Vary"] = "Accept-Encoding"
+                accepted = accepted_encodings(self.headers.get("Accept-Encoding", ""))
+                encoding = next((e for e in ENCODINGS if e in entry["encodings"] and e in accepted), None)
+        else:
+            # Not produced by the build (e.g. a JSON export): hash it ourselves
+            etag = self.server.cache.read(path, stat)[1]
+
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+            headers["ETag"] = f'"{etag}-{encoding}"'
+        else:
+            headers["ETag"] = f'"{etag}"'
+
+        if etag_matches(self.headers.get("If-None-Match", ""), headers["ETag"]):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for key in ("ETag", "Cache-Control", "Vary"):
+                if key in headers:
+                    self.send_header(key, headers[key])
+            self.end_headers()
+            return
+
+        if encoding is not None:
+            variant = path.with_name(path.name + ENCODINGS[encoding])
+            try:
+                body = self.server.cache.read(variant, variant.stat())[0]
+            except OSError:
+                # Variant deleted since the build: fall back to the original
+                del headers["Content-Encoding"]
+                headers["ETag"] = f'"{etag}"'
+                body = self.server.cache.read(path, stat)[0]
+        else:
+            body = self.server.cache.read(path, stat)[0]
+
+        self.send_response(HTTPStatus.OK)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+class DashboardServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to an output folder and its manifest."""
+
+    daemon_threads = True
+
+    def __init__(self, address, folder_path, manifest):
+        """
+        Bind the server.
+
+        Args:
+            address: (host, port) tuple
+            folder_path: Output folder to serve
+            manifest: BuildManifest providing ETags; watch mode updates it
+        """
+        super().__init__(address, DashboardRequestHandler)
+        self.root = Path(folder_path).resolve()
+        self.manifest = manifest
+        self.cache = FileCache()
+        self.events = EventChannel()
+        self._layout = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def notify_build(self, report):
+        """
+        Tell open dashboards what a build changed.
+
+        Args:
+            report: Dict returned by main.build()
+        """
+        if self._layout is None:
+            # Initial build: pages are loaded from it, nothing to announce
+            self._layout = report["layout"]
+            return
+
+        reload = report["layout"] != self._layout
+        self._layout = report["layout"]
+        if reload or report["collections"]:
+            self.events.publish({"reload": reload, "collections": report["collections"]})
+
+    def start(self):
+        """Serve from a background thread"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
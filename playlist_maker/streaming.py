@@ -0,0 +1,151 @@
+"""Incremental parsing of large JSON exports.
+
+Dataview exports are a single top-level array. For big files the items are
+parsed one at a time instead of loading the whole document, using ijson
+(with its C backend when compiled) if it is installed and a pure-Python
+parser built on json.JSONDecoder.raw_decode otherwise.
+"""
+
+import codecs
+import hashlib
+import json
+import re
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files at least this large are parsed item by item
+STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that could still extend a number cut at the end of the buffer
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+
+
+class HashingReader:
+    """Binary file wrapper that hashes everything read through it."""
+
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.digest.update(data)
+        return data
+
+    def hexdigest(self):
+        """Return the hash of the whole file, reading whatever is left"""
+        while self.read(CHUNK_SIZE):
+            pass
+        return self.digest.hexdigest()
+
+
+def starts_with_array(f):
+    """
+    Check whether a binary file holds a top-level JSON array.
+
+    The file position is restored afterwards.
+
+    Args:
+        f: File opened in binary mode
+
+    Returns:
+        bool: True if the first non-whitespace character is '['
+    """
+    position = f.tell()
+    head = f.read(1024)
+    f.seek(position)
+    return head.lstrip(codecs.BOM_UTF8).lstrip(b" \t\n\r")[:1] == b"["
+
+
+def _iter_array_pure(reader, chunk_size=CHUNK_SIZE):
+    """Yield the items of a top-level JSON array using only the stdlib"""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    pos = 0
+    eof = False
+    state = "start"
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+
+        if pos == len(buffer) or state == "value_incomplete":
+            if eof:
+                if state == "end":
+                    return
+                raise json.JSONDecodeError("Unexpected end of data", buffer, pos)
+            chunk = reader.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+            pos = 0
+            if state == "value_incomplete":
+                state = "value"
+            continue
+
+        char = buffer[pos]
+
+        if state == "end":
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+        elif state == "start":
+            if char != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, pos)
+            pos += 1
+            state = "first"
+        elif state in ("first", "value"):
+            if char == "]" and state == "first":
+                pos += 1
+                state = "end"
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                state = "value_incomplete"
+                continue
+            if not eof and _NUMBER_TAIL.match(buffer, end):
+                # A number cut by the chunk boundary parses as a shorter one
+                state = "value_incomplete"
+                continue
+            pos = end
+            state = "separator"
+            yield value
+        else:
+            if char == ",":
+                pos += 1
+                state = "value"
+            elif char == "]":
+                pos += 1
+                state = "end"
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+
+
+def iter_json_array(reader):
+    """
+    Yield the items of a top-level JSON array one at a time.
+
+    Args:
+        reader: Binary file-like object (e.g. a HashingReader)
+
+    Yields:
+        Parsed items
+
+    Raises:
+        json.JSONDecodeError: If the document is not a valid array
+    """
+    if ijson is None:
+        yield from _iter_array_pure(reader)
+        return
+
+    try:
+        yield from ijson.items(reader, "item", use_float=True)
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0)
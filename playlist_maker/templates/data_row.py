@@ -10,8 +10,18 @@ Field Mapping by Type:
 - Calendar: date → status → title → location → (no actions)
 - Projects: status → title → active/focus
 - Notes: status → title (+ description) → active/focus
+
+Icons reference the symbols of the sprite the home page includes once
+(SVGIcons.get_sprite) instead of repeating their markup in every row.
+
+Task, project and notes tables are virtualized: their rows are embedded as
+compact JSON (see create_table_row_data) and the home page script renders
+only the rows near the viewport, with the same cells as the functions below.
 """
 
+from itertools import chain
+
+from ..jsonio import embed_json
 from ..utils.svg_icons import SVGIcons
 
 
@@ -70,6 +80,16 @@ def get_table_styles():
         border-bottom: none;
     }
 
+    /* Virtualized tables: padding rows stand in for the rows not drawn */
+    .table-spacer td {
+        padding: 0;
+        border: none;
+    }
+
+    .virtual-table .data-row:nth-last-child(2) {
+        border-bottom: none;
+    }
+
     /* State styles */
     .data-row.active {
         background: var(--bg-light);
@@ -376,7 +396,7 @@ def create_status_cell(status):
     Returns:
         str: HTML for status cell
     """
-    icon = SVGIcons.get_status_icon(status)
+    icon = SVGIcons.get_status_icon_ref(status)
     if icon:
         return f"""
         <td class="status-cell status-icon-cell" data-status="{status}">
@@ -443,35 +463,100 @@ def create_state_toggles_html(item_id, is_active=False, is_focused=False):
     </td>"""
 
 
-def _render_collection_base(
-    collection_info, content_type, empty_message, rows_html, is_first=False
-):
+def create_table_row_data(item, description=""):
+    """
+    Pack an item into the compact row a virtualized table renders.
+
+    The home page script builds the same cells as create_status_cell,
+    create_title_cell and create_state_toggles_html from it.
+
+    Args:
+        item: TaskItem, ProjectItem or NoteItem
+        description: Description shown under the title (notes only)
+
+    Returns:
+        list: [id, status, title, description, file, line, active, focus]
+    """
+    return [item.id, item.status, item.title, description, item.file, item.line,
+            bool(item.active), bool(item.focus)]
+
+
+def _iter_virtual_collection(collection_info, content_type, rows, is_first=False):
+    """
+    Render a collection whose table rows are drawn by the home page script.
+
+    Args:
+        collection_info: Dict with 'title' and 'stem' keys
+        content_type: Type of collection ('task', 'project', 'notes')
+        rows: Iterable of row lists returned by create_table_row_data
+        is_first: Whether this is the first collection (makes it active)
+
+    Yields:
+        str: HTML of the collection, one row's JSON at a time
+    """
+    is_active = "active" if is_first else ""
+
+    yield f"""
+    <section class="collection {is_active}" data-type="{content_type}" data-title="{collection_info['title']}" id="{collection_info['stem']}-collection">
+        <h3>{collection_info['title']}</h3>
+        <table class="data-table {content_type}-table virtual-table">
+            <tbody></tbody>
+        </table>
+        <script type="application/json" class="table-rows">["""
+    separator = ""
+    for row in rows:
+        yield separator + embed_json(row)
+        separator = ","
+    yield """]</script>
+    </section>"""
+
+
+def _iter_collection_base(collection_info, content_type, rows, is_first=False):
     """
     Base function for rendering any collection as a table.
 
     Args:
-        collection_info: Dict with 'title', 'stem', and 'data' keys
+        collection_info: Dict with 'title' and 'stem' keys
         content_type: Type of collection ('task', 'calendar', 'project')
-        empty_message: Message to show when no data
-        rows_html: HTML string for table rows
+        rows: Iterable of table row HTML strings
         is_first: Whether this is the first collection (makes it active)
 
-    Returns:
-        str: HTML for collection table
+    Yields:
+        str: HTML of the collection, one row at a time
     """
     is_active = "active" if is_first else ""
 
-    return f"""
+    yield f"""
     <section class="collection {is_active}" data-type="{content_type}" data-title="{collection_info['title']}" id="{collection_info['stem']}-collection">
         <h3>{collection_info['title']}</h3>
         <table class="data-table {content_type}-table">
             <tbody>
-                {rows_html}
+                """
+    yield from rows
+    yield """
             </tbody>
         </table>
     </section>"""
 
 
+def activate_collection_html(collection_html):
+    """
+    Mark a collection rendered with is_first=False as the active one.
+
+    Used for collections restored from the build cache, which are always
+    rendered inactive so that the same fragment works at any position.
+
+    Args:
+        collection_html: HTML returned by a render_*_collection function
+
+    Returns:
+        str: Same HTML with the section marked active
+    """
+    return collection_html.replace(
+        '<section class="collection "', '<section class="collection active"', 1
+    )
+
+
 def _render_empty_collection(
     collection_info, content_type, empty_message, is_first=False
 ):
@@ -496,6 +581,26 @@ def _render_empty_collection(
     </section>"""
 
 
+def render_lazy_collection(collection_info, is_first=False):
+    """
+    Render the placeholder of a collection fetched on first activation.
+
+    Args:
+        collection_info: Dict with 'title', 'stem', 'type' and 'fragment_url' keys
+        is_first: Whether this is the first collection (makes it active)
+
+    Returns:
+        str: HTML for the collection placeholder
+    """
+    is_active = "active" if is_first else ""
+
+    return f"""
+    <section class="collection {is_active}" data-type="{collection_info['type']}" data-title="{collection_info['title']}" id="{collection_info['stem']}-collection" data-fragment-url="{collection_info['fragment_url']}">
+        <h3>{collection_info['title']}</h3>
+        <div class="empty-message">Loading...</div>
+    </section>"""
+
+
 def render_task_collection(collection_info, is_first=False):
     """
     Render a single task collection as a table.
@@ -506,43 +611,15 @@ def render_task_collection(collection_info, is_first=False):
     3. Action cell (active/focus toggles)
 
     Args:
-        collection_info: Dict with 'title' and 'data' keys
+        collection_info: Dict with 'title' and 'data' (TaskItem list) keys
         is_first: Whether this is the first collection (makes it active)
 
     Returns:
         str: HTML for task collection table
     """
-    tasks = collection_info.get("data", [])
-
-    if not tasks:
-        return _render_empty_collection(
-            collection_info, "task", "No tasks found", is_first
-        )
-
-    rows_html = ""
-    for task in tasks:
-        status = task.get("status", "")
-        title_cell = create_title_cell(
-            task.get("title", ""), "", task.get("file", ""), task.get("line", 1)
-        )
-
-        metadata_html = create_status_cell(status)
-
-        toggles_html = create_state_toggles_html(
-            task["id"], task.get("active", False), task.get("focus", False)
-        )
-
-        row_html = f"""
-    <tr class="data-row" data-id="{task['id']}" data-type="task">
-        {metadata_html}
-        {title_cell}
-        {toggles_html}
-    </tr>"""
-        rows_html += row_html
-
-    return _render_collection_base(
-        collection_info, "task", "No tasks found", rows_html, is_first
-    )
+    return "".join(iter_collection_html(
+        collection_info, "task", collection_info.get("data", []), is_first
+    ))
 
 
 def render_calendar_collection(collection_info, is_first=False):
@@ -557,37 +634,32 @@ def render_calendar_collection(collection_info, is_first=False):
     5. Action cell (empty - no active/focus toggles)
 
     Args:
-        collection_info: Dict with 'title' and 'data' keys
+        collection_info: Dict with 'title' and 'data' (CalendarEvent list) keys
         is_first: Whether this is the first collection (makes it active)
 
     Returns:
         str: HTML for calendar collection table
     """
-    events = collection_info.get("data", [])
+    return "".join(iter_collection_html(
+        collection_info, "calendar", collection_info.get("data", []), is_first
+    ))
 
-    if not events:
-        return _render_empty_collection(
-            collection_info, "calendar", "No events found", is_first
-        )
 
-    rows_html = ""
+def _iter_calendar_rows(events):
+    """Yield the table row HTML of each CalendarEvent"""
+    calendar_icon = SVGIcons.get_calendar_icon_ref(
+        'style="width:14px;height:14px;display:inline;margin-right:4px;vertical-align:middle;"'
+    )
+
     for event in events:
-        title_cell = create_title_cell(
-            event.get("title", ""), "", event.get("file", ""), event.get("line", 1)
-        )
-        scheduled = event.get("scheduled", "")
-        scheduled = event.get("scheduled", "")
-        location = event.get("location", "")
-        status = event.get("status", "")
+        title_cell = create_title_cell(event.title, "", event.file, event.line)
+        scheduled = event.scheduled
+        location = event.location
+        status = event.status
 
         extra_fields_html = f"""
         <td class="scheduled-cell">
-            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" style="width:14px;height:14px;display:inline;margin-right:4px;vertical-align:middle;">
-                <rect x="3" y="4" width="18" height="18" rx="2" ry="2"/>
-                <line x1="16" y1="2" x2="16" y2="6"/>
-                <line x1="8" y1="2" x2="8" y2="6"/>
-                <line x1="3" y1="10" x2="21" y2="10"/>
-            </svg>
+            {calendar_icon}
             {scheduled}
         </td>{create_status_cell(status)}"""
 
@@ -596,18 +668,14 @@ def render_calendar_collection(collection_info, is_first=False):
             {location}
         </td>"""
 
-        rows_html += f"""
-    <tr class="data-row" data-id="{event['id']}" data-type="calendar">
+        yield f"""
+    <tr class="data-row" data-id="{event.id}" data-type="calendar">
         {extra_fields_html}
         {title_cell}
         {location_html}
         <td class="action-cell"></td>
     </tr>"""
 
-    return _render_collection_base(
-        collection_info, "calendar", "No events found", rows_html, is_first
-    )
-
 
 def render_project_collection(collection_info, is_first=False):
     """
@@ -619,45 +687,15 @@ def render_project_collection(collection_info, is_first=False):
     3. Action cell (active/focus toggles)
 
     Args:
-        collection_info: Dict with 'title' and 'data' keys
+        collection_info: Dict with 'title' and 'data' (ProjectItem list) keys
         is_first: Whether this is the first collection (makes it active)
 
     Returns:
         str: HTML for project collection table
     """
-    projects = collection_info.get("data", [])
-
-    if not projects:
-        return _render_empty_collection(
-            collection_info, "project", "No projects found", is_first
-        )
-
-    rows_html = ""
-    for project in projects:
-        title_cell = create_title_cell(
-            project.get("title", ""),
-            "",
-            project.get("file", ""),
-            project.get("line", 1),
-        )
-        status = project.get("status", "")
-
-        metadata_html = create_status_cell(status)
-
-        toggles_html = create_state_toggles_html(
-            project["id"], project.get("active", False), project.get("focus", False)
-        )
-
-        rows_html += f"""
-    <tr class="data-row" data-id="{project['id']}" data-type="project">
-        {metadata_html}
-        {title_cell}
-        {toggles_html}
-    </tr>"""
-
-    return _render_collection_base(
-        collection_info, "project", "No projects found", rows_html, is_first
-    )
+    return "".join(iter_collection_html(
+        collection_info, "project", collection_info.get("data", []), is_first
+    ))
 
 
 def render_notes_collection(collection_info, is_first=False):
@@ -670,42 +708,67 @@ def render_notes_collection(collection_info, is_first=False):
     3. Action cell (active/focus toggles)
 
     Args:
-        collection_info: Dict with 'title' and 'data' keys
+        collection_info: Dict with 'title' and 'data' (NoteItem list) keys
         is_first: Whether this is the first collection (makes it active)
 
     Returns:
         str: HTML for notes collection table
     """
-    notes = collection_info.get("data", [])
+    return "".join(iter_collection_html(
+        collection_info, "notes", collection_info.get("data", []), is_first
+    ))
 
-    if not notes:
-        return _render_empty_collection(
-            collection_info, "notes", "No notes found", is_first
-        )
 
-    rows_html = ""
-    for note in notes:
-        title_cell = create_title_cell(
-            note.get("title", ""),
-            note.get("description", ""),
-            note.get("file", ""),
-            note.get("line", 1),
-        )
-        status = note.get("status", "active")
+# Message shown by an empty collection of each embedded content type
+EMPTY_COLLECTION_MESSAGES = {
+    "task": "No tasks found",
+    "calendar": "No events found",
+    "project": "No projects found",
+    "notes": "No notes found",
+}
 
-        metadata_html = create_status_cell(status)
 
-        toggles_html = create_state_toggles_html(
-            note["id"], note.get("active", False), note.get("focus", False)
+def iter_collection_html(collection_info, content_type, items, is_first=False):
+    """
+    Render a collection of any embedded type chunk by chunk.
+
+    Items are taken from the iterable one at a time and each row is yielded
+    once rendered, so a sanitizer generator is rendered without its items
+    ever being held in a list.
+
+    Args:
+        collection_info: Dict with 'title' and 'stem' keys
+        content_type: One of EMPTY_COLLECTION_MESSAGES
+        items: Iterable of sanitized records of that type
+        is_first: Whether this is the first collection (makes it active)
+
+    Yields:
+        str: Consecutive chunks of the collection HTML
+    """
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        yield _render_empty_collection(
+            collection_info, content_type, EMPTY_COLLECTION_MESSAGES[content_type], is_first
         )
+        return
 
-        rows_html += f"""
-    <tr class="data-row" data-id="{note['id']}" data-type="notes">
-        {metadata_html}
-        {title_cell}
-        {toggles_html}
-    </tr>"""
+    items = chain((first,), items)
+    if content_type == "calendar":
+        yield from _iter_collection_base(collection_info, content_type, _iter_calendar_rows(items), is_first)
+        return
 
-    return _render_collection_base(
-        collection_info, "notes", "No notes found", rows_html, is_first
-    )
+    if content_type == "notes":
+        rows = (create_table_row_data(note, note.description) for note in items)
+    else:
+        rows = (create_table_row_data(item) for item in items)
+    yield from _iter_virtual_collection(collection_info, content_type, rows, is_first)
+
+
+# Renderer used for each embedded content type
+COLLECTION_RENDERERS = {
+    "task": render_task_collection,
+    "calendar": render_calendar_collection,
+    "project": render_project_collection,
+    "notes": render_notes_collection,
+}
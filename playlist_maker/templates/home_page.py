@@ -1,5 +1,7 @@
 """Home page template with modular dashboard and sidebar components."""
 
+import html
+
 try:
     from .dashboard_widgets import (
         get_initiatives_table_widget,
@@ -274,22 +276,22 @@ def get_playlists_sidebar_html(successful_files):
         </div>
         """
     
-    html = f"""
+    parts = [f"""
         <div class="sidebar">
             {get_playlists_sidebar_header()}
-"""
+"""]
     
     for file_info in successful_files:
         link = f"{file_info['stem']}.html"
         name = file_info['title']
         count = file_info['count']
-        html += get_playlist_row(name, count, link)
+        parts.append(get_playlist_row(name, count, link))
     
-    html += f"""
+    parts.append(f"""
             {get_playlists_sidebar_footer()}
-"""
+""")
     
-    return html
+    return "".join(parts)
 
 
 def get_home_page_footer():
@@ -351,72 +353,19 @@ def get_home_page_html(pywal_css, successful_files):
     )
     
     # Replace placeholders with actual data
-    for placeholder, content in replacements.items():
-        html = html.replace(placeholder, content)
+    from ..utils.templates import substitute_placeholders
+    return substitute_placeholders(html, replacements)
 
-    return html
 
-
-def get_unified_home_page_html(pywal_css, successful_collections):
+def get_unified_page_styles():
     """
-    Generate complete unified home page HTML.
+    Return the CSS of the unified home page, including the table styles.
 
-    Args:
-        pywal_css: CSS variables from pywal
-        successful_collections: Dict with collections by type
-
-    Returns:
-        str: Complete HTML
+    Written once per build as a shared asset instead of being inlined.
     """
-    from .data_row import (
-        render_task_collection,
-        render_calendar_collection,
-        render_project_collection,
-        render_notes_collection,
-        get_table_styles
-    )
-    from .unified_page_js import get_unified_page_javascript
-
-    tabs_html = _build_tabs_html(successful_collections)
-    video_links_html = _build_video_links_html(successful_collections.get("video", []))
-    task_subtabs_html = _build_sub_tabs_html(successful_collections.get("task", []), "task")
-    project_subtabs_html = _build_sub_tabs_html(successful_collections.get("project", []), "project")
-    calendar_subtabs_html = _build_sub_tabs_html(successful_collections.get("calendar", []), "calendar")
-    notes_subtabs_html = _build_sub_tabs_html(successful_collections.get("notes", []), "notes")
-
-    embedded_content = {}
-    embedded_content["tasks"] = "\n".join([
-        render_task_collection(coll, idx == 0)
-        for idx, coll in enumerate(successful_collections.get("task", []))
-    ])
-
-    embedded_content["calendar"] = "\n".join([
-        render_calendar_collection(coll, idx == 0)
-        for idx, coll in enumerate(successful_collections.get("calendar", []))
-    ])
-
-    embedded_content["projects"] = "\n".join([
-        render_project_collection(coll, idx == 0)
-        for idx, coll in enumerate(successful_collections.get("project", []))
-    ])
-
-    embedded_content["notes"] = "\n".join([
-        render_notes_collection(coll, idx == 0)
-        for idx, coll in enumerate(successful_collections.get("notes", []))
-    ])
+    from .data_row import get_table_styles
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dashboard</title>
-    <link rel="icon" type="image/svg+xml" href="data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='24' height='24' viewBox='0 0 24 24' fill='none' stroke='currentColor' stroke-width='2' stroke-linecap='round' stroke-linejoin='round'%3E%3Cpath d='m12 14 4-4'/%3E%3Cpath d='M3.34 19a10 10 0 1 1 17.32 0'/%3E%3C/svg%3E">
-    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700&family=Source+Sans+Pro:wght@300;400;600;700&family=JetBrains+Mono:wght@400;500&display=swap">
-    <style>
-        {pywal_css}
-
-        :root {{
+    return f"""        :root {{
             --bg-light: #f8f7f4;
             --bg-cream: #f1efea;
             --bg-paper: #ffffff;
@@ -1027,9 +976,64 @@ def get_unified_home_page_html(pywal_css, successful_collections):
                 grid-template-columns: 1fr;
             }}
         }}
-    </style>
+"""
+
+
+# Embedded tabs of the unified home page: (tab id, content type, empty message)
+EMBEDDED_TABS = (
+    ("tasks", "task", "No tasks found"),
+    ("calendar", "calendar", "No calendar events found"),
+    ("projects", "project", "No projects found"),
+    ("notes", "notes", "No notes found"),
+)
+
+
+def get_unified_home_page_html(assets, successful_collections):
+    """
+    Generate complete unified home page HTML.
+
+    Args:
+        assets: Dict of shared asset URLs, as returned by build_assets()
+        successful_collections: Dict with collections by type
+
+    Returns:
+        str: Complete HTML
+    """
+    return "".join(iter_unified_home_page_html(assets, successful_collections))
+
+
+def iter_unified_home_page_html(assets, successful_collections):
+    """
+    Generate the unified home page HTML piece by piece.
+
+    Embedded collections arrive already rendered by the build; each one is
+    yielded as its own chunk, so the page is never joined into one string.
+
+    Args:
+        assets: Dict of shared asset URLs, as returned by build_assets()
+        successful_collections: Dict with collections by type
+
+    Yields:
+        str: Consecutive chunks of the page
+    """
+    from ..utils.svg_icons import SVGIcons
+
+    tabs_html = _build_tabs_html(successful_collections)
+    video_links_html = _build_video_links_html(successful_collections.get("video", []))
+
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Dashboard</title>
+    <link rel="icon" type="image/svg+xml" href="data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='24' height='24' viewBox='0 0 24 24' fill='none' stroke='currentColor' stroke-width='2' stroke-linecap='round' stroke-linejoin='round'%3E%3Cpath d='m12 14 4-4'/%3E%3Cpath d='M3.34 19a10 10 0 1 1 17.32 0'/%3E%3C/svg%3E">
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700&family=Source+Sans+Pro:wght@300;400;600;700&family=JetBrains+Mono:wght@400;500&display=swap">
+    <link rel="stylesheet" href="{assets['app_css']}">
+    <link rel="stylesheet" href="{assets['home_css']}">
 </head>
 <body>
+    {SVGIcons.get_sprite()}
     <div class="tabs">
         {tabs_html}
         <button id="refresh-btn" class="refresh-button" title="Refresh all data">
@@ -1046,43 +1050,70 @@ def get_unified_home_page_html(pywal_css, successful_collections):
                 <!-- Video fragment content will be rendered here -->
             </div>
         </div>
+"""
 
-        <div class="tab-content" id="tasks-content">
-            <div class="sub-tabs" id="tasks-subtabs">
-                {task_subtabs_html if task_subtabs_html else ''}
-            </div>
-            {embedded_content["tasks"] if embedded_content["tasks"] else '<div class="empty-message">No tasks found</div>'}
-        </div>
-
-        <div class="tab-content" id="calendar-content">
-            <div class="sub-tabs" id="calendar-subtabs">
-                {calendar_subtabs_html if calendar_subtabs_html else ''}
-            </div>
-            {embedded_content["calendar"] if embedded_content["calendar"] else '<div class="empty-message">No calendar events found</div>'}
-        </div>
-
-        <div class="tab-content" id="projects-content">
-            <div class="sub-tabs" id="projects-subtabs">
-                {project_subtabs_html if project_subtabs_html else ''}
+    for tab_id, content_type, empty_message in EMBEDDED_TABS:
+        collections = successful_collections.get(content_type, [])
+        subtabs_html = _build_sub_tabs_html(collections, content_type)
+        yield f"""
+        <div class="tab-content" id="{tab_id}-content">
+            <div class="sub-tabs" id="{tab_id}-subtabs">
+                {subtabs_html if subtabs_html else ''}
             </div>
-            {embedded_content["projects"] if embedded_content["projects"] else '<div class="empty-message">No projects found</div>'}
+            """
+        if collections:
+            yield from _iter_embedded_collections(collections)
+        else:
+            yield f'<div class="empty-message">{empty_message}</div>'
+        yield """
         </div>
+"""
 
-        <div class="tab-content" id="notes-content">
-            <div class="sub-tabs" id="notes-subtabs">
-                {notes_subtabs_html if notes_subtabs_html else ''}
-            </div>
-            {embedded_content["notes"] if embedded_content["notes"] else '<div class="empty-message">No notes found</div>'}
-        </div>
-    </div>
+    yield f"""    </div>
 
-    <script>
-        {get_unified_page_javascript()}
-     </script>
+    <script src="{assets['tags_js']}"></script>
+    <script src="{assets['video_js']}"></script>
+    <script src="{assets['home_js']}"></script>
 </body>
 </html>"""
 
 
+# Characters of a cached fragment read at a time while index.html is written
+FRAGMENT_CHUNK_SIZE = 1 << 16
+
+
+def _iter_embedded_collections(collections):
+    """
+    Yield the rendered collections of one tab.
+
+    Every collection carries the 'fragment_path' of its pre-rendered,
+    inactive fragment, which is copied chunk by chunk so no fragment is
+    held whole in memory; only the first one needs to be marked active.
+    Collections with a 'fragment_url' (--lazy-tabs) only get a placeholder
+    that the page script replaces with the fragment when it is shown.
+
+    Args:
+        collections: List of collection dicts for one content type
+
+    Yields:
+        str: HTML of each collection, newline separated
+    """
+    from .data_row import activate_collection_html, render_lazy_collection
+
+    for idx, coll in enumerate(collections):
+        if idx > 0:
+            yield "\n"
+        if coll.get("fragment_url"):
+            yield render_lazy_collection(coll, idx == 0)
+            continue
+        with open(coll["fragment_path"], "r", encoding="utf-8") as f:
+            # The fragment opens with its <section> tag, so the first chunk has it
+            chunk = f.read(FRAGMENT_CHUNK_SIZE)
+            yield activate_collection_html(chunk) if idx == 0 else chunk
+            for chunk in iter(lambda: f.read(FRAGMENT_CHUNK_SIZE), ""):
+                yield chunk
+
+
 def _build_tabs_html(successful_collections):
     """Build tab buttons HTML."""
     tabs = []
@@ -1129,6 +1160,8 @@ def _build_video_links_html(video_collections):
     if not video_collections:
         return ""
 
+    from ..assets import VIDEO_DATA_DIR
+
     links = []
     for collection in video_collections:
         title = collection['title']
@@ -1137,7 +1170,8 @@ def _build_video_links_html(video_collections):
             title = title[:-7]
 
         links.append(f'''
-        <a href="#" data-video-url="{collection['stem']}.html" class="collection-link video-link">
+        <a href="{collection['stem']}.html" data-data-url="{VIDEO_DATA_DIR}/{collection['stem']}.json"
+           data-title="{html.escape(collection['title'])}" class="collection-link video-link">
             <div class="collection-title">{title}</div>
             <div class="collection-count">{collection['count']} videos</div>
         </a>''')
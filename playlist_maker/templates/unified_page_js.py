@@ -3,6 +3,10 @@ Unified home page JavaScript code.
 Extracted for better maintainability and debugging.
 """
 
+from ..jsonio import dumps
+from ..utils.svg_icons import SVGIcons
+
+
 def get_unified_page_javascript():
     """
     Return JavaScript code for the unified home page.
@@ -12,72 +16,109 @@ def get_unified_page_javascript():
     - Large, difficult-to-debug strings
     - Confusion between Python and JavaScript syntax
     """
+    from ..assets import VIDEO_DATA_DIR
+
+    status_icons = dumps(SVGIcons.get_status_symbol_ids())
+
     return """
-        // Video fragment loading
+        // Sprite symbols of the status cell icons, by status value
+        const STATUS_ICONS = """ + status_icons + """;
+
+        // Folder of the video data files, relative to index.html
+        const VIDEO_DATA_DIR = """ + dumps(VIDEO_DATA_DIR) + """;
+
+        // Video collections are rendered in place from their <stem>.json data
+        // file by the video page script, which index.html already loads
         let currentVideoUrl = null;
 
+        // Collections opened last render again without a request
+        const VIDEO_CACHE_SIZE = 8;
+
+        // Decoded video data by URL, least recently used first
+        const videoCollections = new Map();
+
+        // Incremented by each load, so a slow response cannot replace a newer one
+        let videoLoadToken = 0;
+
+        function fetchVideoCollection(url) {
+            let request = videoCollections.get(url);
+            if (request) {
+                videoCollections.delete(url);
+            } else {
+                request = fetch(url).then(response => {
+                    if (!response.ok) {
+                        throw new Error(response.status + ' ' + response.statusText);
+                    }
+                    return response.json();
+                }).then(decodeVideoData);
+                // Failed requests are retried on the next open
+                request.catch(() => {
+                    if (videoCollections.get(url) === request) {
+                        videoCollections.delete(url);
+                    }
+                });
+            }
+            videoCollections.set(url, request);
+            while (videoCollections.size > VIDEO_CACHE_SIZE) {
+                videoCollections.delete(videoCollections.keys().next().value);
+            }
+            return request;
+        }
+
         // Video link clicks - using window-level event delegation for reliability
         window.addEventListener('click', (e) => {
             const link = e.target.closest('.video-link');
             if (link) {
                 e.preventDefault();
-                const videoUrl = link.dataset.videoUrl;
-                if (videoUrl) {
-                    loadVideoFragment(videoUrl);
+                if (link.dataset.dataUrl) {
+                    loadVideoFragment(link);
                 }
             }
         });
 
-        // Load video fragment dynamically
-        async function loadVideoFragment(url) {
+        // Start downloading a collection as soon as its link is hovered or focused
+        function prefetchVideoCollection(e) {
+            const link = e.target.closest && e.target.closest('.video-link');
+            if (link && link.dataset.dataUrl) {
+                fetchVideoCollection(link.dataset.dataUrl).catch(() => {});
+            }
+        }
+        document.addEventListener('mouseover', prefetchVideoCollection, { passive: true });
+        document.addEventListener('focusin', prefetchVideoCollection);
+
+        // Show the collection of a video link
+        async function loadVideoFragment(link) {
+            const url = link.dataset.dataUrl;
             const listContainer = document.getElementById('video-list-container');
             const fragmentContainer = document.getElementById('video-fragment-container');
-            const videosContent = document.getElementById('videos-content');
+            const token = ++videoLoadToken;
 
-            // Show loading state
             listContainer.style.display = 'none';
             fragmentContainer.style.display = 'block';
-            fragmentContainer.innerHTML = '<div style="text-align: center; padding: 3rem;">Loading...</div>';
-
-            try {
-                const response = await fetch(url);
-                const html = await response.text();
-
-                // Parse the HTML
-                const parser = new DOMParser();
-                const doc = parser.parseFromString(html, 'text/html');
-
-                // Extract the header (title, stats)
-                const header = doc.querySelector('.header');
-                const stats = doc.querySelector('#stats');
-                const videoGrid = doc.querySelector('#videoGrid');
-                const videoScript = doc.querySelector('script');
-
-                // Build fragment HTML
-                let fragmentHtml = '';
-                if (header) {
-                    fragmentHtml += '<div class="header">' + header.innerHTML + '</div>';
-                }
-                if (stats) {
-                    fragmentHtml += '<div id="stats">' + stats.innerHTML + '</div>';
-                }
-                if (videoGrid) {
-                    fragmentHtml += '<div class="video-grid" id="videoGrid">' + videoGrid.innerHTML + '</div>';
-                }
+            currentVideoUrl = url;
 
-                // Render fragment
-                fragmentContainer.innerHTML = fragmentHtml;
+            const request = fetchVideoCollection(url);
+            // Only show the loading state when the data has to be downloaded
+            let settled = false;
+            request.then(() => { settled = true; }, () => { settled = true; });
+            await Promise.resolve();
+            if (!settled && token === videoLoadToken) {
+                fragmentContainer.innerHTML = '<div style="text-align: center; padding: 3rem;">Loading...</div>';
+            }
 
-                // Execute the video page script to initialize functionality
-                if (videoScript) {
-                    const script = document.createElement('script');
-                    script.textContent = videoScript.textContent;
-                    fragmentContainer.appendChild(script);
+            try {
+                const videoData = await request;
+                if (token !== videoLoadToken) {
+                    return;
                 }
-
-                currentVideoUrl = url;
+                fragmentContainer.innerHTML = '<div class="header"><h1></h1></div><div id="stats"></div><div class="video-grid" id="videoGrid"></div>';
+                fragmentContainer.querySelector('h1').textContent = link.dataset.title;
+                renderVideoCollection(videoData);
             } catch (error) {
-                console.error('Error loading video fragment:', error);
+                if (token !== videoLoadToken) {
+                    return;
+                }
+                console.error('Error loading video collection:', error);
                 fragmentContainer.innerHTML = '<div style="text-align: center; padding: 3rem;">Error loading video collection. <a href="#" onclick="showVideoList()">Try again</a></div>';
             }
         }
@@ -87,12 +128,301 @@ def get_unified_page_javascript():
             const listContainer = document.getElementById('video-list-container');
             const fragmentContainer = document.getElementById('video-fragment-container');
 
+            videoLoadToken++;
             listContainer.style.display = 'block';
             fragmentContainer.style.display = 'none';
             fragmentContainer.innerHTML = '';
             currentVideoUrl = null;
         }
 
+        // Swap a collection section for freshly rendered HTML, keeping it shown if it was
+        function replaceCollection(section, html) {
+            const template = document.createElement('template');
+            template.innerHTML = html.trim();
+            const replacement = template.content.firstElementChild;
+            replacement.classList.toggle('active', section.classList.contains('active'));
+            section.replaceWith(replacement);
+            scheduleTables();
+        }
+
+        // Virtualized task/project/notes tables: rows come from the JSON next
+        // to each table, and only the rows near the viewport are in the DOM.
+        // Rows outside the window are replaced by two spacer rows, and row
+        // elements leaving the window are reused for the ones entering it.
+        const TABLE_OVERSCAN_ROWS = 10;
+        const tableStates = new WeakMap();
+        let tableFrame = null;
+
+        // Same cells as create_status_cell, create_title_cell and create_state_toggles_html.
+        // Like the server-rendered rows, a row only gets its active/focused
+        // classes once they are toggled; className keeps them across redraws
+        function fillTableRow(row, item, index, type, className) {
+            const [id, status, title, description, file, line, active, focus] = item;
+            const icon = STATUS_ICONS[status];
+            const statusCell = icon
+                ? `<td class="status-cell status-icon-cell" data-status="${status}"><svg viewBox="0 0 24 24" width="24" height="24"><use href="#${icon}"/></svg></td>`
+                : `<td class="status-cell">${status}</td>`;
+            const titleLink = file
+                ? `<a href="#" class="title-link" data-file="${file}" data-line="${line}">${title}</a>`
+                : `<div class="title">${title}</div>`;
+            const descriptionHtml = description ? `<div class="description">${description}</div>` : '';
+
+            row.className = className || 'data-row';
+            row.dataset.id = id;
+            row.dataset.type = type;
+            row.dataset.index = index;
+            row.innerHTML = statusCell
+                + `<td class="title-cell">${titleLink}${descriptionHtml}</td>`
+                + '<td class="action-cell">'
+                + `<button class="toggle-toggle toggle-active ${active ? 'active' : 'inactive'}" data-id="${id}" title="Toggle active">Active</button> `
+                + `<button class="toggle-toggle toggle-focus ${focus ? 'focused' : 'unfocused'}" data-id="${id}" title="Toggle focus">Focus</button>`
+                + '</td>';
+        }
+
+        // Virtualized rows are redrawn from their data when scrolled back into
+        // view: the buttons from the item, the row from its class names. Rows
+        // start without active/focused classes, so only the button tells the
+        // item's state
+        function recordRowToggle(state, row, button) {
+            const index = Number(row.dataset.index);
+            const item = state.rows[index];
+            if (button.classList.contains('toggle-active')) {
+                item[6] = button.classList.contains('active');
+            } else {
+                item[7] = button.classList.contains('focused');
+            }
+            state.classNames.set(index, row.className);
+        }
+
+        function createTableSpacer() {
+            const spacer = document.createElement('tr');
+            spacer.className = 'table-spacer';
+            spacer.hidden = true;
+            spacer.innerHTML = '<td colspan="3"></td>';
+            return spacer;
+        }
+
+        // Height assumed for rows of a table before any of its rows is measured
+        const TABLE_ROW_HEIGHT_ESTIMATE = 48;
+
+        // Rows are parsed from the table's JSON when the table is first shown
+        function getTableState(table) {
+            let state = tableStates.get(table);
+            if (!state) {
+                state = {
+                    rows: null,
+                    heights: null,
+                    type: table.closest('.collection').dataset.type,
+                    body: table.tBodies[0],
+                    top: createTableSpacer(),
+                    bottom: createTableSpacer(),
+                    rendered: new Map(),
+                    // Row index -> class names set by the toggle buttons
+                    classNames: new Map(),
+                    pool: [],
+                };
+                state.body.append(state.top, state.bottom);
+                tableStates.set(table, state);
+            }
+            return state;
+        }
+
+        // Row heights of a table: measured rows keep their own height, the
+        // others are estimated at the average measured height. Prefix sums of
+        // the measured heights and counts are kept in Fenwick trees, so the
+        // offset of any row is found in O(log n) on tables of any size.
+        function createRowHeights(total) {
+            return {
+                total: total,
+                measured: new Float64Array(total).fill(-1),
+                sums: new Float64Array(total + 1),
+                counts: new Float64Array(total + 1),
+                sum: 0,
+                count: 0,
+            };
+        }
+
+        function addToTree(tree, index, delta) {
+            for (let i = index + 1; i < tree.length; i += i & -i) {
+                tree[i] += delta;
+            }
+        }
+
+        function sumOfTree(tree, end) {
+            let sum = 0;
+            for (let i = end; i > 0; i -= i & -i) {
+                sum += tree[i];
+            }
+            return sum;
+        }
+
+        function estimatedRowHeight(heights) {
+            return heights.count ? heights.sum / heights.count : TABLE_ROW_HEIGHT_ESTIMATE;
+        }
+
+        // Distance from the top of the table body to the top of a row
+        function rowOffset(heights, index) {
+            const measured = sumOfTree(heights.counts, index);
+            return sumOfTree(heights.sums, index) + (index - measured) * estimatedRowHeight(heights);
+        }
+
+        // Index of the row at a distance from the top of the table body
+        function rowAtOffset(heights, offset) {
+            let low = 0;
+            let high = heights.total;
+            while (low < high) {
+                const middle = (low + high) >> 1;
+                if (rowOffset(heights, middle + 1) <= offset) {
+                    low = middle + 1;
+                } else {
+                    high = middle;
+                }
+            }
+            return low;
+        }
+
+        // Record the height of a drawn row; returns true if it changed
+        function measureRow(heights, index, height) {
+            const previous = heights.measured[index];
+            if (previous === height) {
+                return false;
+            }
+            if (previous < 0) {
+                addToTree(heights.counts, index, 1);
+                heights.count++;
+                heights.sum += height;
+                addToTree(heights.sums, index, height);
+            } else {
+                heights.sum += height - previous;
+                addToTree(heights.sums, index, height - previous);
+            }
+            heights.measured[index] = height;
+            return true;
+        }
+
+        // Draw the rows of a table in or near the viewport; returns true if
+        // a drawn row's height differed from its estimate, so the spacers
+        // and the window must be computed again
+        function renderTable(table) {
+            const state = getTableState(table);
+            if (table.offsetParent === null) {
+                // Collection or tab not shown: nothing to measure against
+                return false;
+            }
+            if (state.rows === null) {
+                state.rows = JSON.parse(table.parentElement.querySelector('.table-rows').textContent);
+            }
+
+            const total = state.rows.length;
+            if (state.heights === null) {
+                state.heights = createRowHeights(total);
+            }
+            const heights = state.heights;
+            const top = state.body.getBoundingClientRect().top;
+            const first = Math.max(0, rowAtOffset(heights, -top) - TABLE_OVERSCAN_ROWS);
+            const last = Math.min(total, rowAtOffset(heights, window.innerHeight - top) + 1 + TABLE_OVERSCAN_ROWS);
+
+            for (const [index, row] of state.rendered) {
+                if (index < first || index >= last) {
+                    row.remove();
+                    state.rendered.delete(index);
+                    state.pool.push(row);
+                }
+            }
+
+            const firstKept = state.rendered.size ? Math.min(...state.rendered.keys()) : last;
+            const before = [];
+            const after = [];
+            for (let index = first; index < last; index++) {
+                if (state.rendered.has(index)) {
+                    continue;
+                }
+                const row = state.pool.pop() || document.createElement('tr');
+                fillTableRow(row, state.rows[index], index, state.type, state.classNames.get(index));
+                state.rendered.set(index, row);
+                (index < firstKept ? before : after).push(row);
+            }
+            state.top.after(...before);
+            state.bottom.before(...after);
+
+            let changed = false;
+            for (const [index, row] of state.rendered) {
+                changed = measureRow(heights, index, row.offsetHeight) || changed;
+            }
+
+            const topHeight = rowOffset(heights, first);
+            const bottomHeight = rowOffset(heights, total) - rowOffset(heights, last);
+            state.top.hidden = first === 0;
+            state.top.firstChild.style.height = topHeight + 'px';
+            state.bottom.hidden = last === total;
+            state.bottom.firstChild.style.height = bottomHeight + 'px';
+
+            return changed;
+        }
+
+        function renderTables() {
+            tableFrame = null;
+            let again = false;
+            document.querySelectorAll('.virtual-table').forEach(table => {
+                again = renderTable(table) || again;
+            });
+            if (again) {
+                scheduleTables();
+            }
+        }
+
+        function scheduleTables() {
+            if (tableFrame === null) {
+                tableFrame = requestAnimationFrame(renderTables);
+            }
+        }
+
+        window.addEventListener('scroll', scheduleTables, { passive: true });
+        window.addEventListener('resize', () => {
+            // Row heights depend on the table width: measure them again
+            document.querySelectorAll('.virtual-table').forEach(table => {
+                const state = tableStates.get(table);
+                if (state && state.heights) {
+                    state.heights = createRowHeights(state.heights.total);
+                }
+            });
+            scheduleTables();
+        });
+
+        // Collection fragments already requested, by URL (--lazy-tabs)
+        const fragmentCache = new Map();
+
+        function fetchFragment(url) {
+            if (!fragmentCache.has(url)) {
+                const request = fetch(url).then(response => {
+                    if (!response.ok) {
+                        throw new Error('HTTP ' + response.status);
+                    }
+                    return response.text();
+                });
+                // Failed requests are retried on the next activation
+                request.catch(() => fragmentCache.delete(url));
+                fragmentCache.set(url, request);
+            }
+            return fragmentCache.get(url);
+        }
+
+        // Replace the placeholders of shown collections with their fragment
+        async function loadActiveCollections(container) {
+            const placeholders = container.querySelectorAll('.collection.active[data-fragment-url]');
+            for (const section of placeholders) {
+                try {
+                    const html = await fetchFragment(section.dataset.fragmentUrl);
+                    if (section.isConnected) {
+                        replaceCollection(section, html);
+                    }
+                } catch (error) {
+                    console.error('Error loading collection:', error);
+                    section.querySelector('.empty-message').textContent = 'Error loading collection.';
+                }
+            }
+        }
+
         // Tab switching
         document.querySelectorAll('.tab-button').forEach(button => {
             button.addEventListener('click', () => {
@@ -104,6 +434,7 @@ def get_unified_page_javascript():
 
                 if (listContainer && fragmentContainer) {
                     // Reset containers to initial state
+                    videoLoadToken++;
                     listContainer.style.display = 'block';
                     listContainer.style.visibility = 'visible';
                     fragmentContainer.style.display = 'none';
@@ -126,6 +457,8 @@ def get_unified_page_javascript():
                 const targetContent = document.getElementById(tabId + '-content');
                 if (targetContent) {
                     targetContent.classList.add('active');
+                    loadActiveCollections(targetContent);
+                    scheduleTables();
                 }
             });
         });
@@ -152,6 +485,8 @@ def get_unified_page_javascript():
                 const collectionElement = document.getElementById(subTabId + '-collection');
                 if (collectionElement) {
                     collectionElement.classList.add('active');
+                    loadActiveCollections(collectionElement.parentElement);
+                    scheduleTables();
                 }
             });
         });
@@ -163,40 +498,90 @@ def get_unified_page_javascript():
             window.location.href = baseUrl + encodeURIComponent(command);
         });
 
-        // State toggle buttons
-        document.querySelectorAll('.toggle-toggle').forEach(button => {
-            button.addEventListener('click', (e) => {
-                const row = e.target.closest('.data-row');
-                const itemId = row.dataset.id;
-                const itemType = row.dataset.type;
-                const isToggleActive = button.classList.contains('toggle-active');
-                const isToggleFocus = button.classList.contains('toggle-focus');
-
-                // Toggle visual state
-                if (isToggleActive) {
-                    button.classList.toggle('active');
-                    row.classList.toggle('active');
-                } else if (isToggleFocus) {
-                    button.classList.toggle('focused');
-                    row.classList.toggle('focused');
-                }
+        // State toggle buttons - delegated so collections patched in by live reload keep working
+        document.addEventListener('click', (e) => {
+            const button = e.target.closest('.toggle-toggle');
+            if (!button) {
+                return;
+            }
+            const row = button.closest('.data-row');
+            const isToggleActive = button.classList.contains('toggle-active');
+            const isToggleFocus = button.classList.contains('toggle-focus');
 
-                // Send signal to Obsidian (placeholder - implement actual Obsidian command)
-                console.log(`Toggle ${isToggleActive ? 'active' : 'focus'} for ${itemType} ${itemId}`);
-                // TODO: Add actual Obsidian integration command
-            });
+            // Toggle visual state
+            if (isToggleActive) {
+                button.classList.toggle('active');
+                row.classList.toggle('active');
+            } else if (isToggleFocus) {
+                button.classList.toggle('focused');
+                row.classList.toggle('focused');
+            }
+
+            const table = row.closest('.virtual-table');
+            if (table) {
+                recordRowToggle(getTableState(table), row, button);
+            }
         });
 
         // Title link clicks - open file in nvim
-        document.querySelectorAll('.title-link').forEach(link => {
-            link.addEventListener('click', (e) => {
-                e.preventDefault();
-                const file = link.dataset.file;
-                const line = link.dataset.line;
+        document.addEventListener('click', (e) => {
+            const link = e.target.closest('.title-link');
+            if (!link) {
+                return;
+            }
+            e.preventDefault();
+            const file = link.dataset.file;
+            const line = link.dataset.line;
 
-                const baseUrl = 'obsidian://advanced-uri?vault=share&eval=';
-                const command = 'let tp = app.plugins.plugins["templater-obsidian"].templater.current_functions_object; tp.user.openLineInNvim("' + file + '", ' + line + ');';
-                window.location.href = baseUrl + encodeURIComponent(command);
-            });
+            const baseUrl = 'obsidian://advanced-uri?vault=share&eval=';
+            const command = 'let tp = app.plugins.plugins["templater-obsidian"].templater.current_functions_object; tp.user.openLineInNvim("' + file + '", ' + line + ');';
+            window.location.href = baseUrl + encodeURIComponent(command);
         });
+
+        // Live reload: `obsi-dash --watch serve` announces each rebuild
+        async function applyBuild(build) {
+            if (build.reload) {
+                window.location.reload();
+                return;
+            }
+
+            for (const collection of build.collections) {
+                if (collection.type === 'video') {
+                    const url = VIDEO_DATA_DIR + '/' + collection.stem + '.json';
+                    const link = document.querySelector(`.video-link[data-data-url="${CSS.escape(url)}"]`);
+                    videoCollections.delete(url);
+                    if (link) {
+                        link.querySelector('.collection-count').textContent = collection.count + ' videos';
+                        if (currentVideoUrl === url) {
+                            loadVideoFragment(link);
+                        }
+                    }
+                    continue;
+                }
+
+                const section = document.getElementById(collection.stem + '-collection');
+                if (!section) {
+                    window.location.reload();
+                    return;
+                }
+                const response = await fetch('/__obsi-dash/fragments/' + encodeURIComponent(collection.stem) + '.html?v=' + collection.hash);
+                if (!response.ok) {
+                    window.location.reload();
+                    return;
+                }
+                replaceCollection(section, await response.text());
+            }
+        }
+
+        renderTables();
+
+        if (window.EventSource && window.location.protocol.startsWith('http')) {
+            const buildEvents = new EventSource('/__obsi-dash/events');
+            buildEvents.addEventListener('build', (e) => {
+                applyBuild(JSON.parse(e.data)).catch(error => {
+                    console.error('Error applying live reload:', error);
+                    window.location.reload();
+                });
+            });
+        }
     """
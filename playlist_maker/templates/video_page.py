@@ -979,11 +979,11 @@ def get_video_page_html(title, pywal_css, json_data):
             }}).join('');
         }}
 
-        function createVideoCard(video, index) {{
+        // Inner HTML of a video card; the card element itself is reused by the grid
+        function createVideoCardContent(video, index) {{
             const isInboxActive = video.tags?.includes('inbox');
             const isWatched = video.watched;
             const isStarred = video.tags?.includes('starred');
-            const watchedClass = isWatched ? 'watched' : '';
 
             const thumbnailContent = video.thumbnail 
                 ? `<img src="${{video.thumbnail}}" alt="${{video.summary}}" class="thumbnail" loading="lazy" onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
@@ -996,44 +996,42 @@ def get_video_page_html(title, pywal_css, json_data):
             const deepLink = video.file ? createDeepLink(`~/share/${{video.file}}`, video.line) : null;
 
             return `
-                <div class="video-card ${{watchedClass}}" data-id="${{video.id}}">
-                    <div class="thumbnail-container">
-                        ${{thumbnailContent}}
-                        <a href="${{starredLink}}" class="starred-button ${{isStarred ? 'active' : 'inactive'}}" title="Toggle starred">
-                            <span style="display:inline-flex;align-items:center;justify-content:center;">
-                                ${{isStarred ? '<svg viewBox="0 0 24 24" fill="currentColor" style="width:20px;height:20px;"><polygon points="12 2 15.09 10.26 24 10.26 17.55 16.52 19.64 24.78 12 19.52 4.36 24.78 6.45 16.52 0 10.26 8.91 10.26 12 2"/></svg>' : '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" style="width:20px;height:20px;"><polygon points="12 2 15.09 10.26 24 10.26 17.55 16.52 19.64 24.78 12 19.52 4.36 24.78 6.45 16.52 0 10.26 8.91 10.26 12 2"/></svg>'}}
-                            </span>
+                <div class="thumbnail-container">
+                    ${{thumbnailContent}}
+                    <a href="${{starredLink}}" class="starred-button ${{isStarred ? 'active' : 'inactive'}}" title="Toggle starred">
+                        <span style="display:inline-flex;align-items:center;justify-content:center;">
+                            ${{isStarred ? '<svg viewBox="0 0 24 24" fill="currentColor" style="width:20px;height:20px;"><polygon points="12 2 15.09 10.26 24 10.26 17.55 16.52 19.64 24.78 12 19.52 4.36 24.78 6.45 16.52 0 10.26 8.91 10.26 12 2"/></svg>' : '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" style="width:20px;height:20px;"><polygon points="12 2 15.09 10.26 24 10.26 17.55 16.52 19.64 24.78 12 19.52 4.36 24.78 6.45 16.52 0 10.26 8.91 10.26 12 2"/></svg>'}}
+                        </span>
+                    </a>
+                    <div class="duration-badge">
+                        <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-clock-icon lucide-clock" style="width:14px;height:14px;display:inline;"><path d="M12 6v6l4 2"/><circle cx="12" cy="12" r="10"/></svg> ${{formatDuration(video.duration)}}
+                    </div>
+                    <div class="watched-indicator"></div>
+                </div>
+                <div class="card-content">
+                    <h3 class="video-title">${{video.summary}}</h3>
+                    <div class="video-meta">
+                        <span class="channel-name">
+                            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-user-icon lucide-user" style="width:14px;height:14px;display:inline;margin-right:4px;vertical-align:middle;"><path d="M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2"/><circle cx="12" cy="7" r="4"/></svg>${{video.channel}}
+                        </span>
+                        <a href="${{createYouTubeLink(video.locator)}}" class="youtube-link-badge" title="Open in YouTube">
+                            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-gauge-icon lucide-gauge" style="width:14px;height:14px;display:inline;"><path d="m12 14 4-4"/><path d="M3.34 19a10 10 0 1 1 17.32 0"/></svg>
+                        </a>
+                        ${{video.file ? '$<span style="color: var(--color7);">/</span> <a href="${{deepLink}}" class="deep-link-badge" title="Open in Obsidian"><svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-file-icon lucide-file" style="width:14px;height:14px;display:inline;"><path d="M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z"/><path d="M14 2v5a1 1 0 0 0 1 1h5"/></svg></a>$' : ''}}
+                        <span class="video-date">
+                            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-calendar-icon lucide-calendar" style="width:14px;height:14px;display:inline;margin-right:4px;vertical-align:middle;"><path d="M8 2v4"/><path d="M16 2v4"/><rect width="18" height="18" x="3" y="4" rx="2"/><path d="M3 10h18"/></svg>${{formatDate(video.date)}}
+                        </span>
+                    </div>
+                    <div class="action-buttons">
+                        <a href="${{inboxWatchedLink}}" class="btn btn-watched ${{isWatched ? 'active' : ''}}" title="Toggle watched + inbox">
+                            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-check-icon lucide-check" style="width:14px;height:14px;"><path d="M20 6 9 17l-5-5"/></svg> Watched
+                        </a>
+                        <a href="${{inboxLink}}" class="btn btn-inbox ${{isInboxActive ? 'active' : ''}}" title="Toggle inbox only">
+                            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-inbox-icon lucide-inbox" style="width:14px;height:14px;"><polyline points="22 12 16 12 14 15 10 15 8 12 2 12"/><path d="M5.45 5.11 2 12v6a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2v-6l-3.45-6.89A2 2 0 0 0 16.76 4H7.24a2 2 0 0 0-1.79 1.11z"/></svg> Inbox
                         </a>
-                        <div class="duration-badge">
-                            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-clock-icon lucide-clock" style="width:14px;height:14px;display:inline;"><path d="M12 6v6l4 2"/><circle cx="12" cy="12" r="10"/></svg> ${{formatDuration(video.duration)}}
-                        </div>
-                        <div class="watched-indicator"></div>
                     </div>
-                    <div class="card-content">
-                        <h3 class="video-title">${{video.summary}}</h3>
-                        <div class="video-meta">
-                            <span class="channel-name">
-                                <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-user-icon lucide-user" style="width:14px;height:14px;display:inline;margin-right:4px;vertical-align:middle;"><path d="M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2"/><circle cx="12" cy="7" r="4"/></svg>${{video.channel}}
-                            </span>
-                            <a href="${{createYouTubeLink(video.locator)}}" class="youtube-link-badge" title="Open in YouTube">
-                                <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-gauge-icon lucide-gauge" style="width:14px;height:14px;display:inline;"><path d="m12 14 4-4"/><path d="M3.34 19a10 10 0 1 1 17.32 0"/></svg>
-                            </a>
-                            ${{video.file ? '$<span style="color: var(--color7);">/</span> <a href="${{deepLink}}" class="deep-link-badge" title="Open in Obsidian"><svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-file-icon lucide-file" style="width:14px;height:14px;display:inline;"><path d="M6 22a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h8a2.4 2.4 0 0 1 1.704.706l3.588 3.588A2.4 2.4 0 0 1 20 8v12a2 2 0 0 1-2 2z"/><path d="M14 2v5a1 1 0 0 0 1 1h5"/></svg></a>$' : ''}}
-                            <span class="video-date">
-                                <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-calendar-icon lucide-calendar" style="width:14px;height:14px;display:inline;margin-right:4px;vertical-align:middle;"><path d="M8 2v4"/><path d="M16 2v4"/><rect width="18" height="18" x="3" y="4" rx="2"/><path d="M3 10h18"/></svg>${{formatDate(video.date)}}
-                            </span>
-                        </div>
-                        <div class="action-buttons">
-                            <a href="${{inboxWatchedLink}}" class="btn btn-watched ${{isWatched ? 'active' : ''}}" title="Toggle watched + inbox">
-                                <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-check-icon lucide-check" style="width:14px;height:14px;"><path d="M20 6 9 17l-5-5"/></svg> Watched
-                            </a>
-                            <a href="${{inboxLink}}" class="btn btn-inbox ${{isInboxActive ? 'active' : ''}}" title="Toggle inbox only">
-                                <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-inbox-icon lucide-inbox" style="width:14px;height:14px;"><polyline points="22 12 16 12 14 15 10 15 8 12 2 12"/><path d="M5.45 5.11 2 12v6a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2v-6l-3.45-6.89A2 2 0 0 0 16.76 4H7.24a2 2 0 0 0-1.79 1.11z"/></svg> Inbox
-                            </a>
-                        </div>
-                        <div class="tag-toggles">
-                            ${{createTagToggles(video)}}
-                        </div>
+                    <div class="tag-toggles">
+                        ${{createTagToggles(video)}}
                     </div>
                 </div>
             `;
@@ -1047,14 +1045,125 @@ def get_video_page_html(title, pywal_css, json_data):
             statsElement.innerHTML = `${{totalVideos}} videos • ${{formatDuration(totalDuration)}} total`;
         }}
 
-        function renderVideos() {{
-            const videoGrid = document.getElementById('videoGrid');
-            videoGrid.innerHTML = videoData.map((video, index) => createVideoCard(video, index)).join('');
+        function fillVideoCard(card, video, index) {{
+            card.className = video.watched ? 'video-card watched' : 'video-card';
+            card.dataset.id = video.id;
+            card.innerHTML = createVideoCardContent(video, index);
+        }}
+
+        // Rows of cards kept rendered above and below the viewport
+        const OVERSCAN_ROWS = 2;
+
+        // Windowed video grid: only the cards in or near the viewport exist in the
+        // DOM. Rows outside the window are replaced by padding, and card elements
+        // leaving the window are reused for the ones entering it.
+        function renderVideos(videoData) {{
+            const grid = document.getElementById('videoGrid');
+            const cards = new Map();
+            const pool = [];
+            let columns = 1;
+            let rowGap = 0;
+            let rowHeight = 0;
+            let frame = null;
+
+            grid.textContent = '';
+
+            function measureColumns() {{
+                const style = getComputedStyle(grid);
+                columns = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+                rowGap = parseFloat(style.rowGap) || 0;
+            }}
+
+            // Rows all get the height of the tallest card seen so far
+            function growRowHeight(newCards) {{
+                let tallest = rowHeight;
+                for (const card of newCards) {{
+                    tallest = Math.max(tallest, card.scrollHeight + card.offsetHeight - card.clientHeight);
+                }}
+                if (tallest > rowHeight) {{
+                    rowHeight = tallest;
+                    grid.style.gridAutoRows = rowHeight + 'px';
+                    return true;
+                }}
+                return false;
+            }}
+
+            function render() {{
+                frame = null;
+                if (!grid.isConnected) {{
+                    // The home page replaced this collection
+                    window.removeEventListener('scroll', schedule);
+                    window.removeEventListener('resize', onResize);
+                    return;
+                }}
+
+                const totalRows = Math.ceil(videoData.length / columns);
+                const stride = rowHeight + rowGap;
+                let firstRow = 0;
+                let lastRow = Math.min(totalRows, 1);
+                if (rowHeight > 0) {{
+                    const top = grid.getBoundingClientRect().top;
+                    firstRow = Math.min(totalRows, Math.max(0, Math.floor(-top / stride) - OVERSCAN_ROWS));
+                    lastRow = Math.min(totalRows, Math.max(firstRow, Math.ceil((window.innerHeight - top) / stride) + OVERSCAN_ROWS));
+                }}
+                const start = firstRow * columns;
+                const end = Math.min(videoData.length, lastRow * columns);
+
+                for (const [index, card] of cards) {{
+                    if (index < start || index >= end) {{
+                        card.remove();
+                        cards.delete(index);
+                        pool.push(card);
+                    }}
+                }}
+
+                const firstKept = cards.size ? Math.min(...cards.keys()) : end;
+                const before = [];
+                const after = [];
+                for (let index = start; index < end; index++) {{
+                    if (cards.has(index)) {{
+                        continue;
+                    }}
+                    const card = pool.pop() || document.createElement('div');
+                    fillVideoCard(card, videoData[index], index);
+                    cards.set(index, card);
+                    (index < firstKept ? before : after).push(card);
+                }}
+                grid.prepend(...before);
+                grid.append(...after);
+
+                grid.style.paddingTop = (firstRow * stride) + 'px';
+                grid.style.paddingBottom = ((totalRows - lastRow) * stride) + 'px';
+
+                if (growRowHeight(before.concat(after))) {{
+                    schedule();
+                }}
+            }}
+
+            function schedule() {{
+                if (frame === null) {{
+                    frame = requestAnimationFrame(render);
+                }}
+            }}
+
+            function onResize() {{
+                // Column count and card heights depend on the grid width
+                measureColumns();
+                rowHeight = 0;
+                grid.style.gridAutoRows = '';
+                growRowHeight(cards.values());
+                schedule();
+            }}
+
+            window.addEventListener('scroll', schedule, {{ passive: true }});
+            window.addEventListener('resize', onResize);
+            measureColumns();
+            render();
         }}
 
         // Initialize the page
         renderStats();
-        renderVideos();
+        renderVideos(videoData);
     </script>
 </body>
 </html>"""
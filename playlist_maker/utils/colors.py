@@ -2,14 +2,15 @@
 
 from pathlib import Path
 
+from playlist_maker.resources import cached_file, read_text
+
 
 def extract_pywal_colors():
-    """Load colors from ~/.cache/wal/colors.css"""
+    """Load colors from ~/.cache/wal/colors.css (read again only when it changes)"""
     try:
-        colors_css = Path.home() / ".cache" / "wal" / "colors.css"
-        if colors_css.exists():
-            with open(colors_css, "r", encoding="utf-8") as f:
-                return f.read()
+        colors_css = cached_file(Path.home() / ".cache" / "wal" / "colors.css", read_text)
+        if colors_css is not None:
+            return colors_css
     except Exception:
         pass
 
@@ -5,10 +5,119 @@ Loads and processes JSON data files to populate dashboard widgets.
 Handles overlapping entries and prioritization rules.
 """
 
-import json
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Set, Tuple
-from collections import defaultdict
+from typing import List, Dict, Any
+
+from playlist_maker import jsonio
+from playlist_maker.manifest import hash_bytes
+
+# Widget data key -> JSON export it is read from
+DASHBOARD_FILES = {
+    'progress': 'progress.json',
+    'focus': 'focus.json',
+    'focus_tasks': 'focus-tasks.json',
+    'focus_notes': 'focus-notes.json',
+    'initiatives': 'initiatives.json',
+    'current_tasks': 'current-tasks.json',
+    'current_projects': 'current-projects.json',
+    'current_images': 'current-images.json',
+    'current_wonders': 'current-wonders.json',
+}
+
+# Statuses of "mind" entries (experimental/thoughts) rather than TODOs
+MIND_STATUSES = frozenset({'w', '?', 't'})
+NOTE_MIND_STATUSES = MIND_STATUSES | {'*'}
+
+# Content hashes of the widget sources -> classified widget data; only the
+# latest sources are kept
+_widget_data_cache = {}
+
+
+def classify_widget_data(data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Sort the widget sources into every widget bucket in one pass.
+
+    Each source list is walked once: focus.json feeds the TODO/mind split
+    and the focus minds together. See the get_*_by_status() methods of
+    DashboardDataProcessor for the rules of each bucket.
+
+    Args:
+        data: Parsed widget sources by DASHBOARD_FILES key
+
+    Returns:
+        Dict with keys 'initiatives', 'todos', 'minds' and 'progress'
+    """
+    initiatives = {'focus': [], 'active': [], 'planned': []}
+    todos = {'focus_todo': [], 'focus_mind': [], 'active_todo': [], 'active_mind': []}
+    minds = {'focus': [], 'active': []}
+    progress = {
+        'focus': {'progress': [], 'async': []},
+        'active': {'progress': [], 'async': []},
+    }
+
+    for item in data.get('initiatives', []):
+        status = item.get('status', '').lower()
+        # Dates, 'none' and missing statuses are all planned
+        if not status or status == 'none' or status.startswith('202'):
+            status = 'planned'
+        initiatives[status].append({
+            'type': item.get('type'),  # 'work' or 'study'
+            'summary': item.get('summary'),
+            'file': item.get('file'),
+            'raw_status': item.get('status'),
+        })
+
+    for item in data.get('focus', []):
+        if item.get('type') != 'file':
+            continue
+        is_mind = item.get('status') in MIND_STATUSES
+        todos['focus_mind' if is_mind else 'focus_todo'].append({
+            'summary': item.get('summary'),
+            'file': item.get('file'),
+            'is_mind': is_mind,
+        })
+        if is_mind:
+            minds['focus'].append({'summary': item.get('summary'), 'file': item.get('file')})
+
+    for key, mind_statuses in (('focus_tasks', MIND_STATUSES), ('focus_notes', NOTE_MIND_STATUSES)):
+        for item in data.get(key, []):
+            is_mind = item.get('status') in mind_statuses
+            todos['focus_mind' if is_mind else 'focus_todo'].append({
+                'summary': item.get('summary'),
+                'file': item.get('file'),
+                'is_mind': is_mind,
+            })
+
+    for item in chain(data.get('current_tasks', []), data.get('current_projects', [])):
+        todos['active_todo'].append({
+            'summary': item.get('summary'),
+            'file': item.get('file'),
+            'is_mind': False,
+        })
+
+    for item in chain(data.get('current_images', []), data.get('current_wonders', [])):
+        minds['active'].append({'summary': item.get('summary'), 'file': item.get('file')})
+
+    for item in data.get('progress', []):
+        status = item.get('status', '').lower()
+        entry = {
+            'type': item.get('type'),  # project, TODO, task, etc.
+            'summary': item.get('summary'),
+            'file': item.get('file'),
+        }
+        if status in ('focus', 'active'):
+            progress[status]['progress'].append(entry)
+        else:
+            # Pending/other items are "async"
+            progress['active']['async'].append(entry)
+
+    return {
+        'initiatives': initiatives,
+        'todos': todos,
+        'minds': minds,
+        'progress': progress,
+    }
 
 
 class DashboardDataProcessor:
@@ -23,33 +132,26 @@ class DashboardDataProcessor:
         """
         self.data_dir = Path(data_dir).expanduser()
         self.data = {}
+        self.digests = {}
+        self._widget_data = None
         self._load_all_data()
     
     def _load_all_data(self):
         """Load all required JSON files."""
-        files = {
-            'progress': 'progress.json',
-            'focus': 'focus.json',
-            'focus_tasks': 'focus-tasks.json',
-            'focus_notes': 'focus-notes.json',
-            'initiatives': 'initiatives.json',
-            'current_tasks': 'current-tasks.json',
-            'current_projects': 'current-projects.json',
-            'current_images': 'current-images.json',
-            'current_wonders': 'current-wonders.json',
-        }
-        
-        for key, filename in files.items():
+        for key, filename in DASHBOARD_FILES.items():
             filepath = self.data_dir / filename
             try:
                 if filepath.exists():
-                    with open(filepath) as f:
-                        self.data[key] = json.load(f)
+                    raw = filepath.read_bytes()
+                    self.data[key] = jsonio.loads(raw)
+                    self.digests[key] = hash_bytes(raw)
                 else:
                     self.data[key] = []
+                    self.digests[key] = None
             except Exception as e:
                 print(f"Warning: Could not load {filename}: {e}")
                 self.data[key] = []
+                self.digests[key] = None
     
     # ========== INITIATIVE DATA ==========
     
@@ -66,35 +168,7 @@ class DashboardDataProcessor:
             Dict with keys: 'focus', 'active', 'planned'
             Each contains list of initiative dicts
         """
-        initiatives = self.data.get('initiatives', [])
-        
-        result = {
-            'focus': [],
-            'active': [],
-            'planned': []
-        }
-        
-        for item in initiatives:
-            status = item.get('status', '').lower()
-            
-            # Normalize dates to 'planned'
-            if status and status.startswith('202'):
-                status = 'planned'
-            elif status == 'none':
-                status = 'planned'
-            elif not status:
-                status = 'planned'
-            
-            entry = {
-                'type': item.get('type'),  # 'work' or 'study'
-                'summary': item.get('summary'),
-                'file': item.get('file'),
-                'raw_status': item.get('status'),
-            }
-            
-            result[status].append(entry)
-        
-        return result
+        return self.get_all_widget_data()['initiatives']
     
     # ========== TODO/TASK DATA ==========
     
@@ -111,62 +185,7 @@ class DashboardDataProcessor:
         Returns:
             Dict with keys: 'focus_todo', 'focus_mind', 'active_todo', 'active_mind'
         """
-        result = {
-            'focus_todo': [],
-            'focus_mind': [],
-            'active_todo': [],
-            'active_mind': []
-        }
-        
-        # Focus items (with mind/todo split)
-        focus_items = self.data.get('focus', [])
-        focus_tasks = self.data.get('focus_tasks', [])
-        focus_notes = self.data.get('focus_notes', [])
-        
-        # Process focus files
-        for item in focus_items:
-            if item.get('type') == 'file':
-                # Check if it's a "mind" entry (w, ?, t status)
-                is_mind = item.get('status') in ['w', '?', 't']
-                key = 'focus_mind' if is_mind else 'focus_todo'
-                result[key].append({
-                    'summary': item.get('summary'),
-                    'file': item.get('file'),
-                    'is_mind': is_mind,
-                })
-        
-        # Process focus-tasks
-        for item in focus_tasks:
-            is_mind = item.get('status') in ['w', '?', 't']
-            key = 'focus_mind' if is_mind else 'focus_todo'
-            result[key].append({
-                'summary': item.get('summary'),
-                'file': item.get('file'),
-                'is_mind': is_mind,
-            })
-        
-        # Process focus-notes
-        for item in focus_notes:
-            is_mind = item.get('status') in ['w', '?', 't', '*']
-            key = 'focus_mind' if is_mind else 'focus_todo'
-            result[key].append({
-                'summary': item.get('summary'),
-                'file': item.get('file'),
-                'is_mind': is_mind,
-            })
-        
-        # Active items (current-tasks and current-projects)
-        current_tasks = self.data.get('current_tasks', [])
-        current_projects = self.data.get('current_projects', [])
-        
-        for item in current_tasks + current_projects:
-            result['active_todo'].append({
-                'summary': item.get('summary'),
-                'file': item.get('file'),
-                'is_mind': False,
-            })
-        
-        return result
+        return self.get_all_widget_data()['todos']
     
     # ========== MIND/IDEAS DATA ==========
     
@@ -181,31 +200,7 @@ class DashboardDataProcessor:
         Returns:
             Dict with keys: 'focus', 'active'
         """
-        result = {
-            'focus': [],
-            'active': []
-        }
-        
-        # Focus mind items (already captured in todos)
-        focus_items = self.data.get('focus', [])
-        for item in focus_items:
-            if item.get('type') == 'file' and item.get('status') in ['w', '?', 't']:
-                result['focus'].append({
-                    'summary': item.get('summary'),
-                    'file': item.get('file'),
-                })
-        
-        # Active mind items
-        current_images = self.data.get('current_images', [])
-        current_wonders = self.data.get('current_wonders', [])
-        
-        for item in current_images + current_wonders:
-            result['active'].append({
-                'summary': item.get('summary'),
-                'file': item.get('file'),
-            })
-        
-        return result
+        return self.get_all_widget_data()['minds']
     
     # ========== PROGRESS DATA ==========
     
@@ -232,44 +227,7 @@ class DashboardDataProcessor:
                 }
             }
         """
-        progress_items = self.data.get('progress', [])
-        
-        result = {
-            'focus': {
-                'progress': [],
-                'async': []
-            },
-            'active': {
-                'progress': [],
-                'async': []
-            }
-        }
-        
-        for item in progress_items:
-            status = item.get('status', '').lower()
-            
-            # Determine category
-            entry = {
-                'type': item.get('type'),  # project, TODO, task, etc.
-                'summary': item.get('summary'),
-                'file': item.get('file'),
-            }
-            
-            # Categorize by status
-            if status == 'focus':
-                # Focus items go to progress by default
-                result['focus']['progress'].append(entry)
-            elif status == 'active':
-                # Active items also go to progress
-                result['active']['progress'].append(entry)
-            else:
-                # Pending/other items are "async"
-                if status == 'focus':
-                    result['focus']['async'].append(entry)
-                else:
-                    result['active']['async'].append(entry)
-        
-        return result
+        return self.get_all_widget_data()['progress']
     
     # ========== AGGREGATION ==========
     
@@ -277,15 +235,22 @@ class DashboardDataProcessor:
         """
         Get all data organized for widget display.
         
+        Computed once per set of source files: later calls, and other
+        processors reading the same unchanged files, share the result and
+        must not modify it.
+        
         Returns:
             Complete widget data structure
         """
-        return {
-            'initiatives': self.get_initiatives_by_status(),
-            'todos': self.get_todos_by_status(),
-            'minds': self.get_minds_by_status(),
-            'progress': self.get_progress_by_status(),
-        }
+        if self._widget_data is None:
+            key = tuple(self.digests[k] for k in DASHBOARD_FILES)
+            widget_data = _widget_data_cache.get(key)
+            if widget_data is None:
+                widget_data = classify_widget_data(self.data)
+                _widget_data_cache.clear()
+                _widget_data_cache[key] = widget_data
+            self._widget_data = widget_data
+        return self._widget_data
 
 
 def format_entry_html(entry: Dict[str, Any], include_type: bool = False) -> str:
@@ -1,5 +1,34 @@
 """SVG icon definitions for the playlist maker"""
 
+import re
+from functools import lru_cache
+
+# Splits an inline icon into its <svg> attributes and its content
+_SVG_PATTERN = re.compile(r"<svg([^>]*)>(.*)</svg>", re.DOTALL)
+_ATTRIBUTE_PATTERN = re.compile(r'([\w:-]+)="([^"]*)"')
+
+# Attributes of an inline icon that a <symbol> inherits to its content;
+# size, class and style stay on the <svg> referencing the symbol
+_SYMBOL_ATTRIBUTES = ("viewBox", "fill", "stroke", "stroke-width", "stroke-linecap",
+                      "stroke-linejoin")
+
+
+def _symbol_id(*names):
+    """Turn icon names (e.g. "status", "?") into an element id"""
+    return "-".join(
+        ["icon"] + ["".join(c if c.isalnum() else f"_{ord(c):x}" for c in name) for name in names]
+    )
+
+
+def _to_symbol(symbol_id, svg):
+    """Convert inline <svg> markup to a <symbol> of the sprite"""
+    attributes, content = _SVG_PATTERN.fullmatch(svg.strip()).groups()
+    kept = "".join(
+        f' {name}="{value}"' for name, value in _ATTRIBUTE_PATTERN.findall(attributes)
+        if name in _SYMBOL_ATTRIBUTES
+    )
+    return f'<symbol id="{symbol_id}"{kept}>{content}</symbol>'
+
 
 class SVGIcons:
     """Collection of SVG icons used in the UI"""
@@ -67,3 +96,62 @@ class SVGIcons:
     def get_status_icon(status: str):
         """Get SVG icon for a status value, returns None if no icon defined"""
         return SVGIcons.STATUS_ICONS.get(status)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_status_symbol_ids():
+        """
+        Return mapping of status values to the sprite symbol of their icon.
+
+        Statuses sharing the same icon share one symbol.
+        """
+        symbol_ids = {}
+        by_svg = {}
+        for status, svg in SVGIcons.STATUS_ICONS.items():
+            symbol_ids[status] = by_svg.setdefault(svg, _symbol_id("status", status))
+        return symbol_ids
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_sprite():
+        """
+        Return a hidden <svg> defining the row icons as <symbol> elements.
+
+        Included once per page; rows reference the symbols with use_icon()
+        instead of repeating the full markup of each icon.
+
+        Returns:
+            str: Sprite markup
+        """
+        symbols = {_symbol_id("calendar"): SVGIcons.CALENDAR}
+        for status, symbol_id in SVGIcons.get_status_symbol_ids().items():
+            symbols.setdefault(symbol_id, SVGIcons.STATUS_ICONS[status])
+        content = "".join(_to_symbol(symbol_id, svg) for symbol_id, svg in symbols.items())
+        return f'<svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" style="display:none">{content}</svg>'
+
+    @staticmethod
+    def use_icon(symbol_id, attributes='width="24" height="24"'):
+        """
+        Reference a sprite symbol.
+
+        Args:
+            symbol_id: Id of a symbol in get_sprite()
+            attributes: Attributes of the referencing <svg> (size, style)
+
+        Returns:
+            str: <svg><use></svg> markup
+        """
+        return f'<svg viewBox="0 0 24 24" {attributes}><use href="#{symbol_id}"/></svg>'
+
+    @staticmethod
+    def get_status_icon_ref(status: str):
+        """Get a sprite reference for a status value, returns None if no icon defined"""
+        symbol_id = SVGIcons.get_status_symbol_ids().get(status)
+        if symbol_id is None:
+            return None
+        return SVGIcons.use_icon(symbol_id)
+
+    @staticmethod
+    def get_calendar_icon_ref(attributes):
+        """Get a sprite reference to the calendar icon"""
+        return SVGIcons.use_icon(_symbol_id("calendar"), attributes)
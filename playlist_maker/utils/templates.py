@@ -1,19 +1,125 @@
 """Template loading and rendering utilities"""
 
+import re
 from pathlib import Path
+from playlist_maker.resources import cached_file, read_text
 from playlist_maker.templates.home_page import get_home_page_html
 
+# Placeholders filled in templates, e.g. {TITLE} or {APP_CSS}
+PLACEHOLDER_PATTERN = re.compile(r"\{[A-Z][A-Z0-9_]*\}")
+
+# Same, capturing the name: re.split() then alternates literals and names
+_SLOT_PATTERN = re.compile(r"\{([A-Z][A-Z0-9_]*)\}")
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "html_templates"
+
+
+class CompiledTemplate:
+    """A template split once into literal text and placeholder slots."""
+
+    __slots__ = ("source", "literals", "slots")
+
+    def __init__(self, source):
+        """
+        Compile template text.
+
+        Args:
+            source: Template text with {PLACEHOLDER} slots
+        """
+        parts = _SLOT_PATTERN.split(source)
+        self.source = source
+        # literals[i] comes before slots[i]; the last literal ends the text
+        self.literals = parts[0::2]
+        self.slots = parts[1::2]
+
+    def render(self, values):
+        """
+        Fill the slots by joining the segments.
+
+        Args:
+            values: Dict of placeholder name (without braces) -> text;
+                slots missing from it are kept as {NAME}
+
+        Returns:
+            str: Rendered text
+        """
+        return "".join(self._iter_segments(values, 0, len(self.slots)))
+
+    def render_around(self, slot, values):
+        """
+        Render the text before and after the first occurrence of a slot.
+
+        Lets a caller stream a large value (e.g. video data) between the
+        two halves instead of building the whole page in memory.
+
+        Args:
+            slot: Placeholder name (without braces) to split at
+            values: Values of the other slots, as for render()
+
+        Returns:
+            tuple: (head, tail)
+        """
+        index = self.slots.index(slot)
+        head = "".join(self._iter_segments(values, 0, index))
+        tail = "".join(self._iter_segments(values, index + 1, len(self.slots)))
+        return head, tail
+
+    def _iter_segments(self, values, start, stop):
+        # The literal before slot `start`, then slot values alternating
+        # with the literals following them, up to slot `stop` (excluded)
+        yield self.literals[start]
+        for index in range(start, stop):
+            name = self.slots[index]
+            yield values.get(name, "{" + name + "}")
+            yield self.literals[index + 1]
+
+
+def get_template(filename):
+    """
+    Return a compiled template from html_templates/.
+
+    Templates are read and compiled once per process; later calls only
+    stat the file, so an edited template is picked up in watch mode.
+
+    Args:
+        filename: Template file name, e.g. "video.html"
+
+    Returns:
+        CompiledTemplate
+    """
+    template_path = TEMPLATE_DIR / filename
+    template = cached_file(template_path, _compile_template_file)
+    if template is None:
+        raise FileNotFoundError(f"Template not found: {template_path}")
+    return template
+
+
+def _compile_template_file(path):
+    return CompiledTemplate(read_text(path))
+
 
 def load_template(filename):
     """Load HTML template file"""
-    template_dir = Path(__file__).parent.parent / "html_templates"
-    template_path = template_dir / filename
+    return get_template(filename).source
 
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
+def substitute_placeholders(template, values):
+    """
+    Fill all placeholders of a template in a single pass.
+
+    Unlike chained str.replace() calls, the document is scanned once
+    whatever the number of placeholders, and inserted values are never
+    scanned again for placeholders.
+
+    Args:
+        template: Template text
+        values: Dict of placeholder (with braces) -> replacement text;
+            placeholders missing from it are left as they are
+
+    Returns:
+        str: Rendered text
+    """
+    return PLACEHOLDER_PATTERN.sub(lambda match: values.get(match.group(0), match.group(0)), template)
 
 
 def render_home_template(pywal_css, successful_files):
@@ -30,30 +136,52 @@ def render_home_template(pywal_css, successful_files):
     return get_home_page_html(pywal_css, successful_files)
 
 
-def render_unified_home_template(pywal_css, successful_collections):
+def render_unified_home_template(assets, successful_collections):
     """
     Render unified home page with tabbed navigation.
 
     Videos are linked to separate pages, other content is embedded.
 
     Args:
-        pywal_css: CSS variables from pywal
+        assets: Dict of shared asset URLs
         successful_collections: Dict organized by content type
 
     Returns:
         str: Complete HTML string
     """
     from playlist_maker.templates.home_page import get_unified_home_page_html
-    return get_unified_home_page_html(pywal_css, successful_collections)
+    return get_unified_home_page_html(assets, successful_collections)
 
 
-def render_video_template(title, pywal_css, javascript):
-    """Render video page template"""
-    template = load_template("video.html")
-    template = template.replace("{TITLE}", title)
-    template = template.replace("{PYWAL_CSS}", pywal_css)
-    template = template.replace("{JAVASCRIPT}", javascript)
-    return template
+def iter_unified_home_template(assets, successful_collections):
+    """
+    Render the unified home page as a sequence of chunks.
+
+    Args:
+        assets: Dict of shared asset URLs
+        successful_collections: Dict organized by content type
+
+    Returns:
+        Iterator of HTML strings
+    """
+    from playlist_maker.templates.home_page import iter_unified_home_page_html
+    return iter_unified_home_page_html(assets, successful_collections)
+
+
+def render_video_template_parts(title, assets):
+    """
+    Render the video page template around its video data.
+
+    Returns:
+        tuple: (head, tail) HTML to write before and after the video data
+    """
+    return get_template("video.html").render_around("VIDEO_DATA", {
+        "TITLE": title,
+        "APP_CSS": assets["app_css"],
+        "VIDEO_CSS": assets["video_css"],
+        "VIDEO_JS": assets["video_js"],
+        "TAGS_JS": assets["tags_js"],
+    })
 
 
 def render_playlist_cards(successful_files):
@@ -66,17 +194,17 @@ def render_playlist_cards(successful_files):
         </div>
  """
 
-    html = '<div class="playlist-grid">'
+    parts = ['<div class="playlist-grid">']
 
     for file_info in successful_files:
-        html += f"""
+        parts.append(f"""
             <a href="{file_info['stem']}.html" class="playlist-card">
                 <div class="playlist-title">{file_info['title']}</div>
                 <div class="playlist-subtitle">Video Collection</div>
                 <div class="playlist-stats">{file_info['count']} videos</div>
                 <div class="playlist-button">View Collection </div>
             </a>
- """
+ """)
 
-    html += "</div>"
-    return html
+    parts.append("</div>")
+    return "".join(parts)
@@ -25,6 +25,7 @@ class WidgetDataGenerator:
         """
         self.processor = data_processor or DashboardDataProcessor()
         self.data = self.processor.get_all_widget_data()
+        self._widget_html = None
     
     # ========== INITIATIVES WIDGET ==========
     
@@ -222,6 +223,8 @@ class WidgetDataGenerator:
         """
         Get all widget data organized by widget type.
         
+        Formatted once; later calls return the same dicts.
+        
         Returns:
             Dict structure:
             {
@@ -244,11 +247,13 @@ class WidgetDataGenerator:
                 }
             }
         """
-        return {
-            'initiatives': self.get_initiatives_widget_data(),
-            'dashboard': self.get_dashboard_widget_data(),
-            'progress': self.get_progress_widget_data(),
-        }
+        if self._widget_html is None:
+            self._widget_html = {
+                'initiatives': self.get_initiatives_widget_data(),
+                'dashboard': self.get_dashboard_widget_data(),
+                'progress': self.get_progress_widget_data(),
+            }
+        return self._widget_html
     
     def get_replacement_dict(self) -> Dict[str, str]:
         """
@@ -257,9 +262,10 @@ class WidgetDataGenerator:
         Returns:
             Dict with placeholder keys and HTML values
         """
-        initiatives = self.get_initiatives_widget_data()
-        dashboard = self.get_dashboard_widget_data()
-        progress = self.get_progress_widget_data()
+        widget_html = self.get_all_widget_html()
+        initiatives = widget_html['initiatives']
+        dashboard = widget_html['dashboard']
+        progress = widget_html['progress']
         
         return {
             '{INITIATIVES_FOCUS}': initiatives['focus'],
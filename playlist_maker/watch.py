@@ -0,0 +1,185 @@
+"""Watch mode: rebuild when JSON exports change.
+
+Uses watchdog (inotify on Linux) when it is installed and falls back to
+polling file sizes and mtimes otherwise.
+"""
+
+import queue
+import time
+from pathlib import Path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def is_watched_file(path):
+    """Return True for JSON exports that the build picks up"""
+    name = Path(path).name
+    return name.endswith(".json") and not name.startswith(("-", "."))
+
+
+class PollingWatcher:
+    """Detect changes by comparing directory snapshots."""
+
+    def __init__(self, folder_path, interval=1.0):
+        """
+        Initialize the watcher.
+
+        Args:
+            folder_path: Folder to watch
+            interval: Seconds between two snapshots
+        """
+        self.folder_path = Path(folder_path)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for path in self.folder_path.glob("*.json"):
+            if not is_watched_file(path):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path.name] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout=None):
+        """
+        Wait for changes.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until something changes
+
+        Returns:
+            set: Names of the files created, modified, moved or deleted
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0))
+            time.sleep(delay)
+
+            snapshot = self._take_snapshot()
+            changed = {
+                name for name in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(name) != self._snapshot.get(name)
+            }
+            self._snapshot = snapshot
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def stop(self):
+        """Nothing to release for polling"""
+
+
+class _QueueingHandler(FileSystemEventHandler):
+    """Forward watchdog events for JSON exports to a queue."""
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and is_watched_file(path):
+                self.events.put(Path(path).name)
+
+
+class WatchdogWatcher:
+    """Receive filesystem events (inotify on Linux) through watchdog."""
+
+    def __init__(self, folder_path):
+        """
+        Start observing a folder.
+
+        Args:
+            folder_path: Folder to watch (not recursive)
+        """
+        self.events = queue.Queue()
+        self.observer = Observer()
+        self.observer.schedule(_QueueingHandler(self.events), str(folder_path), recursive=False)
+        self.observer.start()
+
+    def wait(self, timeout=None):
+        """
+        Wait for changes.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until something changes
+
+        Returns:
+            set: Names of the files that received events
+        """
+        try:
+            changed = {self.events.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+
+        # Drain whatever else is already queued
+        while True:
+            try:
+                changed.add(self.events.get_nowait())
+            except queue.Empty:
+                return changed
+
+    def stop(self):
+        """Stop the observer thread"""
+        self.observer.stop()
+        self.observer.join()
+
+
+def create_watcher(folder_path):
+    """Return the best available watcher for a folder"""
+    if Observer is not None:
+        return WatchdogWatcher(folder_path)
+    return PollingWatcher(folder_path)
+
+
+def watch(folder_path, rebuild, debounce=0.5):
+    """
+    Call rebuild whenever JSON exports in folder_path change.
+
+    Bursts of events (a Dataview materialization rewrites many files in a
+    row) are coalesced: the rebuild starts once no new event arrived for
+    `debounce` seconds.
+
+    Args:
+        folder_path: Folder to watch
+        rebuild: Callable receiving the set of changed file names
+        debounce: Quiet period in seconds before rebuilding
+    """
+    watcher = create_watcher(folder_path)
+    backend = "watchdog" if isinstance(watcher, WatchdogWatcher) else "polling"
+    print(f"\nWatching {folder_path} for changes ({backend}, Ctrl+C to stop)")
+
+    try:
+        while True:
+            changed = watcher.wait()
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+
+            if not changed:
+                continue
+
+            print(f"\nChanged: {', '.join(sorted(changed))}")
+            try:
+                rebuild(changed)
+            except Exception as e:
+                print(f"Rebuild failed: {e}")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.stop()
@@ -0,0 +1,114 @@
+"""Tests for the build report sent to open dashboards."""
+
+import json
+
+from playlist_maker.main import build, find_json_files
+from playlist_maker.manifest import BuildManifest
+
+
+def test_new_tag_list_changes_the_layout(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    scripts = tmp_path / "share" / "_scripts"
+    scripts.mkdir(parents=True)
+    folder = tmp_path / "share" / "_tmp"
+    folder.mkdir()
+    (folder / "tasks.json").write_text(json.dumps([
+        {"type": "task", "file": "a.md", "line": 1, "status": " ", "summary": "Task"},
+    ]))
+    manifest = BuildManifest(folder, builder="test")
+
+    (scripts / "-tags.json").write_text(json.dumps({"inbox": "I"}))
+    first = build(folder, find_json_files(folder), manifest)
+    (scripts / "-tags.json").write_text(json.dumps({"inbox": "I", "starred": "S"}))
+    second = build(folder, find_json_files(folder), manifest)
+
+    assert first["layout"] != second["layout"]
+
+
+def test_build_keeps_unrelated_files_in_the_assets_folder(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    folder = tmp_path / "share" / "_tmp"
+    assets = folder / "assets"
+    assets.mkdir(parents=True)
+    (folder / "tasks.json").write_text(json.dumps([
+        {"type": "task", "file": "a.md", "line": 1, "status": " ", "summary": "Task"},
+    ]))
+    (assets / "logo.png").write_bytes(b"\x89PNG")
+    (assets / "app.0123456789ab.css").write_text("/* stale */")
+
+    build(folder, find_json_files(folder), BuildManifest(folder, builder="test"))
+
+    assert (assets / "logo.png").exists()
+    assert not (assets / "app.0123456789ab.css").exists()
+
+
+def test_build_without_lazy_tabs_keeps_unrelated_collection_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    folder = tmp_path / "share" / "_tmp"
+    collections = folder / "collections"
+    collections.mkdir(parents=True)
+    (folder / "tasks.json").write_text(json.dumps([
+        {"type": "task", "file": "a.md", "line": 1, "status": " ", "summary": "Task"},
+    ]))
+    (collections / "my-notes.txt").write_text("notes")
+    (collections / "tasks.0123456789ab.html").write_text("<div></div>")
+
+    build(folder, find_json_files(folder), BuildManifest(folder, builder="test"))
+
+    assert (collections / "my-notes.txt").exists()
+    assert not (collections / "tasks.0123456789ab.html").exists()
+
+
+def test_build_leaves_the_export_data_folder_alone(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    folder = tmp_path / "share" / "_tmp"
+    (folder / "data").mkdir(parents=True)
+    (folder / "data" / "export-backup.json").write_text("[]")
+    (folder / "videos.json").write_text(json.dumps([
+        {"type": "Note", "status": "youtube", "id": "v1", "summary": "Video",
+         "duration": 60, "channel": "Channel", "date": "2024-01-01", "locator": "loc1"},
+    ]))
+    manifest = BuildManifest(folder, builder="test")
+
+    build(folder, find_json_files(folder), manifest)
+    assert (folder / "obsi-data" / "videos.json").exists()
+    (folder / "videos.json").unlink()
+    build(folder, find_json_files(folder), manifest)
+
+    assert (folder / "data" / "export-backup.json").exists()
+    assert not (folder / "obsi-data" / "videos.json").exists()
+
+
+def test_malformed_tag_list_does_not_stop_the_build(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    scripts = tmp_path / "share" / "_scripts"
+    scripts.mkdir(parents=True)
+    (scripts / "-tags.json").write_text("{not json")
+    folder = tmp_path / "share" / "_tmp"
+    folder.mkdir()
+    (folder / "tasks.json").write_text(json.dumps([
+        {"type": "task", "file": "a.md", "line": 1, "status": " ", "summary": "Task"},
+    ]))
+
+    build(folder, find_json_files(folder), BuildManifest(folder, builder="test"))
+
+    assert (folder / "index.html").exists()
+
+
+def test_cached_fragments_are_streamed_into_the_home_page(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    folder = tmp_path / "share" / "_tmp"
+    folder.mkdir(parents=True)
+    for name in ("a", "b"):
+        (folder / f"{name}.json").write_text(json.dumps([
+            {"type": "task", "file": "a.md", "line": 1, "status": " ", "summary": f"Task {name}"},
+        ]))
+    manifest = BuildManifest(folder, builder="test")
+    build(folder, find_json_files(folder), manifest)
+    first = (folder / "index.html").read_text()
+
+    assert "fragment" not in manifest.load_collection(manifest.entries["a.json"])
+    build(folder, find_json_files(folder), manifest)
+
+    assert (folder / "index.html").read_text() == first
+    assert first.count('<section class="collection active"') == 1
@@ -0,0 +1,45 @@
+"""Tests for collection rendering."""
+
+import pytest
+
+from playlist_maker.data import sanitize_calendar_data, sanitize_task_data
+from playlist_maker.templates.data_row import COLLECTION_RENDERERS, iter_collection_html
+
+INFO = {"stem": "items", "title": "Items"}
+
+TASKS = [
+    {"type": "task", "file": "a.md", "line": i, "status": " ", "summary": f"Task {i}"}
+    for i in range(3)
+]
+EVENTS = [
+    {"file": "a.md", "line": i, "summary": f"Event {i}", "date": "2024-01-01"}
+    for i in range(3)
+]
+
+
+@pytest.mark.parametrize("content_type, items", [
+    ("task", sanitize_task_data(TASKS)),
+    ("calendar", sanitize_calendar_data(EVENTS)),
+    ("task", []),
+])
+def test_chunks_match_the_renderer(content_type, items):
+    rendered = COLLECTION_RENDERERS[content_type](dict(INFO, data=items))
+    assert "".join(iter_collection_html(INFO, content_type, iter(items))) == rendered
+
+
+@pytest.mark.parametrize("content_type, items", [
+    ("task", sanitize_task_data(TASKS)),
+    ("calendar", sanitize_calendar_data(EVENTS)),
+])
+def test_items_are_consumed_one_at_a_time(content_type, items):
+    taken = []
+
+    def generate():
+        for item in items:
+            taken.append(item)
+            yield item
+
+    chunks = iter_collection_html(INFO, content_type, generate())
+    next(chunks)  # collection header
+    next(chunks)  # first row
+    assert len(taken) <= 2
@@ -0,0 +1,69 @@
+"""Inline [key:: value] field parsing, pinned to the per-field regexes it replaced."""
+
+import pytest
+
+from playlist_maker.data import (
+    sanitize_calendar_data,
+    sanitize_notes_data,
+    sanitize_task_data,
+)
+
+
+def task(summary):
+    (item,) = sanitize_task_data([{"type": "task", "file": "a.md", "summary": summary}])
+    return item.to_json()
+
+
+def note(summary):
+    (item,) = sanitize_notes_data([{"type": "note", "file": "a.md", "summary": summary}])
+    return item.to_json()
+
+
+def event(summary):
+    (item,) = sanitize_calendar_data([{"file": "a.md", "summary": summary, "date": "2024-01-01"}])
+    return item.to_json()
+
+
+@pytest.mark.parametrize("summary", ["Do [active:: true ]", "Do [ active:: true]"])
+def test_padded_toggles_are_not_active(summary):
+    assert task(summary)["active"] is False
+    assert note(summary)["active"] is False
+
+
+def test_toggle_and_date():
+    item = task("Do [date:: 2024 ] [active:: yes]")
+    assert item["active"] is True
+    assert item["due_date"] == "2024 "
+    assert item["title"] == "Do"
+
+
+def test_field_nested_in_other_brackets():
+    item = task("Do [foo [date:: X]")
+    assert item["due_date"] == "X"
+    assert item["title"] == "Do"
+
+
+def test_blank_date_keeps_one_space():
+    assert task("Do [date::  ]")["due_date"] == " "
+
+
+def test_multiline_span_stays_in_task_and_note_titles():
+    assert task("Do [multi\nline] end")["title"] == "Do [multi\nline] end"
+    assert note("Do [multi\nline] end")["title"] == "Do [multi\nline] end"
+
+
+def test_multiline_span_is_stripped_from_calendar_titles():
+    assert event("Do [multi\nline] end")["title"] == "Do end"
+
+
+def test_empty_description_stays_in_note_title():
+    item = note("Note [description::] x")
+    assert item["title"] == "Note [description::] x"
+    assert item["description"] == ""
+
+
+def test_description_moves_out_of_note_title():
+    item = note("Note [description:: about it] [active:: true]")
+    assert item["title"] == "Note [active:: true]"
+    assert item["description"] == "about it"
+    assert item["active"] is True
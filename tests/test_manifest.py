@@ -0,0 +1,41 @@
+"""Tests for the build manifest's cached fragments."""
+
+from playlist_maker import output
+from playlist_maker.manifest import BuildManifest
+
+
+def record(manifest, json_path, fragment):
+    manifest.record(json_path, json_path.stat(), "digest", "task", fragment=fragment)
+
+
+def test_fragment_stays_served_while_it_is_replaced(tmp_path, monkeypatch):
+    json_path = tmp_path / "tasks.json"
+    json_path.write_text("[]")
+    manifest = BuildManifest(tmp_path, builder="test")
+    record(manifest, json_path, "<div>old</div>")
+    fragment_path = manifest.fragment_path("tasks")
+
+    seen = []
+    write_text = output.write_text
+
+    def checking_write_text(path, text, stats=None):
+        seen.append(path.read_text())
+        return write_text(path, text, stats)
+
+    monkeypatch.setattr(output, "write_text", checking_write_text)
+    record(manifest, json_path, "<div>new</div>")
+
+    assert seen == ["<div>old</div>"]
+    assert fragment_path.read_text() == "<div>new</div>"
+
+
+def test_fragment_is_removed_when_the_file_no_longer_renders_one(tmp_path):
+    json_path = tmp_path / "tasks.json"
+    json_path.write_text("[]")
+    manifest = BuildManifest(tmp_path, builder="test")
+    record(manifest, json_path, "<div>old</div>")
+
+    record(manifest, json_path, None)
+
+    assert not manifest.fragment_path("tasks").exists()
+    assert not manifest.entries["tasks.json"]["has_fragment"]
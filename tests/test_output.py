@@ -0,0 +1,71 @@
+"""Tests for the atomic, write-if-changed output files."""
+
+import os
+
+import pytest
+
+from playlist_maker.output import OutputStats, open_text, write_bytes, write_text
+
+
+def write_with_open_text(path, text, stats):
+    with open_text(path, stats) as f:
+        f.write(text)
+
+
+WRITERS = [write_text, write_with_open_text]
+
+
+def age(path):
+    """Move the file's mtime into the past, so a rewrite would change it"""
+    os.utime(path, ns=(10 ** 18, 10 ** 18))
+    return path.stat().st_mtime_ns
+
+
+@pytest.mark.parametrize("write", WRITERS)
+def test_identical_content_is_not_rewritten(tmp_path, write):
+    path = tmp_path / "page.html"
+    write(path, "<p>same</p>", None)
+    mtime = age(path)
+    stats = OutputStats()
+
+    write(path, "<p>same</p>", stats)
+
+    assert path.stat().st_mtime_ns == mtime
+    assert (stats.written_files, stats.skipped_files) == (0, 1)
+    assert stats.skipped_bytes == len("<p>same</p>")
+    assert os.listdir(tmp_path) == ["page.html"]
+
+
+@pytest.mark.parametrize("write", WRITERS)
+def test_changed_content_replaces_the_file(tmp_path, write):
+    path = tmp_path / "page.html"
+    write(path, "<p>old</p>", None)
+    mtime = age(path)
+    stats = OutputStats()
+
+    write(path, "<p>new</p>", stats)
+
+    assert path.read_text() == "<p>new</p>"
+    assert path.stat().st_mtime_ns != mtime
+    assert (stats.written_files, stats.skipped_files) == (1, 0)
+    assert os.listdir(tmp_path) == ["page.html"]
+
+
+def test_write_bytes_reports_whether_it_wrote(tmp_path):
+    path = tmp_path / "data.json"
+
+    assert write_bytes(path, b"[]") is True
+    assert write_bytes(path, b"[]") is False
+
+
+def test_failed_stream_leaves_the_file_alone(tmp_path):
+    path = tmp_path / "index.html"
+    write_text(path, "<p>old</p>")
+
+    with pytest.raises(RuntimeError):
+        with open_text(path) as f:
+            f.write("<p>partial")
+            raise RuntimeError("render failed")
+
+    assert path.read_text() == "<p>old</p>"
+    assert os.listdir(tmp_path) == ["index.html"]
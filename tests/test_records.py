@@ -0,0 +1,39 @@
+"""Tests for the sanitized record types."""
+
+from playlist_maker.data import sanitize_video_data
+from playlist_maker.records import intern_str
+
+
+def make_video(**fields):
+    video = {
+        "id": "v1",
+        "summary": "Video",
+        "duration": 60,
+        "channel": "Channel",
+        "date": "2024-01-01",
+        "locator": "loc1",
+    }
+    video.update(fields)
+    return video
+
+
+def test_null_file_is_not_stringified():
+    (video,) = sanitize_video_data([make_video(file=None)])
+    assert video.file == ""
+    assert video.to_json()["file"] == ""
+
+
+def test_missing_file_defaults_to_empty():
+    (video,) = sanitize_video_data([make_video()])
+    assert video.file == ""
+
+
+def test_file_path_is_kept():
+    (video,) = sanitize_video_data([make_video(file="videos/a.md")])
+    assert video.file == "videos/a.md"
+
+
+def test_intern_str_only_interns_str():
+    assert intern_str(None) is None
+    assert intern_str(3) == 3
+    assert intern_str("".join(["ab", "c"])) is intern_str("abc")
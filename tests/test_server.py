@@ -0,0 +1,173 @@
+"""Tests for the dashboard server and its live reload event stream."""
+
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from playlist_maker.main import build, find_json_files
+from playlist_maker.manifest import BuildManifest
+from playlist_maker.precompress import ENCODINGS
+from playlist_maker.server import (
+    EVENTS_PATH,
+    IMMUTABLE_CACHE_CONTROL,
+    DashboardServer,
+    EventChannel,
+    accepted_encodings,
+)
+
+
+def test_resume_id_accepts_only_ids_the_channel_sent():
+    channel = EventChannel()
+    channel.publish({"collections": ["a"]})
+
+    assert channel.resume_id(str(channel.last_id)) == channel.last_id
+    assert channel.resume_id(str(channel.first_id)) == channel.first_id
+    assert channel.resume_id(str(channel.first_id - 1)) is None
+    assert channel.resume_id(str(channel.last_id + 1)) is None
+    assert channel.resume_id("not-a-number") is None
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = DashboardServer(("127.0.0.1", 0), tmp_path, BuildManifest(tmp_path, builder="test"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def read_event(server, last_event_id):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    connection.request("GET", EVENTS_PATH, headers={"Last-Event-ID": last_event_id})
+    response = connection.getresponse()
+    lines = []
+    while True:
+        line = response.fp.readline().decode("utf-8").rstrip("\n")
+        if not line:
+            break
+        lines.append(line)
+    connection.close()
+    fields = dict(line.split(": ", 1) for line in lines)
+    return int(fields["id"]), json.loads(fields["data"])
+
+
+def test_reconnect_replays_missed_events(server):
+    seen = server.events.last_id
+    server.events.publish({"reload": False, "collections": ["tasks"]})
+    server.events.publish({"reload": False, "collections": ["notes"]})
+
+    assert read_event(server, str(seen)) == (seen + 1, {"reload": False, "collections": ["tasks"]})
+
+
+@pytest.mark.parametrize("last_event_id", ["0", "garbage"])
+def test_reconnect_with_unknown_id_reloads(server, last_event_id):
+    server.events.publish({"reload": False, "collections": ["tasks"]})
+
+    event_id, data = read_event(server, last_event_id)
+
+    assert event_id == server.events.last_id
+    assert data["reload"] is True
+
+
+def test_reconnect_after_history_was_dropped_reloads(server):
+    seen = server.events.last_id
+    for _ in range(20):
+        server.events.publish({"reload": False, "collections": ["tasks"]})
+
+    assert read_event(server, str(seen))[1]["reload"] is True
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, br;q=0.5", {"gzip", "br"}),
+    ("gzip;q=0, identity", {"identity"}),
+    ("*", {"*"} | set(ENCODINGS)),
+    ("*, gzip;q=0", {"*"} | set(ENCODINGS) - {"gzip"}),
+    ("*;q=0", set()),
+])
+def test_accepted_encodings(header, expected):
+    assert accepted_encodings(header) == expected
+
+
+def test_head_on_the_event_stream_returns_at_once(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    connection.request("HEAD", EVENTS_PATH)
+    response = connection.getresponse()
+
+    assert response.status == 200
+    assert response.read() == b""
+    connection.close()
+
+
+@pytest.fixture
+def built_server(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    folder = tmp_path / "share" / "_tmp"
+    folder.mkdir(parents=True)
+    (folder / "tasks.json").write_text(json.dumps([
+        {"type": "task", "file": "a.md", "line": 1, "status": " ", "summary": "Task"},
+    ]))
+    manifest = BuildManifest(folder, builder="test")
+    build(folder, find_json_files(folder), manifest)
+    server = DashboardServer(("127.0.0.1", 0), folder, manifest)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path, **headers):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_page_etag_comes_from_the_manifest(built_server):
+    response, body = get(built_server, "/index.html")
+
+    assert response.status == 200
+    assert response.getheader("ETag") == f'"{built_server.manifest.files["index.html"]["etag"]}"'
+    assert response.getheader("Cache-Control") == "no-cache"
+    assert body == (built_server.root / "index.html").read_bytes()
+
+
+def test_matching_etag_gets_not_modified(built_server):
+    etag = get(built_server, "/")[0].getheader("ETag")
+
+    response, body = get(built_server, "/", **{"If-None-Match": etag})
+
+    assert response.status == 304
+    assert body == b""
+
+
+@pytest.mark.parametrize("accept", ["gzip", "*;q=0.5, br;q=0"])
+def test_gzip_variant_is_served_when_accepted(built_server, accept):
+    response, body = get(built_server, "/index.html", **{"Accept-Encoding": accept})
+
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert response.getheader("ETag").endswith('-gzip"')
+    assert gzip.decompress(body) == (built_server.root / "index.html").read_bytes()
+
+
+def test_refused_encoding_is_not_served(built_server):
+    response, body = get(built_server, "/index.html", **{"Accept-Encoding": "*;q=0"})
+
+    assert response.getheader("Content-Encoding") is None
+    assert body == (built_server.root / "index.html").read_bytes()
+
+
+def test_hashed_assets_are_cached_for_good(built_server):
+    name = next(p.name for p in (built_server.root / "assets").iterdir() if p.suffix == ".css")
+
+    response, _ = get(built_server, f"/assets/{name}")
+
+    assert response.status == 200
+    assert response.getheader("Cache-Control") == IMMUTABLE_CACHE_CONTROL
@@ -0,0 +1,22 @@
+"""Tests for the item-by-item JSON array parser."""
+
+import io
+import json
+
+import pytest
+
+from playlist_maker.streaming import _iter_array_pure
+
+
+def parse(data, chunk_size=4):
+    return list(_iter_array_pure(io.BytesIO(data), chunk_size))
+
+
+def test_items_are_parsed_across_chunks():
+    assert parse(b'[{"a": 1}, 23, "x"]  \n') == [{"a": 1}, 23, "x"]
+
+
+@pytest.mark.parametrize("data", [b"[1]]", b"[1, 2] garbage", b"[] []"])
+def test_data_after_the_array_is_rejected(data):
+    with pytest.raises(json.JSONDecodeError):
+        parse(data)
@@ -0,0 +1,73 @@
+"""Tests for the unified home page script, run with Node.js when installed."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from playlist_maker.templates.unified_page_js import get_unified_page_javascript
+
+NODE = shutil.which("node")
+
+pytestmark = pytest.mark.skipif(NODE is None, reason="Node.js is not installed")
+
+# Stand-ins for the DOM elements the functions under test touch
+HARNESS = """
+const STATUS_ICONS = {};
+function element(className) {
+    const el = {className, dataset: {}, innerHTML: ''};
+    el.classList = {
+        contains: (name) => el.className.split(/\\s+/).includes(name),
+        toggle(name) {
+            const names = el.className.split(/\\s+/).filter(Boolean);
+            el.className = (names.includes(name)
+                ? names.filter((n) => n !== name)
+                : names.concat(name)).join(' ');
+        },
+    };
+    return el;
+}
+"""
+
+
+def extract_function(source, name):
+    """Return the source of a top-level function of the page script"""
+    start = source.index(f"function {name}(")
+    end = source.index("\n        }\n", start) + len("\n        }")
+    return source[start:end]
+
+
+def run_script(body):
+    source = get_unified_page_javascript()
+    functions = "\n".join(
+        extract_function(source, name) for name in ("fillTableRow", "recordRowToggle")
+    )
+    result = subprocess.run(
+        [NODE, "-e", HARNESS + functions + body],
+        capture_output=True, text=True, check=True, timeout=30,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("button_class, flag", [("toggle-active", 6), ("toggle-focus", 7)])
+def test_toggled_row_keeps_its_button_state_when_redrawn(button_class, flag):
+    state_class = "active" if button_class == "toggle-active" else "focused"
+    redrawn = run_script(f"""
+        const item = ['t1', ' ', 'Task', '', 'a.md', 1, true, true];
+        const state = {{rows: [item], classNames: new Map()}};
+        const row = element('');
+        fillTableRow(row, item, 0, 'task');
+
+        // The click handler: an item that starts {state_class} is switched off
+        const button = element('toggle-toggle {button_class} {state_class}');
+        button.classList.toggle('{state_class}');
+        row.classList.toggle('{state_class}');
+        recordRowToggle(state, row, button);
+
+        fillTableRow(row, item, 0, 'task', state.classNames.get(0));
+        console.log(JSON.stringify({{flag: item[{flag}], html: row.innerHTML}}));
+    """)
+
+    assert redrawn["flag"] is False
+    assert f"{button_class} {state_class}" not in redrawn["html"]